@@ -1,13 +1,18 @@
 """Conventions detection library."""
 
-from .schemas import (
-    ConventionRule,
-    ConventionsOutput,
-    DetectorWarning,
-    EvidenceSnippet,
-    Language,
-    RepoMetadata,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .schemas import (
+        ConventionRule,
+        ConventionsOutput,
+        DetectorWarning,
+        EvidenceSnippet,
+        Language,
+        RepoMetadata,
+    )
 
 __version__ = "0.1.0"
 
@@ -19,3 +24,12 @@ __all__ = [
     "Language",
     "RepoMetadata",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Schemas pull in pydantic, so only import them when first accessed
+    # to keep CLI startup (e.g. --help) fast.
+    if name in __all__:
+        from . import schemas
+        return getattr(schemas, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -8,18 +8,78 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, BinaryIO, Optional
+
+from pydantic import TypeAdapter
 
 from .schemas import ConventionRule, ConventionsOutput
 
-CACHE_VERSION = "1.0.0"
+CACHE_VERSION = "4.0.0"
 CACHE_FILE_NAME = ".cache.json"
 
+# Validates a whole list of cached rules in a single pydantic-core call
+_RULE_LIST_ADAPTER = TypeAdapter(list[ConventionRule])
+
+# Config keys grouped by what they affect. Keys not listed here are
+# treated as part of the "scan" scope so new settings invalidate by default.
+CONFIG_SCOPES: dict[str, tuple[str, ...]] = {
+    "detectors": ("disabled_detectors", "disabled_rules", "plugin_paths"),
+    "output": ("output_formats", "min_score"),
+}
+
+# Scopes whose changes make cached scan results stale
+INVALIDATING_SCOPES = ("scan", "detectors")
+
+# Read buffer used when hashing files incrementally
+HASH_CHUNK_SIZE = 64 * 1024
+
+# Files larger than this are memory-mapped rather than read in chunks
+MMAP_THRESHOLD = 1024 * 1024  # 1MB
+
+# Worker threads used to hash files concurrently
+HASH_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+
+# Digest size in bytes for cache hashes (hex digests are twice as long)
+HASH_DIGEST_SIZE = 32
+
+
+def _new_hasher() -> hashlib.blake2b:
+    """Create the hasher used for change detection.
+
+    BLAKE2b is not used for security here, only to notice changed content,
+    and is considerably faster than SHA-256 without hardware SHA support.
+    """
+    return hashlib.blake2b(digest_size=HASH_DIGEST_SIZE)
+
+
+def _hash_stream(f: BinaryIO) -> str:
+    """Hash an open binary file without loading it into memory."""
+    if hasattr(hashlib, "file_digest"):  # Python 3.11+
+        hex_digest: str = hashlib.file_digest(f, _new_hasher).hexdigest()
+        return hex_digest
+
+    digest = _new_hasher()
+    for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hash_mapped(f: BinaryIO) -> str:
+    """Hash a large file by memory-mapping it, avoiding user-space copies."""
+    digest = _new_hasher()
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        digest.update(mapped)
+    return digest.hexdigest()
+
 
-@dataclass
+@dataclass(slots=True)
 class FileHash:
     """Hash information for a file."""
     path: str
@@ -28,23 +88,24 @@ class FileHash:
     size: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanCache:
     """Cache of previous scan results."""
 
     version: str = CACHE_VERSION
     timestamp: str = ""
-    config_hash: str = ""  # Hash of config to detect config changes
+    config_hashes: dict[str, str] = field(default_factory=dict)  # Config scope -> hash, to detect config changes
     file_hashes: dict[str, FileHash] = field(default_factory=dict)
-    rules_by_file: dict[str, list[dict[str, Any]]] = field(default_factory=dict)  # file -> rules that depend on it
-    global_rules: list[dict[str, Any]] = field(default_factory=list)  # Rules not tied to specific files
+    rules: dict[str, dict[str, Any]] = field(default_factory=dict)  # rule ID -> serialized rule
+    rules_by_file: dict[str, list[str]] = field(default_factory=dict)  # file -> IDs of rules that depend on it
+    global_rules: list[str] = field(default_factory=list)  # IDs of rules not tied to specific files
 
     def to_dict(self) -> dict[str, Any]:
         """Convert cache to dictionary for serialization."""
         return {
             "version": self.version,
             "timestamp": self.timestamp,
-            "config_hash": self.config_hash,
+            "config_hashes": self.config_hashes,
             "file_hashes": {
                 path: {
                     "path": fh.path,
@@ -54,6 +115,7 @@ class ScanCache:
                 }
                 for path, fh in self.file_hashes.items()
             },
+            "rules": self.rules,
             "rules_by_file": self.rules_by_file,
             "global_rules": self.global_rules,
         }
@@ -61,20 +123,17 @@ class ScanCache:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ScanCache":
         """Create cache from dictionary."""
-        file_hashes = {}
-        for path, fh_data in data.get("file_hashes", {}).items():
-            file_hashes[path] = FileHash(
-                path=fh_data["path"],
-                content_hash=fh_data["content_hash"],
-                mtime=fh_data["mtime"],
-                size=fh_data["size"],
-            )
+        file_hashes = {
+            path: FileHash(**fh_data)
+            for path, fh_data in data.get("file_hashes", {}).items()
+        }
 
         return cls(
             version=data.get("version", CACHE_VERSION),
             timestamp=data.get("timestamp", ""),
-            config_hash=data.get("config_hash", ""),
+            config_hashes=data.get("config_hashes", {}),
             file_hashes=file_hashes,
+            rules=data.get("rules", {}),
             rules_by_file=data.get("rules_by_file", {}),
             global_rules=data.get("global_rules", []),
         )
@@ -90,6 +149,8 @@ class CacheManager:
             repo_root: Root directory of the repository
         """
         self.repo_root = Path(repo_root).resolve()
+        # Hot loops work on plain strings to avoid PurePath overhead
+        self._root_prefix = str(self.repo_root) + os.sep
         self.cache_dir = self.repo_root / ".conventions"
         self.cache_path = self.cache_dir / CACHE_FILE_NAME
         self._cache: Optional[ScanCache] = None
@@ -130,8 +191,17 @@ class CacheManager:
         """
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-        with open(self.cache_path, "w", encoding="utf-8") as f:
-            json.dump(cache.to_dict(), f, indent=2)
+        # Write to a sibling file and swap it in so an interrupted save never
+        # leaves a torn cache behind. No fsync: the cache can be rebuilt.
+        tmp_path = self.cache_path.with_suffix(".json.tmp")
+        try:
+            # The cache is machine-read only, so skip indentation and whitespace
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(cache.to_dict(), f, separators=(",", ":"))
+            os.replace(tmp_path, self.cache_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         self._cache = cache
 
@@ -141,21 +211,40 @@ class CacheManager:
             self.cache_path.unlink()
         self._cache = None
 
-    def compute_file_hash(self, file_path: Path) -> Optional[FileHash]:
+    def _relative_path(self, file_path: Path) -> Optional[str]:
+        """Get a file's path relative to the repo root, or None if outside it."""
+        path_str = str(file_path)
+        if not path_str.startswith(self._root_prefix):
+            return None
+        return path_str[len(self._root_prefix):]
+
+    def compute_file_hash(
+        self,
+        file_path: Path,
+        rel_path: Optional[str] = None,
+        stat: Optional[os.stat_result] = None,
+    ) -> Optional[FileHash]:
         """Compute hash for a file.
 
         Args:
             file_path: Path to the file
+            rel_path: Precomputed path relative to the repo root
+            stat: Stat result already obtained for the file, if any
 
         Returns:
             FileHash or None if file cannot be read
         """
         try:
-            stat = file_path.stat()
-            with open(file_path, "rb") as f:
-                content_hash = hashlib.sha256(f.read()).hexdigest()
+            if stat is None:
+                stat = os.stat(file_path)
+            with open(file_path, "rb", buffering=0) as f:
+                if stat.st_size > MMAP_THRESHOLD:
+                    content_hash = _hash_mapped(f)
+                else:
+                    content_hash = _hash_stream(f)
 
-            rel_path = str(file_path.relative_to(self.repo_root))
+            if rel_path is None:
+                rel_path = str(file_path.relative_to(self.repo_root))
             return FileHash(
                 path=rel_path,
                 content_hash=content_hash,
@@ -165,61 +254,145 @@ class CacheManager:
         except (OSError, IOError):
             return None
 
-    def compute_config_hash(self, config_dict: dict[str, Any]) -> str:
+    def compute_config_hash(
+        self,
+        config_dict: dict[str, Any],
+        scope: Optional[str] = None,
+    ) -> str:
         """Compute hash for configuration.
 
         Args:
             config_dict: Configuration dictionary
+            scope: Only hash the keys in this config scope (see CONFIG_SCOPES)
 
         Returns:
             Hash string
         """
-        config_str = json.dumps(config_dict, sort_keys=True)
-        return hashlib.sha256(config_str.encode()).hexdigest()
+        if scope is not None:
+            if scope == "scan":
+                scoped_keys = {k for keys in CONFIG_SCOPES.values() for k in keys}
+                config_dict = {k: v for k, v in config_dict.items() if k not in scoped_keys}
+            else:
+                config_dict = {k: v for k, v in config_dict.items() if k in CONFIG_SCOPES[scope]}
+
+        # Compact, key-sorted JSON is a canonical encoding for config values
+        config_bytes = json.dumps(
+            config_dict, sort_keys=True, separators=(",", ":")
+        ).encode()
+        digest = _new_hasher()
+        digest.update(config_bytes)
+        return digest.hexdigest()
+
+    def compute_config_hashes(self, config_dict: dict[str, Any]) -> dict[str, str]:
+        """Compute a hash for each config scope.
+
+        Args:
+            config_dict: Configuration dictionary
+
+        Returns:
+            Mapping of scope name to hash string
+        """
+        return {
+            scope: self.compute_config_hash(config_dict, scope)
+            for scope in ("scan", *CONFIG_SCOPES)
+        }
+
+    def _hash_files(
+        self,
+        files: list[Path],
+        rel_paths: Optional[list[Optional[str]]] = None,
+        stats: Optional[list[Optional[os.stat_result]]] = None,
+    ) -> list[Optional[FileHash]]:
+        """Hash files concurrently, returning results in input order.
+
+        hashlib releases the GIL while digesting, so threads overlap
+        file reads with hashing.
+        """
+        if rel_paths is None:
+            rel_paths = [self._relative_path(file_path) for file_path in files]
+        if stats is None:
+            stats = [None] * len(files)
+
+        if len(files) <= 1:
+            return [
+                self.compute_file_hash(f, rel, st)
+                for f, rel, st in zip(files, rel_paths, stats)
+            ]
+
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+            return list(executor.map(self.compute_file_hash, files, rel_paths, stats))
 
     def get_changed_files(
         self,
         all_files: list[Path],
-        config_hash: str,
+        config_hashes: dict[str, str],
     ) -> tuple[list[Path], list[str]]:
         """Find files that have changed since last scan.
 
         Args:
             all_files: List of all files to potentially scan
-            config_hash: Hash of current configuration
+            config_hashes: Per-scope hashes of current configuration
 
         Returns:
             Tuple of (changed_files, unchanged_file_paths)
         """
         cache = self.load_cache()
 
-        # If no cache or config changed, all files are "changed"
-        if cache is None or cache.config_hash != config_hash:
+        # If no cache or scan-relevant config changed, all files are "changed"
+        if cache is None or any(
+            cache.config_hashes.get(scope) != config_hashes.get(scope)
+            for scope in INVALIDATING_SCOPES
+        ):
             return all_files, []
 
         changed: list[Path] = []
         unchanged: list[str] = []
+        # Files whose stat differs from the cache and need their content hashed
+        suspects: list[tuple[Path, str, os.stat_result, FileHash]] = []
 
+        rel_to_path: dict[str, Path] = {}
         for file_path in all_files:
-            try:
-                rel_path = str(file_path.relative_to(self.repo_root))
-            except ValueError:
+            rel_path = self._relative_path(file_path)
+            if rel_path is None:
+                changed.append(file_path)
+            else:
+                rel_to_path[rel_path] = file_path
+
+        # Classify new files with one set difference against the cached keys;
+        # iterate in input order so results stay deterministic
+        new_rels = rel_to_path.keys() - cache.file_hashes.keys()
+
+        for rel_path, file_path in rel_to_path.items():
+            if rel_path in new_rels:
                 changed.append(file_path)
                 continue
 
-            cached_hash = cache.file_hashes.get(rel_path)
+            cached_hash = cache.file_hashes[rel_path]
 
-            if cached_hash is None:
-                # New file
+            try:
+                stat = os.stat(file_path)
+            except OSError:
                 changed.append(file_path)
+                continue
+
+            if stat.st_size == cached_hash.size and stat.st_mtime == cached_hash.mtime:
+                # Same size and mtime: trust the cache without reading the file
+                unchanged.append(rel_path)
             else:
-                current_hash = self.compute_file_hash(file_path)
-                if current_hash is None:
-                    changed.append(file_path)
-                elif current_hash.content_hash != cached_hash.content_hash:
-                    changed.append(file_path)
-                else:
-                    unchanged.append(rel_path)
+                # Stat differs; the content hash is authoritative (e.g. touched files)
+                suspects.append((file_path, rel_path, stat, cached_hash))
+
+        # Reuse the prefilter stat so the hashing path doesn't stat again
+        current_hashes = self._hash_files(
+            [file_path for file_path, _, _, _ in suspects],
+            [rel_path for _, rel_path, _, _ in suspects],
+            [stat for _, _, stat, _ in suspects],
+        )
+        for (file_path, rel_path, _, cached_hash), current_hash in zip(suspects, current_hashes):
+            if current_hash is None or current_hash.content_hash != cached_hash.content_hash:
+                changed.append(file_path)
+            else:
+                unchanged.append(rel_path)
 
         return changed, unchanged
 
@@ -239,65 +412,58 @@ class CacheManager:
         if cache is None:
             return []
 
-        rules = []
-        seen_rules: set[str] = set()
-
+        # Collect unique rule data first, then validate each rule once
+        rule_data: dict[str, dict[str, Any]] = {}
         for file_path in unchanged_files:
-            cached_rules = cache.rules_by_file.get(file_path, [])
-            for rule_data in cached_rules:
-                rule_id = rule_data.get("id", "")
-                if rule_id not in seen_rules:
-                    rules.append(ConventionRule.model_validate(rule_data))
-                    seen_rules.add(rule_id)
+            for rule_id in cache.rules_by_file.get(file_path, []):
+                if rule_id not in rule_data:
+                    rule_data[rule_id] = cache.rules[rule_id]
 
-        return rules
+        return _RULE_LIST_ADAPTER.validate_python(list(rule_data.values()))
 
     def update_cache(
         self,
         output: ConventionsOutput,
         all_files: list[Path],
-        config_hash: str,
+        config_hashes: dict[str, str],
     ) -> None:
         """Update cache with new scan results.
 
         Args:
             output: Scan output
             all_files: All files that were considered
-            config_hash: Hash of configuration used
+            config_hashes: Per-scope hashes of configuration used
         """
         # Build file hashes
         file_hashes: dict[str, FileHash] = {}
-        for file_path in all_files:
-            file_hash = self.compute_file_hash(file_path)
+        for file_hash in self._hash_files(all_files):
             if file_hash:
                 file_hashes[file_hash.path] = file_hash
 
-        # Organize rules by file
-        rules_by_file: dict[str, list[dict[str, Any]]] = {}
-        global_rules: list[dict[str, Any]] = []
+        # Store each rule once and reference it by ID from the files it depends on
+        rules: dict[str, dict[str, Any]] = {}
+        rules_by_file: defaultdict[str, list[str]] = defaultdict(list)
+        global_rules: list[str] = []
 
         for rule in output.rules:
-            rule_dict = rule.model_dump()
-
-            if rule.evidence:
-                # Associate rule with files in evidence
-                seen_files: set[str] = set()
-                for ev in rule.evidence:
-                    if ev.file_path not in seen_files:
-                        if ev.file_path not in rules_by_file:
-                            rules_by_file[ev.file_path] = []
-                        rules_by_file[ev.file_path].append(rule_dict)
-                        seen_files.add(ev.file_path)
-            else:
+            rules[rule.id] = rule.model_dump()
+
+            if not rule.evidence:
                 # Rule with no file evidence is global
-                global_rules.append(rule_dict)
+                global_rules.append(rule.id)
+                continue
+
+            # Associate rule with each distinct file in its evidence
+            for file_path in dict.fromkeys(ev.file_path for ev in rule.evidence):
+                rules_by_file[file_path].append(rule.id)
 
         cache = ScanCache(
             version=CACHE_VERSION,
             timestamp=datetime.now().isoformat(),
-            config_hash=config_hash,
+            config_hashes=config_hashes,
             file_hashes=file_hashes,
-            rules_by_file=rules_by_file,
+            rules=rules,
+            rules_by_file=dict(rules_by_file),
             global_rules=global_rules,
         )
 
@@ -319,15 +485,9 @@ class CacheManager:
         Returns:
             Merged list of rules
         """
-        # Build set of new rule IDs
-        new_rule_ids = {rule.id for rule in new_rules}
-
-        # Start with new rules
-        merged = list(new_rules)
-
-        # Add cached rules that don't conflict
+        # Start with new rules, then add cached rules that don't conflict
+        merged = {rule.id: rule for rule in new_rules}
         for rule in cached_rules:
-            if rule.id not in new_rule_ids:
-                merged.append(rule)
+            merged.setdefault(rule.id, rule)
 
-        return merged
+        return list(merged.values())
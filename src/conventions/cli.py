@@ -6,20 +6,28 @@
 
 from __future__ import annotations
 
+from functools import cache
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
 
-from .config import ConventionsConfig, load_config
+if TYPE_CHECKING:
+    from rich.console import Console
 
 app = typer.Typer(
     name="conventions",
     help="Discover coding conventions from source code.",
     no_args_is_help=True,
 )
-console = Console()
+
+
+@cache
+def get_console() -> Console:
+    """Get the shared console, importing rich on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 @app.command()
@@ -93,6 +101,7 @@ def discover(
     Scans source code and writes detected conventions to
     .conventions/conventions.raw.json and .conventions/conventions.md
     """
+    from .config import ConventionsConfig, load_config
     from .detectors.orchestrator import run_detectors, write_conventions_output
     from .ratings import rate_convention
     from .report import (
@@ -102,6 +111,8 @@ def discover(
         write_review_report,
     )
 
+    console = get_console()
+
     # Load configuration
     cfg = ConventionsConfig()
     if not ignore_config:
@@ -284,11 +295,10 @@ def show(
     """
     Show previously detected conventions from .conventions/conventions.raw.json
     """
-    import json
-
     from .report import print_detailed_rules, print_summary
     from .schemas import ConventionsOutput
 
+    console = get_console()
     conventions_file = repo / ".conventions" / "conventions.raw.json"
 
     if not conventions_file.exists():
@@ -296,9 +306,8 @@ def show(
         raise typer.Exit(1)
 
     try:
-        with open(conventions_file) as f:
-            data = json.load(f)
-        output = ConventionsOutput.model_validate(data)
+        # Parse and validate in a single pass in pydantic-core
+        output = ConventionsOutput.model_validate_json(conventions_file.read_bytes())
     except Exception as e:
         console.print(f"[red]Error reading conventions file: {e}[/red]")
         raise typer.Exit(1)
@@ -3,73 +3,89 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, field
+from dataclasses import MISSING, Field, dataclass, field, fields, replace
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
-@dataclass
+
+# Defaults compared against when serializing and merging; never mutated
+_DEFAULT_MAX_FILES = 2000
+_DEFAULT_OUTPUT_FORMATS = ["json", "markdown", "review"]
+
+
+def _union(base: list[str], other: list[str]) -> list[str]:
+    """Combine two lists without duplicates, keeping first-seen order."""
+    if not other:
+        return list(base)
+    if not base:
+        return list(other)
+    return list(dict.fromkeys([*base, *other]))
+
+
+@dataclass(slots=True, frozen=True)
 class ConventionsConfig:
-    """Configuration for conventions detection."""
+    """Configuration for conventions detection.
+
+    Instances are immutable; use merge() or dataclasses.replace() to derive
+    a modified config.
+    """
 
     languages: list[str] | None = None
-    max_files: int = 2000
+    max_files: int = _DEFAULT_MAX_FILES
     disabled_detectors: list[str] = field(default_factory=list)
     disabled_rules: list[str] = field(default_factory=list)
-    output_formats: list[str] = field(default_factory=lambda: ["json", "markdown", "review"])
+    output_formats: list[str] = field(default_factory=lambda: list(_DEFAULT_OUTPUT_FORMATS))
     exclude_patterns: list[str] = field(default_factory=list)
     plugin_paths: list[str] = field(default_factory=list)
     min_score: float | None = None  # Exit non-zero if avg score below this
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ConventionsConfig":
-        """Create config from dictionary."""
-        return cls(
-            languages=data.get("languages"),
-            max_files=data.get("max_files", 2000),
-            disabled_detectors=data.get("disabled_detectors", []),
-            disabled_rules=data.get("disabled_rules", []),
-            output_formats=data.get("output_formats", ["json", "markdown", "review"]),
-            exclude_patterns=data.get("exclude_patterns", []),
-            plugin_paths=data.get("plugin_paths", []),
-            min_score=data.get("min_score"),
-        )
+        """Create config from dictionary; unknown keys are ignored."""
+        return cls(**{name: data[name] for name, _ in _FIELD_DEFAULTS if name in data})
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert config to dictionary."""
+        """Convert config to dictionary, omitting fields left at their default."""
         result: dict[str, Any] = {}
-        if self.languages is not None:
-            result["languages"] = self.languages
-        if self.max_files != 2000:
-            result["max_files"] = self.max_files
-        if self.disabled_detectors:
-            result["disabled_detectors"] = self.disabled_detectors
-        if self.disabled_rules:
-            result["disabled_rules"] = self.disabled_rules
-        if self.output_formats != ["json", "markdown", "review"]:
-            result["output_formats"] = self.output_formats
-        if self.exclude_patterns:
-            result["exclude_patterns"] = self.exclude_patterns
-        if self.plugin_paths:
-            result["plugin_paths"] = self.plugin_paths
-        if self.min_score is not None:
-            result["min_score"] = self.min_score
+        for name, default in _FIELD_DEFAULTS:
+            value = getattr(self, name)
+            if value != default and value is not None:
+                result[name] = value
         return result
 
     def merge(self, other: "ConventionsConfig") -> "ConventionsConfig":
         """Merge two configs, with 'other' taking precedence."""
         return ConventionsConfig(
             languages=other.languages if other.languages is not None else self.languages,
-            max_files=other.max_files if other.max_files != 2000 else self.max_files,
-            disabled_detectors=list(set(self.disabled_detectors) | set(other.disabled_detectors)),
-            disabled_rules=list(set(self.disabled_rules) | set(other.disabled_rules)),
-            output_formats=other.output_formats if other.output_formats != ["json", "markdown", "review"] else self.output_formats,
-            exclude_patterns=list(set(self.exclude_patterns) | set(other.exclude_patterns)),
-            plugin_paths=list(set(self.plugin_paths) | set(other.plugin_paths)),
+            max_files=other.max_files if other.max_files != _DEFAULT_MAX_FILES else self.max_files,
+            disabled_detectors=_union(self.disabled_detectors, other.disabled_detectors),
+            disabled_rules=_union(self.disabled_rules, other.disabled_rules),
+            output_formats=other.output_formats if other.output_formats != _DEFAULT_OUTPUT_FORMATS else self.output_formats,
+            exclude_patterns=_union(self.exclude_patterns, other.exclude_patterns),
+            plugin_paths=_union(self.plugin_paths, other.plugin_paths),
             min_score=other.min_score if other.min_score is not None else self.min_score,
         )
 
 
+def _field_default(f: Field[Any]) -> Any:
+    """Get a dataclass field's default value, calling its factory if needed."""
+    if f.default_factory is not MISSING:
+        return f.default_factory()
+    return f.default
+
+
+# (name, default) for every config field, built once; the defaults are only
+# compared against, never handed out
+_FIELD_DEFAULTS: tuple[tuple[str, Any], ...] = tuple(
+    (f.name, _field_default(f)) for f in fields(ConventionsConfig)
+)
+
+
 CONFIG_FILE_NAMES = [
     ".conventionsrc.json",
     ".conventionsrc",
@@ -77,6 +93,21 @@ CONFIG_FILE_NAMES = [
 ]
 
 
+# Parsed config files keyed by resolved path, stored with the (mtime_ns, size)
+# they were parsed at so edits to the file invalidate the entry
+_CONFIG_CACHE: dict[Path, tuple[int, int, ConventionsConfig]] = {}
+
+
+def _copy_config(config: ConventionsConfig) -> ConventionsConfig:
+    """Copy a config's list fields so callers can't mutate a cached instance."""
+    lists: dict[str, Any] = {
+        f.name: list(value)
+        for f in fields(config)
+        if isinstance(value := getattr(config, f.name), list)
+    }
+    return replace(config, **lists)
+
+
 def find_config_file(repo_root: Path) -> Path | None:
     """Find configuration file in repository root."""
     for name in CONFIG_FILE_NAMES:
@@ -109,9 +140,17 @@ def load_config(repo_root: Path, config_path: Path | None = None) -> Conventions
         return ConventionsConfig()
 
     try:
-        with open(target_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return ConventionsConfig.from_dict(data)
+        stat = target_path.stat()
+        cache_key = target_path.resolve()
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return _copy_config(cached[2])
+
+        raw = target_path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        config = ConventionsConfig.from_dict(data)
+        _CONFIG_CACHE[cache_key] = (stat.st_mtime_ns, stat.st_size, config)
+        return _copy_config(config)
     except json.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in config file {target_path}: {e}")
     except Exception as e:
@@ -120,6 +159,10 @@ def load_config(repo_root: Path, config_path: Path | None = None) -> Conventions
 
 def save_config(config: ConventionsConfig, path: Path) -> None:
     """Save configuration to file."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(config.to_dict(), option=orjson.OPT_INDENT_2) + b"\n")
+        return
+
     with open(path, "w", encoding="utf-8") as f:
         json.dump(config.to_dict(), f, indent=2)
         f.write("\n")
@@ -1,9 +1,28 @@
 """Convention detectors package."""
 
-from .base import BaseDetector, DetectorContext, DetectorResult, PythonDetector
-from .go.base import GoDetector
-from .node.base import NodeDetector
-from .registry import DetectorRegistry
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import BaseDetector, DetectorContext, DetectorResult, PythonDetector
+    from .go.base import GoDetector
+    from .node.base import NodeDetector
+    from .registry import DetectorRegistry
+
+# Public names and the submodules that define them. Importing go.base or
+# node.base pulls in every detector of that language, so these are resolved
+# on first access (PEP 562) instead of when the package is imported.
+_LAZY_IMPORTS = {
+    "BaseDetector": ".base",
+    "DetectorContext": ".base",
+    "DetectorResult": ".base",
+    "PythonDetector": ".base",
+    "GoDetector": ".go.base",
+    "NodeDetector": ".node.base",
+    "DetectorRegistry": ".registry",
+}
 
 __all__ = [
     "BaseDetector",
@@ -14,3 +33,10 @@ __all__ = [
     "NodeDetector",
     "DetectorRegistry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
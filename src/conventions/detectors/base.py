@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
+import json
+import os
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TypeVar
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
 
 from ..schemas import ConventionRule, EvidenceSnippet
 
+# Upper bound on file contents kept in memory by DetectorContext.read_file
+FILE_CACHE_MAX_CHARS = 32 * 1024 * 1024
+
+T = TypeVar("T")
+
 
 @dataclass
 class DetectorContext:
@@ -26,18 +40,146 @@ class DetectorContext:
     # Generic cache for language indexes (Rust, Go, Node, etc.)
     cache: dict[str, Any] = field(default_factory=dict, repr=False)
 
+    # File contents shared across detectors, keyed by (path, mtime_ns), LRU order
+    _file_contents: OrderedDict[tuple[str, int], str] = field(
+        default_factory=OrderedDict, repr=False
+    )
+    _file_contents_chars: int = field(default=0, repr=False)
+
+    # Detectors may run concurrently: _lock guards the file cache and the
+    # per-key locks that make each shared index build exactly once
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    _build_locks: dict[str, threading.Lock] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def _build_lock(self, key: str) -> threading.Lock:
+        """Get the lock that serializes builds of one cached value."""
+        with self._lock:
+            return self._build_locks.setdefault(key, threading.Lock())
+
+    def get_cached(self, key: str, build: Callable[[], T]) -> T:
+        """Get a value from cache, building it on first use.
+
+        Concurrent callers for the same key wait for a single build instead
+        of each building their own copy.
+        """
+        if key not in self.cache:
+            with self._build_lock(key):
+                if key not in self.cache:
+                    self.cache[key] = build()
+        result: T = self.cache[key]
+        return result
+
     def get_python_index(self) -> Any:
         """Get or create Python index (lazy loading)."""
         if self._python_index is None:
-            from .python.index import PythonIndex
-            self._python_index = PythonIndex(
-                self.repo_root,
-                max_files=self.max_files,
-                exclude_patterns=self.exclude_patterns,
-            )
-            self._python_index.build()
+            with self._build_lock("python_index"):
+                if self._python_index is None:
+                    from .python.index import PythonIndex
+                    index = PythonIndex(
+                        self.repo_root,
+                        max_files=self.max_files,
+                        exclude_patterns=self.exclude_patterns,
+                    )
+                    index.build()
+                    self._python_index = index
         return self._python_index
 
+    def read_file(self, path: Path) -> Optional[str]:
+        """Read a file like read_file_safe, sharing contents across detectors.
+
+        Contents are cached per (path, mtime) so edits are picked up, and the
+        least recently used entries are evicted past FILE_CACHE_MAX_CHARS.
+        """
+        from ..fs import read_file_safe
+
+        try:
+            key = (str(path), os.stat(path).st_mtime_ns)
+        except OSError:
+            return None
+
+        with self._lock:
+            content = self._file_contents.get(key)
+            if content is not None:
+                self._file_contents.move_to_end(key)
+                return content
+
+        content = read_file_safe(path)
+        if content is None:
+            return None
+
+        with self._lock:
+            if key not in self._file_contents:
+                self._file_contents[key] = content
+                self._file_contents_chars += len(content)
+            while (
+                self._file_contents_chars > FILE_CACHE_MAX_CHARS
+                and len(self._file_contents) > 1
+            ):
+                _, evicted = self._file_contents.popitem(last=False)
+                self._file_contents_chars -= len(evicted)
+
+        return content
+
+    def get_root_listing(self) -> dict[str, os.DirEntry[str]]:
+        """Get the repo root's directory entries by name (lazy loading).
+
+        One scandir of the root is shared by all detectors; DirEntry caches
+        its file type, so existence checks need no further syscalls.
+        """
+        def build() -> dict[str, os.DirEntry[str]]:
+            try:
+                with os.scandir(self.repo_root) as entries:
+                    return {entry.name: entry for entry in entries}
+            except OSError:
+                return {}
+
+        return self.get_cached("root_listing", build)
+
+    def root_has_file(self, name: str) -> bool:
+        """Check whether a file exists directly in the repo root."""
+        entry = self.get_root_listing().get(name)
+        return entry is not None and entry.is_file()
+
+    def root_has_dir(self, name: str) -> bool:
+        """Check whether a directory exists directly in the repo root."""
+        entry = self.get_root_listing().get(name)
+        return entry is not None and entry.is_dir()
+
+    def get_package_json(self) -> Optional[dict[str, Any]]:
+        """Get the repo root's parsed package.json (lazy loading).
+
+        Parsed once and shared by all detectors, so callers must not modify
+        it. None if the file is missing, unreadable or not a JSON object.
+        """
+        def build() -> Optional[dict[str, Any]]:
+            if not self.root_has_file("package.json"):
+                return None
+            content = self.read_file(self.repo_root / "package.json")
+            if not content:
+                return None
+            try:
+                data = orjson.loads(content) if orjson is not None else json.loads(content)
+            except ValueError:
+                return None
+            return data if isinstance(data, dict) else None
+
+        return self.get_cached("package_json", build)
+
+    def get_file_index(self) -> dict[str, list[Path]]:
+        """Get all repository files grouped by extension (lazy loading).
+
+        Built from a single walk and shared by all detectors, so they don't
+        need their own recursive globs.
+        """
+        from ..fs import index_files
+
+        return self.get_cached(
+            "file_index",
+            lambda: index_files(self.repo_root, exclude_patterns=self.exclude_patterns),
+        )
+
 
 @dataclass
 class DetectorResult:
@@ -92,25 +234,36 @@ class BaseDetector(ABC):
         Returns:
             EvidenceSnippet or None if file cannot be read
         """
-        from ..fs import get_relative_path, read_file_safe
+        from ..fs import get_relative_path
 
-        content = read_file_safe(file_path)
+        content = ctx.read_file(file_path)
         if content is None:
             return None
 
-        lines = content.splitlines()
-        total_lines = len(lines)
-
-        if line < 1 or line > total_lines:
+        if line < 1:
             return None
 
-        # Calculate line range (1-indexed)
+        # Calculate line range (1-indexed). Only the lines up to the end of the
+        # window are scanned, rather than splitting the whole file into lines.
         line_start = max(1, line - radius)
-        line_end = min(total_lines, line + radius)
 
-        # Extract excerpt (convert to 0-indexed for slicing)
-        excerpt_lines = lines[line_start - 1 : line_end]
-        excerpt = "\n".join(excerpt_lines)
+        start_offset = 0
+        for _ in range(line_start - 1):
+            start_offset = content.find("\n", start_offset) + 1
+            if start_offset == 0:
+                return None
+
+        end_offset = start_offset
+        line_end = line_start - 1
+        while line_end < line + radius and end_offset < len(content):
+            newline = content.find("\n", end_offset)
+            line_end += 1
+            end_offset = len(content) if newline == -1 else newline + 1
+
+        if line > line_end:
+            return None
+
+        excerpt = "\n".join(content[start_offset:end_offset].splitlines())
 
         return EvidenceSnippet(
             file_path=get_relative_path(file_path, ctx.repo_root),
@@ -1,17 +1,40 @@
 """Generic (language-agnostic) convention detectors package."""
 
-from .api_docs import APIDocumentationDetector
-from .ci_cd import CICDDetector
-from .code_ownership import CodeOwnershipDetector
-from .config_patterns import ConfigPatternsDetector
-from .containerization import ContainerizationDetector
-from .dependency_updates import DependencyUpdatesDetector
-from .editor_config import EditorConfigDetector
-from .environment_setup import EnvironmentSetupDetector
-from .generated_code import GeneratedCodeDetector
-from .git_conventions import GitConventionsDetector
-from .repo_layout import GenericRepoLayoutDetector
-from .task_runners import TaskRunnerDetector
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api_docs import APIDocumentationDetector
+    from .ci_cd import CICDDetector
+    from .code_ownership import CodeOwnershipDetector
+    from .config_patterns import ConfigPatternsDetector
+    from .containerization import ContainerizationDetector
+    from .dependency_updates import DependencyUpdatesDetector
+    from .editor_config import EditorConfigDetector
+    from .environment_setup import EnvironmentSetupDetector
+    from .generated_code import GeneratedCodeDetector
+    from .git_conventions import GitConventionsDetector
+    from .repo_layout import GenericRepoLayoutDetector
+    from .task_runners import TaskRunnerDetector
+
+# Detector modules are imported on first access (PEP 562) so that loading
+# one detector does not import the rest of the package.
+_LAZY_IMPORTS = {
+    "APIDocumentationDetector": ".api_docs",
+    "CICDDetector": ".ci_cd",
+    "CodeOwnershipDetector": ".code_ownership",
+    "ConfigPatternsDetector": ".config_patterns",
+    "ContainerizationDetector": ".containerization",
+    "DependencyUpdatesDetector": ".dependency_updates",
+    "EditorConfigDetector": ".editor_config",
+    "EnvironmentSetupDetector": ".environment_setup",
+    "GeneratedCodeDetector": ".generated_code",
+    "GitConventionsDetector": ".git_conventions",
+    "GenericRepoLayoutDetector": ".repo_layout",
+    "TaskRunnerDetector": ".task_runners",
+}
 
 __all__ = [
     "GenericRepoLayoutDetector",
@@ -27,3 +50,10 @@ __all__ = [
     "GeneratedCodeDetector",
     "TaskRunnerDetector",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -2,10 +2,50 @@
 
 from __future__ import annotations
 
-from ...fs import read_file_safe
+import re
+from typing import Optional
+
+from ...fs import find_files, list_dir_files
 from ..base import BaseDetector, DetectorContext, DetectorResult
 from ..registry import DetectorRegistry
 
+_OPENAPI_VERSION_RE = re.compile(r'openapi["\']?\s*:\s*["\']?(\d+\.\d+)')
+
+# Spec file names in order of preference
+_OPENAPI_FILES = (
+    "openapi.yaml", "openapi.yml", "openapi.json",
+    "swagger.yaml", "swagger.yml", "swagger.json",
+    "api.yaml", "api.yml", "api.json",
+)
+_ASYNCAPI_FILES = ("asyncapi.yaml", "asyncapi.yml", "asyncapi.json")
+_GRAPHQL_FILES = ("schema.graphql", "schema.gql")
+
+_OPENAPI_FILE_SET = frozenset(_OPENAPI_FILES)
+_ASYNCAPI_FILE_SET = frozenset(_ASYNCAPI_FILES)
+_GRAPHQL_FILE_SET = frozenset(_GRAPHQL_FILES)
+
+# Directories searched for spec files, besides the repo root
+_SPEC_DIRS = ("docs", "api", "spec", "specs")
+
+
+def _first_match(
+    file_names: frozenset[str],
+    candidates: tuple[str, ...],
+    candidate_set: frozenset[str],
+) -> Optional[str]:
+    """Return the most preferred candidate present in file_names."""
+    hits = file_names & candidate_set
+    if not hits:
+        return None
+    return next(name for name in candidates if name in hits)
+
+
+def _is_postman_collection(name: str) -> bool:
+    """Check whether a file name looks like a Postman collection."""
+    return (name.startswith("postman") and name.endswith(".json")) or name.endswith(
+        ".postman_collection.json"
+    )
+
 
 @DetectorRegistry.register
 class APIDocumentationDetector(BaseDetector):
@@ -20,84 +60,61 @@ class APIDocumentationDetector(BaseDetector):
 
         docs_found: dict[str, dict] = {}
 
-        # OpenAPI/Swagger files
-        openapi_patterns = [
-            "openapi.yaml", "openapi.yml", "openapi.json",
-            "swagger.yaml", "swagger.yml", "swagger.json",
-            "api.yaml", "api.yml", "api.json",
-        ]
-
-        # Check root and common directories
-        search_dirs = [
-            ctx.repo_root,
-            ctx.repo_root / "docs",
-            ctx.repo_root / "api",
-            ctx.repo_root / "spec",
-            ctx.repo_root / "specs",
-        ]
-
-        for search_dir in search_dirs:
-            if not search_dir.is_dir():
-                continue
-
-            for pattern in openapi_patterns:
-                spec_file = search_dir / pattern
-                if spec_file.is_file():
-                    content = read_file_safe(spec_file)
-                    version = None
-                    if content:
-                        if "openapi:" in content or '"openapi":' in content:
-                            # Try to extract version
-                            import re
-                            match = re.search(r'openapi["\']?\s*:\s*["\']?(\d+\.\d+)', content)
-                            if match:
-                                version = match.group(1)
-                            docs_found["openapi"] = {
-                                "name": "OpenAPI",
-                                "file": str(spec_file.relative_to(ctx.repo_root)),
-                                "version": version or "3.x",
-                            }
-                        elif "swagger:" in content or '"swagger":' in content:
-                            docs_found["swagger"] = {
-                                "name": "Swagger",
-                                "file": str(spec_file.relative_to(ctx.repo_root)),
-                                "version": "2.0",
-                            }
-                    break
-            if docs_found:
-                break
-
-        # AsyncAPI for event-driven APIs
-        asyncapi_patterns = ["asyncapi.yaml", "asyncapi.yml", "asyncapi.json"]
-        for search_dir in search_dirs:
-            if not search_dir.is_dir():
+        # List the root and each existing spec directory once, then
+        # intersect the file names with each spec type's candidates
+        root_files = frozenset(
+            name for name, entry in ctx.get_root_listing().items() if entry.is_file()
+        )
+        dir_files = [(ctx.repo_root, root_files)]
+        dir_files.extend(
+            (ctx.repo_root / name, list_dir_files(ctx.repo_root / name))
+            for name in _SPEC_DIRS
+            if ctx.root_has_dir(name)
+        )
+
+        # OpenAPI/Swagger: the first directory with a candidate wins
+        for search_dir, file_names in dir_files:
+            pattern = _first_match(file_names, _OPENAPI_FILES, _OPENAPI_FILE_SET)
+            if pattern is None:
                 continue
-            for pattern in asyncapi_patterns:
-                spec_file = search_dir / pattern
-                if spec_file.is_file():
-                    docs_found["asyncapi"] = {
-                        "name": "AsyncAPI",
+            spec_file = search_dir / pattern
+            content = ctx.read_file(spec_file)
+            if content:
+                if "openapi:" in content or '"openapi":' in content:
+                    # Try to extract version
+                    match = _OPENAPI_VERSION_RE.search(content)
+                    docs_found["openapi"] = {
+                        "name": "OpenAPI",
                         "file": str(spec_file.relative_to(ctx.repo_root)),
+                        "version": match.group(1) if match else "3.x",
                     }
-                    break
-
-        # GraphQL schema
-        graphql_patterns = ["schema.graphql", "schema.gql"]
-        for search_dir in search_dirs:
-            if not search_dir.is_dir():
-                continue
-            for pattern in graphql_patterns:
-                spec_file = search_dir / pattern
-                if spec_file.is_file():
-                    docs_found["graphql"] = {
-                        "name": "GraphQL Schema",
+                elif "swagger:" in content or '"swagger":' in content:
+                    docs_found["swagger"] = {
+                        "name": "Swagger",
                         "file": str(spec_file.relative_to(ctx.repo_root)),
+                        "version": "2.0",
+                    }
+            if docs_found:
+                break
+
+        # AsyncAPI for event-driven APIs, and GraphQL schemas: the last
+        # directory with a candidate wins
+        for doc_id, doc_name, candidates, candidate_set in (
+            ("asyncapi", "AsyncAPI", _ASYNCAPI_FILES, _ASYNCAPI_FILE_SET),
+            ("graphql", "GraphQL Schema", _GRAPHQL_FILES, _GRAPHQL_FILE_SET),
+        ):
+            for search_dir, file_names in reversed(dir_files):
+                pattern = _first_match(file_names, candidates, candidate_set)
+                if pattern is not None:
+                    docs_found[doc_id] = {
+                        "name": doc_name,
+                        "file": str((search_dir / pattern).relative_to(ctx.repo_root)),
                     }
                     break
 
-        # Postman collection
-        postman_files = list(ctx.repo_root.glob("**/postman*.json")) + \
-                       list(ctx.repo_root.glob("**/*.postman_collection.json"))
+        # Postman collection; not from the file index, which skips docs/ and
+        # examples/ where collections usually live
+        postman_files = find_files(ctx.repo_root, _is_postman_collection)
         if postman_files:
             docs_found["postman"] = {
                 "name": "Postman Collection",
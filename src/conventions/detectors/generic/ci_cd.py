@@ -2,10 +2,23 @@
 
 from __future__ import annotations
 
-from ...fs import read_file_safe
+import re
+
+from ...fs import read_bytes_safe, read_files_parallel
 from ..base import BaseDetector, DetectorContext, DetectorResult
 from ..registry import DetectorRegistry
 
+# Workflow content indicators, one named group per feature, so each file is
+# scanned in a single pass over its raw bytes (no decoding or lowercasing).
+# Test and lint tools match case-insensitively.
+_CI_CONTENT_RE = re.compile(
+    rb"(?P<testing>(?i:pytest|npm test))"
+    rb"|(?P<linting>(?i:eslint|ruff|flake8))"
+    rb"|(?P<caching>actions/cache|cache:)"
+    rb"|(?P<matrix>matrix:)"
+)
+_CI_CONTENT_FEATURES = frozenset(_CI_CONTENT_RE.groupindex)
+
 
 @DetectorRegistry.register
 class CICDDetector(BaseDetector):
@@ -36,7 +49,7 @@ class CICDDetector(BaseDetector):
 
         # GitHub Actions
         gh_workflows = ctx.repo_root / ".github" / "workflows"
-        if gh_workflows.is_dir():
+        if ctx.root_has_dir(".github") and gh_workflows.is_dir():
             workflow_files = list(gh_workflows.glob("*.yml")) + list(gh_workflows.glob("*.yaml"))
             if workflow_files:
                 platforms["github_actions"] = {
@@ -46,8 +59,7 @@ class CICDDetector(BaseDetector):
                 }
 
         # GitLab CI
-        gitlab_ci = ctx.repo_root / ".gitlab-ci.yml"
-        if gitlab_ci.is_file():
+        if ctx.root_has_file(".gitlab-ci.yml"):
             platforms["gitlab_ci"] = {
                 "name": "GitLab CI",
                 "files": [".gitlab-ci.yml"],
@@ -55,39 +67,35 @@ class CICDDetector(BaseDetector):
 
         # CircleCI
         circleci = ctx.repo_root / ".circleci" / "config.yml"
-        if circleci.is_file():
+        if ctx.root_has_dir(".circleci") and circleci.is_file():
             platforms["circleci"] = {
                 "name": "CircleCI",
                 "files": ["config.yml"],
             }
 
         # Jenkins
-        jenkinsfile = ctx.repo_root / "Jenkinsfile"
-        if jenkinsfile.is_file():
+        if ctx.root_has_file("Jenkinsfile"):
             platforms["jenkins"] = {
                 "name": "Jenkins",
                 "files": ["Jenkinsfile"],
             }
 
         # Travis CI
-        travis = ctx.repo_root / ".travis.yml"
-        if travis.is_file():
+        if ctx.root_has_file(".travis.yml"):
             platforms["travis"] = {
                 "name": "Travis CI",
                 "files": [".travis.yml"],
             }
 
         # Azure Pipelines
-        azure = ctx.repo_root / "azure-pipelines.yml"
-        if azure.is_file():
+        if ctx.root_has_file("azure-pipelines.yml"):
             platforms["azure"] = {
                 "name": "Azure Pipelines",
                 "files": ["azure-pipelines.yml"],
             }
 
         # Bitbucket Pipelines
-        bitbucket = ctx.repo_root / "bitbucket-pipelines.yml"
-        if bitbucket.is_file():
+        if ctx.root_has_file("bitbucket-pipelines.yml"):
             platforms["bitbucket"] = {
                 "name": "Bitbucket Pipelines",
                 "files": ["bitbucket-pipelines.yml"],
@@ -131,46 +139,43 @@ class CICDDetector(BaseDetector):
     ) -> None:
         """Detect CI configuration quality indicators."""
         gh_workflows = ctx.repo_root / ".github" / "workflows"
-        if not gh_workflows.is_dir():
+        if not ctx.root_has_dir(".github") or not gh_workflows.is_dir():
             return
 
         workflow_files = list(gh_workflows.glob("*.yml")) + list(gh_workflows.glob("*.yaml"))
         if not workflow_files:
             return
 
-        has_test_workflow = False
-        has_lint_workflow = False
         has_deploy_workflow = False
-        has_caching = False
-        has_matrix = False
+        found: set[str] = set()
 
-        for wf_file in workflow_files:
-            content = read_file_safe(wf_file)
-            if content is None:
-                continue
+        contents = read_files_parallel(workflow_files, read_bytes_safe)
 
-            content_lower = content.lower()
+        for wf_file, content in zip(workflow_files, contents):
             name_lower = wf_file.name.lower()
 
-            # Check for test workflow
-            if "test" in name_lower or "pytest" in content_lower or "npm test" in content_lower:
-                has_test_workflow = True
-
-            # Check for lint workflow
-            if "lint" in name_lower or "eslint" in content_lower or "ruff" in content_lower or "flake8" in content_lower:
-                has_lint_workflow = True
-
-            # Check for deploy workflow
+            # Check workflow names for test/lint/deploy workflows
+            if "test" in name_lower:
+                found.add("testing")
+            if "lint" in name_lower:
+                found.add("linting")
             if "deploy" in name_lower or "release" in name_lower:
                 has_deploy_workflow = True
 
-            # Check for caching
-            if "actions/cache" in content or "cache:" in content:
-                has_caching = True
+            # Skip scanning once every content indicator has been seen,
+            # whether from a file name or an earlier workflow
+            if content is None or found >= _CI_CONTENT_FEATURES:
+                continue
+
+            for match in _CI_CONTENT_RE.finditer(content):
+                found.add(match.lastgroup or "")
+                if found >= _CI_CONTENT_FEATURES:
+                    break
 
-            # Check for matrix builds
-            if "matrix:" in content:
-                has_matrix = True
+        has_test_workflow = "testing" in found
+        has_lint_workflow = "linting" in found
+        has_caching = "caching" in found
+        has_matrix = "matrix" in found
 
         features = []
         if has_test_workflow:
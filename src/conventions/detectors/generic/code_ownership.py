@@ -5,12 +5,32 @@ Detects CODEOWNERS patterns and file change hotspots.
 
 from __future__ import annotations
 
-import subprocess
+import os
+import re
+from collections import Counter
+from functools import partial
+from pathlib import Path
 
-from ...fs import read_file_safe
 from ..base import BaseDetector, DetectorContext, DetectorResult
 from ..registry import DetectorRegistry
 
+# One CODEOWNERS rule: a pattern that isn't a comment, then its owners
+_CODEOWNERS_RULE_RE = re.compile(r"^[ \t]*([^#\s]\S*)[ \t]+(\S[^\n]*)", re.MULTILINE)
+
+# Where GitHub and GitLab look for CODEOWNERS, in lookup order
+_CODEOWNERS_PATHS = (
+    "CODEOWNERS",
+    os.path.join(".github", "CODEOWNERS"),
+    os.path.join("docs", "CODEOWNERS"),
+    os.path.join(".gitlab", "CODEOWNERS"),
+)
+
+# Seconds git log may run before it is killed
+_GIT_LOG_TIMEOUT = 10
+
+# Bytes of git log output read at a time
+_GIT_LOG_CHUNK_SIZE = 64 * 1024
+
 
 @DetectorRegistry.register
 class CodeOwnershipDetector(BaseDetector):
@@ -34,39 +54,27 @@ class CodeOwnershipDetector(BaseDetector):
         result: DetectorResult,
     ) -> None:
         """Parse CODEOWNERS file."""
+        root_str = str(ctx.repo_root)
         codeowners_path = None
-        for candidate in (
-            "CODEOWNERS",
-            ".github/CODEOWNERS",
-            "docs/CODEOWNERS",
-            ".gitlab/CODEOWNERS",
-        ):
-            p = ctx.repo_root / candidate
-            if p.is_file():
-                codeowners_path = p
+        for candidate in _CODEOWNERS_PATHS:
+            path = os.path.join(root_str, candidate)
+            if os.path.isfile(path):
+                codeowners_path = Path(path)
                 break
 
         if codeowners_path is None:
             return
 
-        content = read_file_safe(codeowners_path)
+        content = ctx.read_file(codeowners_path)
         if not content:
             return
 
         owners: set[str] = set()
         rules: list[dict[str, str | list[str]]] = []
 
-        for line in content.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            parts = line.split()
-            if len(parts) < 2:
-                continue
-
-            pattern = parts[0]
-            rule_owners = parts[1:]
+        for match in _CODEOWNERS_RULE_RE.finditer(content):
+            pattern, owners_text = match.groups()
+            rule_owners = owners_text.split()
             owners.update(rule_owners)
             rules.append({"pattern": pattern, "owners": rule_owners})
 
@@ -100,37 +108,54 @@ class CodeOwnershipDetector(BaseDetector):
     ) -> None:
         """Detect frequently changed files via git log."""
         # Check if this is a git repo
-        git_dir = ctx.repo_root / ".git"
-        if not git_dir.exists():
+        if not os.path.exists(os.path.join(str(ctx.repo_root), ".git")):
             return
 
+        import subprocess
+        import threading
+
+        # Stream NUL-separated names and count them as they arrive instead of
+        # buffering the whole output; a timer kills git if it runs past the
+        # budget. Names stay bytes (unquoted by -z) until they are reported.
         try:
-            proc = subprocess.run(
-                ["git", "log", "--format=", "--name-only", "-100"],
-                capture_output=True,
-                text=True,
+            proc = subprocess.Popen(
+                ["git", "log", "-z", "--format=", "--name-only", "-100"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
                 cwd=ctx.repo_root,
-                timeout=10,
             )
-        except (subprocess.TimeoutExpired, FileNotFoundError):
+        except FileNotFoundError:
             return
 
+        timer = threading.Timer(_GIT_LOG_TIMEOUT, proc.kill)
+        timer.start()
+        file_counts: Counter[bytes] = Counter()
+        try:
+            with proc:
+                if proc.stdout is not None:
+                    pending = b""
+                    for chunk in iter(partial(proc.stdout.read, _GIT_LOG_CHUNK_SIZE), b""):
+                        names = (pending + chunk).split(b"\0")
+                        pending = names.pop()
+                        file_counts.update(filter(None, names))
+                    if pending:
+                        file_counts[pending] += 1
+        finally:
+            timer.cancel()
+
+        # Killed by the timer, or git failed
         if proc.returncode != 0:
             return
 
-        file_counts: dict[str, int] = {}
-        for line in proc.stdout.splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            file_counts[line] = file_counts.get(line, 0) + 1
-
         if not file_counts:
             return
 
-        # Top 10 hotspots — sort by change count descending
-        sorted_files = sorted(file_counts.items(), key=lambda x: -x[1])[:10]
-        hotspots = [{"file": f, "changes": c} for f, c in sorted_files]
+        # Top 10 hotspots by change count; ties keep first-seen order
+        sorted_files = file_counts.most_common(10)
+        hotspots = [
+            {"file": f.decode("utf-8", errors="replace"), "changes": c}
+            for f, c in sorted_files
+        ]
 
         if not hotspots or sorted_files[0][1] < 3:
             return
@@ -5,9 +5,17 @@ Detects how the project accesses configuration and secrets.
 
 from __future__ import annotations
 
+import os
 import re
+from collections import Counter
+from pathlib import Path
 
-from ...fs import read_file_safe, walk_files
+try:
+    import re2
+except ImportError:
+    re2 = None  # type: ignore
+
+from ...fs import read_file_head, read_files_parallel
 from ..base import BaseDetector, DetectorContext, DetectorResult
 from ..registry import DetectorRegistry
 
@@ -39,6 +47,60 @@ _SECRETS_PATTERNS = [
     ("infisical", re.compile(r"""(?:infisical|InfisicalClient)""")),
 ]
 
+
+def _combine(patterns: list[tuple[str, re.Pattern[str]]]) -> re.Pattern[str]:
+    """Fuse named patterns into one alternation with a named group each.
+
+    Uses RE2 when google-re2 is installed: it matches the whole group in
+    linear time without backtracking. Otherwise falls back to re.
+    """
+    source = "|".join(f"(?P<{name}>{pattern.pattern})" for name, pattern in patterns)
+    if re2 is not None:
+        return re2.compile(source)  # type: ignore[no-any-return]
+    return re.compile(source)
+
+
+# One pass per file per group instead of one findall per pattern. Fused
+# matches can't overlap, so this only suits groups whose patterns never
+# match inside one another; the secrets patterns do (KeyVaultClient also
+# contains VaultClient, and azure.*keyvault can span other providers) and
+# are counted one pattern at a time
+_ENV_ACCESS_RE = _combine(_ENV_ACCESS_PATTERNS)
+_CONFIG_LIBRARY_RE = _combine(_CONFIG_LIBRARY_PATTERNS)
+
+
+def _in_pattern_order(
+    counts: Counter[str],
+    patterns: list[tuple[str, re.Pattern[str]]],
+) -> dict[str, int]:
+    """Order counts like their pattern list so output doesn't depend on file order."""
+    return {name: counts[name] for name, _ in patterns if name in counts}
+
+
+# Threads scanning source files; reads dominate, so oversubscribe the CPUs
+_SCAN_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+
+def _scan_file(path: Path) -> tuple[Counter[str], Counter[str], Counter[str]]:
+    """Count env access, config library and secrets manager matches in one file."""
+    env_found: Counter[str] = Counter()
+    lib_found: Counter[str] = Counter()
+    secrets_found: Counter[str] = Counter()
+
+    # Imports and env access cluster near the top; cap the scan for
+    # large generated files
+    content = read_file_head(path)
+    if content:
+        env_found.update(m.lastgroup or "" for m in _ENV_ACCESS_RE.finditer(content))
+        lib_found.update(m.lastgroup or "" for m in _CONFIG_LIBRARY_RE.finditer(content))
+        for name, pattern in _SECRETS_PATTERNS:
+            count = len(pattern.findall(content))
+            if count:
+                secrets_found[name] += count
+
+    return env_found, lib_found, secrets_found
+
+
 # Source file extensions to scan
 _SOURCE_EXTENSIONS = {
     ".py", ".js", ".ts", ".jsx", ".tsx", ".go", ".rs",
@@ -68,33 +130,27 @@ class ConfigPatternsDetector(BaseDetector):
         result: DetectorResult,
     ) -> None:
         """Scan source files for config access patterns."""
-        env_counts: dict[str, int] = {}
-        lib_counts: dict[str, int] = {}
-        secrets_counts: dict[str, int] = {}
-
-        for file_path in walk_files(
-            ctx.repo_root,
-            extensions=_SOURCE_EXTENSIONS,
-            max_files=ctx.max_files,
-        ):
-            content = read_file_safe(file_path)
-            if not content:
-                continue
-
-            for name, pattern in _ENV_ACCESS_PATTERNS:
-                count = len(pattern.findall(content))
-                if count:
-                    env_counts[name] = env_counts.get(name, 0) + count
-
-            for name, pattern in _CONFIG_LIBRARY_PATTERNS:
-                count = len(pattern.findall(content))
-                if count:
-                    lib_counts[name] = lib_counts.get(name, 0) + count
-
-            for name, pattern in _SECRETS_PATTERNS:
-                count = len(pattern.findall(content))
-                if count:
-                    secrets_counts[name] = secrets_counts.get(name, 0) + count
+        # Source files come from the walk shared with the other detectors;
+        # docs-only or config-only repos have nothing to scan
+        index = ctx.get_file_index()
+        if not any(ext in index for ext in _SOURCE_EXTENSIONS):
+            return
+
+        source_files = sorted(
+            path for ext in _SOURCE_EXTENSIONS for path in index.get(ext, [])
+        )[:ctx.max_files]
+
+        env_found: Counter[str] = Counter()
+        lib_found: Counter[str] = Counter()
+        secrets_found: Counter[str] = Counter()
+        for env, lib, secrets in read_files_parallel(source_files, _scan_file, _SCAN_WORKERS):
+            env_found += env
+            lib_found += lib
+            secrets_found += secrets
+
+        env_counts = _in_pattern_order(env_found, _ENV_ACCESS_PATTERNS)
+        lib_counts = _in_pattern_order(lib_found, _CONFIG_LIBRARY_PATTERNS)
+        secrets_counts = _in_pattern_order(secrets_found, _SECRETS_PATTERNS)
 
         total = sum(env_counts.values()) + sum(lib_counts.values())
         if total < 2:
@@ -153,15 +209,11 @@ class ConfigPatternsDetector(BaseDetector):
             "appsettings.json",
         ]
         for name in candidates:
-            if (ctx.repo_root / name).is_file():
+            if ctx.root_has_file(name):
                 config_files.append(name)
 
         # Check for config directories
-        config_dirs: list[str] = []
-        for dir_name in ("config", "settings", "conf"):
-            d = ctx.repo_root / dir_name
-            if d.is_dir():
-                config_dirs.append(dir_name)
+        config_dirs = [d for d in ("config", "settings", "conf") if ctx.root_has_dir(d)]
 
         if not config_files and not config_dirs:
             return
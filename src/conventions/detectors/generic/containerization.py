@@ -2,13 +2,97 @@
 
 from __future__ import annotations
 
+import os
 import re
+from fnmatch import fnmatchcase
 from pathlib import Path
 
-from ...fs import read_file_safe
+from ...fs import find_files, read_file_head
 from ..base import BaseDetector, DetectorContext, DetectorResult
 from ..registry import DetectorRegistry
 
+# Keys indented two spaces in a compose file, counted as services
+_COMPOSE_SERVICE_RE = re.compile(r"^\s{2}\w+:", re.MULTILINE)
+
+# Compose files in preference order; all live in the repo root
+_COMPOSE_FILES = ("docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml")
+
+# Root directories holding Kubernetes manifests or Helm charts
+_K8S_DIRS = ("k8s", "kubernetes", "deploy", "manifests", "charts")
+
+# Compose keys that mark a feature, found in one pass; labels in report order
+_COMPOSE_FEATURE_RE = re.compile(
+    r"volumes:|networks:|environment:|env_file:|healthcheck:|depends_on:|profiles:"
+)
+_COMPOSE_FEATURES = (
+    ("volumes", ("volumes:",)),
+    ("networks", ("networks:",)),
+    ("environment config", ("environment:", "env_file:")),
+    ("health checks", ("healthcheck:",)),
+    ("dependencies", ("depends_on:",)),
+    ("profiles", ("profiles:",)),
+)
+
+# Dependency manifests copied in on the line before a matching install step
+_LAYER_CACHE_STEPS = (
+    (("requirements",), "pip"),
+    (("package", "json"), "npm"),
+    (("go.mod",), "go"),
+    (("go.sum",), "go"),
+)
+
+
+def _in_order(line: str, *tokens: str) -> bool:
+    """Check that tokens occur in line in the given order."""
+    pos = 0
+    for token in tokens:
+        pos = line.find(token, pos)
+        if pos < 0:
+            return False
+        pos += len(token)
+    return True
+
+
+def _scan_dockerfile(content: str) -> tuple[int, bool, bool, bool, bool]:
+    """
+    Collect Dockerfile facts in one pass over its lines.
+
+    Returns (from_count, non_root_user, healthcheck, uses_latest,
+    layer_optimization).
+    """
+    from_count = 0
+    non_root_user = healthcheck = uses_latest = layer_optimization = False
+
+    prev = ""
+    for line in content.split("\n"):
+        if line.startswith(("FROM ", "FROM\t")):
+            from_count += 1
+            image = line.split(None, 2)[1:2]
+            if image and image[0].find(":latest", 1) > 0:
+                uses_latest = True
+        elif line.startswith("USER"):
+            user = line[4:]
+            if user[:1].isspace() and not user.lstrip().startswith("root"):
+                non_root_user = True
+        elif line.startswith("RUN") and not layer_optimization:
+            # A dependency manifest COPY directly followed by its install step
+            run_args = line[3:]
+            layer_optimization = any(
+                tool in run_args and _in_order(prev, "COPY", *manifest)
+                for manifest, tool in _LAYER_CACHE_STEPS
+            )
+
+        if not healthcheck and "HEALTHCHECK" in line:
+            healthcheck = True
+        prev = line
+
+    return from_count, non_root_user, healthcheck, uses_latest, layer_optimization
+
+
+def _is_yaml_file(name: str) -> bool:
+    """Check whether a file name has a YAML extension."""
+    return name.endswith((".yaml", ".yml"))
+
 
 @DetectorRegistry.register
 class ContainerizationDetector(BaseDetector):
@@ -38,55 +122,38 @@ class ContainerizationDetector(BaseDetector):
         result: DetectorResult,
     ) -> None:
         """Detect Dockerfile patterns and best practices."""
-        dockerfile_paths = [
-            ctx.repo_root / "Dockerfile",
-            ctx.repo_root / "docker" / "Dockerfile",
-        ]
-
-        # Also look for multi-stage Dockerfiles
-        dockerfile_patterns = list(ctx.repo_root.glob("Dockerfile*")) + \
-                             list(ctx.repo_root.glob("*.Dockerfile"))
-
-        dockerfile = None
-        for path in dockerfile_paths + dockerfile_patterns:
-            if path.is_file():
-                dockerfile = path
-                break
-
-        if dockerfile is None:
-            return
+        dockerfile: Path | None = None
+        if ctx.root_has_file("Dockerfile"):
+            dockerfile = ctx.repo_root / "Dockerfile"
+        elif os.path.isfile(os.path.join(str(ctx.repo_root), "docker", "Dockerfile")):
+            dockerfile = ctx.repo_root / "docker" / "Dockerfile"
+        else:
+            # Also look for multi-stage Dockerfiles
+            dockerfile_patterns = self._root_files_matching(ctx, "Dockerfile*", "*.Dockerfile")
+            if not dockerfile_patterns:
+                return
+            dockerfile = dockerfile_patterns[0]
 
-        content = read_file_safe(dockerfile)
+        content = read_file_head(dockerfile)
         if content is None:
             return
 
-        # Analyze Dockerfile best practices
-        practices: dict[str, bool] = {}
-
-        # Multi-stage build
-        from_count = len(re.findall(r"^FROM\s+", content, re.MULTILINE))
-        practices["multi_stage"] = from_count > 1
-
-        # Non-root user
-        practices["non_root_user"] = bool(re.search(r"^USER\s+(?!root)", content, re.MULTILINE))
-
-        # Health check
-        practices["healthcheck"] = "HEALTHCHECK" in content
-
-        # .dockerignore
-        practices["dockerignore"] = (ctx.repo_root / ".dockerignore").is_file()
-
-        # Specific base image (not :latest)
-        latest_pattern = r"^FROM\s+\S+:latest"
-        practices["pinned_version"] = not bool(re.search(latest_pattern, content, re.MULTILINE))
-
-        # Layer caching optimization (COPY before RUN for dependencies)
-        practices["layer_optimization"] = bool(
-            re.search(r"COPY.*requirements.*\nRUN.*pip", content) or
-            re.search(r"COPY.*package.*json.*\nRUN.*npm", content) or
-            re.search(r"COPY.*go\.(mod|sum).*\nRUN.*go", content)
+        # Analyze Dockerfile best practices in a single pass
+        from_count, non_root_user, healthcheck, uses_latest, layer_optimization = (
+            _scan_dockerfile(content)
         )
 
+        practices: dict[str, bool] = {
+            "multi_stage": from_count > 1,
+            "non_root_user": non_root_user,
+            "healthcheck": healthcheck,
+            "dockerignore": ctx.root_has_file(".dockerignore"),
+            # Specific base image (not :latest)
+            "pinned_version": not uses_latest,
+            # Layer caching optimization (COPY before RUN for dependencies)
+            "layer_optimization": layer_optimization,
+        }
+
         good_practices = [k for k, v in practices.items() if v]
         practice_count = len(good_practices)
 
@@ -135,47 +202,30 @@ class ContainerizationDetector(BaseDetector):
         result: DetectorResult,
     ) -> None:
         """Detect Docker Compose configuration."""
-        compose_paths = [
-            ctx.repo_root / "docker-compose.yml",
-            ctx.repo_root / "docker-compose.yaml",
-            ctx.repo_root / "compose.yml",
-            ctx.repo_root / "compose.yaml",
-        ]
-
-        compose_file = None
-        for path in compose_paths:
-            if path.is_file():
-                compose_file = path
-                break
-
-        if compose_file is None:
+        compose_name = next((n for n in _COMPOSE_FILES if ctx.root_has_file(n)), None)
+        if compose_name is None:
             return
+        compose_file = ctx.repo_root / compose_name
 
-        content = read_file_safe(compose_file)
+        # Shared with EnvironmentSetupDetector, which reads the same file
+        content = ctx.read_file(compose_file)
         if content is None:
             return
 
         # Count services
-        service_count = len(re.findall(r"^\s{2}\w+:", content, re.MULTILINE))
+        service_count = len(_COMPOSE_SERVICE_RE.findall(content))
 
         # Check for features
-        features = []
-        if "volumes:" in content:
-            features.append("volumes")
-        if "networks:" in content:
-            features.append("networks")
-        if "environment:" in content or "env_file:" in content:
-            features.append("environment config")
-        if "healthcheck:" in content:
-            features.append("health checks")
-        if "depends_on:" in content:
-            features.append("dependencies")
-        if "profiles:" in content:
-            features.append("profiles")
+        keys = set(_COMPOSE_FEATURE_RE.findall(content))
+        features = [
+            label for label, label_keys in _COMPOSE_FEATURES
+            if not keys.isdisjoint(label_keys)
+        ]
 
         # Check for multiple compose files (override pattern)
-        override_files = list(ctx.repo_root.glob("docker-compose.*.yml")) + \
-                        list(ctx.repo_root.glob("docker-compose.*.yaml"))
+        override_files = self._root_files_matching(
+            ctx, "docker-compose.*.yml", "docker-compose.*.yaml"
+        )
         has_overrides = len(override_files) > 0
 
         title = "Docker Compose"
@@ -209,46 +259,40 @@ class ContainerizationDetector(BaseDetector):
         result: DetectorResult,
     ) -> None:
         """Detect Kubernetes manifests."""
-        k8s_dirs = [
-            ctx.repo_root / "k8s",
-            ctx.repo_root / "kubernetes",
-            ctx.repo_root / "deploy",
-            ctx.repo_root / "manifests",
-            ctx.repo_root / "charts",  # Helm
-        ]
+        k8s_dirs = [name for name in _K8S_DIRS if ctx.root_has_dir(name)]
+        if not k8s_dirs:
+            return
+
+        # One scandir walk over the k8s directories, honouring only
+        # .gitignore; the file index would drop overlays such as env/ and
+        # build/ that HARD_EXCLUDES skips
+        k8s_files = find_files(
+            ctx.repo_root,
+            _is_yaml_file,
+            top_dirs=tuple(k8s_dirs),
+            skip_dirs=frozenset(),
+        )
+
+        # Also check for Helm Chart.yaml and kustomization
+        root_str = str(ctx.repo_root)
+        has_helm = any(
+            os.path.isfile(os.path.join(root_str, name, "Chart.yaml")) for name in k8s_dirs
+        )
+        has_kustomize = any(
+            os.path.isfile(os.path.join(root_str, name, kust))
+            for name in k8s_dirs
+            for kust in ("kustomization.yaml", "kustomization.yml")
+        )
 
-        k8s_files: list[Path] = []
-        for k8s_dir in k8s_dirs:
-            if k8s_dir.is_dir():
-                k8s_files.extend(k8s_dir.glob("**/*.yaml"))
-                k8s_files.extend(k8s_dir.glob("**/*.yml"))
-
-        # Also check for Helm Chart.yaml
-        helm_chart = None
-        for k8s_dir in k8s_dirs:
-            chart_file = k8s_dir / "Chart.yaml"
-            if chart_file.is_file():
-                helm_chart = chart_file
-                break
-
-        # Check for kustomization
-        kustomize_file = None
-        for k8s_dir in k8s_dirs:
-            for name in ["kustomization.yaml", "kustomization.yml"]:
-                kust = k8s_dir / name
-                if kust.is_file():
-                    kustomize_file = kust
-                    break
-
-        if not k8s_files and not helm_chart and not kustomize_file:
+        if not k8s_files and not has_helm and not has_kustomize:
             return
 
         tools = []
-        if helm_chart:
+        if has_helm:
             tools.append("Helm")
-        if kustomize_file:
+        if has_kustomize:
             tools.append("Kustomize")
-        if k8s_files and not (helm_chart or kustomize_file):
+        if k8s_files and not (has_helm or has_kustomize):
             tools.append("raw manifests")
 
         title = f"Kubernetes: {', '.join(tools)}"
@@ -269,7 +313,18 @@ class ContainerizationDetector(BaseDetector):
             stats={
                 "tools": tools,
                 "manifest_count": len(k8s_files),
-                "has_helm": helm_chart is not None,
-                "has_kustomize": kustomize_file is not None,
+                "has_helm": has_helm,
+                "has_kustomize": has_kustomize,
             },
         ))
+
+    @staticmethod
+    def _root_files_matching(ctx: DetectorContext, *patterns: str) -> list[Path]:
+        """Get files in the repo root whose names match any glob pattern, sorted."""
+        return sorted(
+            ctx.repo_root / name
+            for name, entry in ctx.get_root_listing().items()
+            if not name.startswith(".")
+            and any(fnmatchcase(name, pattern) for pattern in patterns)
+            and entry.is_file()
+        )
@@ -2,10 +2,29 @@
 
 from __future__ import annotations
 
-from ...fs import read_file_safe
+import re
+
 from ..base import BaseDetector, DetectorContext, DetectorResult
 from ..registry import DetectorRegistry
 
+# Dependabot ecosystems, in report order; matched as whole words so that
+# e.g. "pipeline" is not taken for pip
+_DEPENDABOT_ECOSYSTEMS = ("npm", "pip", "gomod", "cargo", "docker", "github-actions")
+_DEPENDABOT_ECOSYSTEM_RE = re.compile(r"\b(npm|pip|gomod|cargo|docker|github-actions)\b")
+
+# Renovate settings worth reporting, keyed by the text that marks them
+_RENOVATE_EXTENDS = {
+    "config:base": "base",
+    "config:recommended": "recommended",
+    "schedule": "custom schedule",
+    "automerge": "automerge",
+}
+_RENOVATE_EXTENDS_RE = re.compile(r"config:base|config:recommended|schedule|automerge")
+
+# Renovate configs at the repo root, in lookup order; .github/renovate.json
+# is checked after these
+_RENOVATE_ROOT_FILES = ("renovate.json", "renovate.json5", ".renovaterc", ".renovaterc.json")
+
 
 @DetectorRegistry.register
 class DependencyUpdatesDetector(BaseDetector):
@@ -19,29 +38,21 @@ class DependencyUpdatesDetector(BaseDetector):
         result = DetectorResult()
 
         tools: dict[str, dict] = {}
+        github_dir = ctx.repo_root / ".github"
+        has_github = ctx.root_has_dir(".github")
 
         # Dependabot
         dependabot_paths = [
-            ctx.repo_root / ".github" / "dependabot.yml",
-            ctx.repo_root / ".github" / "dependabot.yaml",
+            github_dir / "dependabot.yml",
+            github_dir / "dependabot.yaml",
         ]
         for path in dependabot_paths:
-            if path.is_file():
-                content = read_file_safe(path)
+            if has_github and path.is_file():
+                content = ctx.read_file(path)
                 ecosystems = []
                 if content:
-                    if "npm" in content:
-                        ecosystems.append("npm")
-                    if "pip" in content:
-                        ecosystems.append("pip")
-                    if "gomod" in content:
-                        ecosystems.append("gomod")
-                    if "cargo" in content:
-                        ecosystems.append("cargo")
-                    if "docker" in content:
-                        ecosystems.append("docker")
-                    if "github-actions" in content:
-                        ecosystems.append("github-actions")
+                    found = set(_DEPENDABOT_ECOSYSTEM_RE.findall(content))
+                    ecosystems = [e for e in _DEPENDABOT_ECOSYSTEMS if e in found]
 
                 tools["dependabot"] = {
                     "name": "Dependabot",
@@ -49,37 +60,29 @@ class DependencyUpdatesDetector(BaseDetector):
                 }
                 break
 
-        # Renovate
-        renovate_paths = [
-            ctx.repo_root / "renovate.json",
-            ctx.repo_root / "renovate.json5",
-            ctx.repo_root / ".renovaterc",
-            ctx.repo_root / ".renovaterc.json",
-            ctx.repo_root / ".github" / "renovate.json",
-        ]
-        for path in renovate_paths:
-            if path.is_file():
-                content = read_file_safe(path)
-                extends = []
-                if content:
-                    if "config:base" in content:
-                        extends.append("base")
-                    if "config:recommended" in content:
-                        extends.append("recommended")
-                    if "schedule" in content:
-                        extends.append("custom schedule")
-                    if "automerge" in content:
-                        extends.append("automerge")
-
-                tools["renovate"] = {
-                    "name": "Renovate",
-                    "extends": extends,
-                }
-                break
+        # Renovate: root-level names are checked against the root listing
+        renovate_path = next(
+            (ctx.repo_root / name for name in _RENOVATE_ROOT_FILES if ctx.root_has_file(name)),
+            None,
+        )
+        if renovate_path is None and has_github and (github_dir / "renovate.json").is_file():
+            renovate_path = github_dir / "renovate.json"
+        if renovate_path is not None:
+            content = ctx.read_file(renovate_path)
+            extends = []
+            if content:
+                found = set(_RENOVATE_EXTENDS_RE.findall(content))
+                extends = [
+                    label for marker, label in _RENOVATE_EXTENDS.items() if marker in found
+                ]
+
+            tools["renovate"] = {
+                "name": "Renovate",
+                "extends": extends,
+            }
 
         # Snyk
-        snyk_file = ctx.repo_root / ".snyk"
-        if snyk_file.is_file():
+        if ctx.root_has_file(".snyk"):
             tools["snyk"] = {
                 "name": "Snyk",
             }
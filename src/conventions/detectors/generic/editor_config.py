@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from ...fs import read_file_safe
 from ..base import BaseDetector, DetectorContext, DetectorResult
 from ..registry import DetectorRegistry
 
@@ -23,7 +22,7 @@ class EditorConfigDetector(BaseDetector):
         # .editorconfig
         editorconfig = ctx.repo_root / ".editorconfig"
         if editorconfig.is_file():
-            content = read_file_safe(editorconfig)
+            content = ctx.read_file(editorconfig)
             settings = []
             if content:
                 if "indent_style" in content:
@@ -45,7 +44,7 @@ class EditorConfigDetector(BaseDetector):
         # VS Code settings
         vscode_settings = ctx.repo_root / ".vscode" / "settings.json"
         if vscode_settings.is_file():
-            content = read_file_safe(vscode_settings)
+            content = ctx.read_file(vscode_settings)
             features = []
             if content:
                 if "editor.formatOnSave" in content:
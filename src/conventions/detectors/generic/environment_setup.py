@@ -6,26 +6,40 @@ Detects required environment variables, services, and runtime prerequisites.
 from __future__ import annotations
 
 import re
+from collections import Counter
 
-from ...fs import read_file_safe
-from ..base import BaseDetector, DetectorContext, DetectorResult
-from ..registry import DetectorRegistry
+import yaml
 
-# Category patterns for environment variable names
-_VAR_CATEGORIES = [
-    ("database", re.compile(r"^(DB_|DATABASE_|MONGO|MYSQL|POSTGRES|PG_|SQLITE)")),
-    ("auth", re.compile(r"^(JWT_|AUTH_|SECRET|API_KEY|API_SECRET|TOKEN|OAUTH|SESSION_SECRET)")),
-    ("service", re.compile(r"^(REDIS_|RABBITMQ_|AMQP_|S3_|AWS_|ELASTICSEARCH|KAFKA|SMTP_|MAIL_)")),
-    ("app", re.compile(r"^(PORT|HOST|NODE_ENV|APP_ENV|DEBUG|LOG_LEVEL|BASE_URL|ALLOWED_HOSTS)")),
-]
+try:
+    from yaml import CBaseLoader as _ComposeLoader
+except ImportError:
+    from yaml import BaseLoader as _ComposeLoader  # type: ignore[assignment]
 
+from ..base import BaseDetector, DetectorContext, DetectorResult
+from ..registry import DetectorRegistry
 
-def _categorize_var(name: str) -> str:
-    """Categorize an environment variable by its name prefix."""
-    for category, pattern in _VAR_CATEGORIES:
-        if pattern.match(name):
-            return category
-    return "other"
+# One assignment in a .env file, NAME=value, optionally indented, and the
+# category of NAME by its prefix. The lookahead captures the name and value
+# first, so the category prefixes (tried in order) close last and
+# lastgroup names the category, or is None for an uncategorized name.
+# Comment lines never match since a name can't start with "#"
+_ENV_LINE_RE = re.compile(
+    r"^[^\S\n]*(?=([A-Za-z_][A-Za-z0-9_]*)=(.*))"
+    r"(?:(?P<database>DB_|DATABASE_|MONGO|MYSQL|POSTGRES|PG_|SQLITE)"
+    r"|(?P<auth>JWT_|AUTH_|SECRET|API_KEY|API_SECRET|TOKEN|OAUTH|SESSION_SECRET)"
+    r"|(?P<service>REDIS_|RABBITMQ_|AMQP_|S3_|AWS_|ELASTICSEARCH|KAFKA|SMTP_|MAIL_)"
+    r"|(?P<app>PORT|HOST|NODE_ENV|APP_ENV|DEBUG|LOG_LEVEL|BASE_URL|ALLOWED_HOSTS))?",
+    re.MULTILINE,
+)
+
+# Host and container port at the start of a short-syntax port mapping
+_PORT_MAPPING_RE = re.compile(r"\d+:\d+")
+
+# Root files that pin runtime versions
+_PREREQUISITE_FILES = frozenset({
+    ".node-version", ".nvmrc", ".python-version", "rust-toolchain.toml",
+    "rust-toolchain", ".tool-versions", ".go-version",
+})
 
 
 @DetectorRegistry.register
@@ -51,40 +65,29 @@ class EnvironmentSetupDetector(BaseDetector):
         result: DetectorResult,
     ) -> None:
         """Parse .env.example for required environment variables."""
-        env_file = None
         env_name = None
         for name in (".env.example", ".env.sample", ".env.template"):
-            candidate = ctx.repo_root / name
-            if candidate.is_file():
-                env_file = candidate
+            if ctx.root_has_file(name):
                 env_name = name
                 break
 
-        if env_file is None:
+        if env_name is None:
             return
 
-        content = read_file_safe(env_file)
+        content = ctx.read_file(ctx.repo_root / env_name)
         if not content:
             return
 
         env_vars: list[dict[str, str | bool]] = []
-        categories: dict[str, int] = {}
-
-        for line in content.splitlines():
-            line = line.strip()
-            if not line or line.startswith("#"):
-                continue
-
-            match = re.match(r"^([A-Za-z_][A-Za-z0-9_]*)=(.*)?$", line)
-            if not match:
-                continue
+        categories: Counter[str] = Counter()
 
+        for match in _ENV_LINE_RE.finditer(content):
             name = match.group(1)
-            value = match.group(2) or ""
-            has_default = bool(value.strip())
+            value = match.group(2).strip()
+            has_default = bool(value)
 
-            category = _categorize_var(name)
-            categories[category] = categories.get(category, 0) + 1
+            category = match.lastgroup or "other"
+            categories[category] += 1
 
             var_info: dict[str, str | bool] = {
                 "name": name,
@@ -92,7 +95,7 @@ class EnvironmentSetupDetector(BaseDetector):
                 "has_default": has_default,
             }
             if has_default:
-                var_info["default"] = value.strip()
+                var_info["default"] = value
             env_vars.append(var_info)
 
         if not env_vars:
@@ -114,7 +117,7 @@ class EnvironmentSetupDetector(BaseDetector):
             stats={
                 "env_file": env_name,
                 "env_vars": env_vars,
-                "var_categories": categories,
+                "var_categories": dict(categories),
                 "total_vars": len(env_vars),
             },
         ))
@@ -125,77 +128,53 @@ class EnvironmentSetupDetector(BaseDetector):
         result: DetectorResult,
     ) -> None:
         """Parse docker-compose.yml for required services."""
-        compose_file = None
+        compose_name = None
         for name in ("docker-compose.yml", "docker-compose.yaml", "compose.yml", "compose.yaml"):
-            candidate = ctx.repo_root / name
-            if candidate.is_file():
-                compose_file = candidate
+            if ctx.root_has_file(name):
+                compose_name = name
                 break
 
-        if compose_file is None:
+        if compose_name is None:
             return
 
-        content = read_file_safe(compose_file)
+        content = ctx.read_file(ctx.repo_root / compose_name)
         if not content:
             return
 
-        # Parse services section using regex
-        services: list[dict[str, str | list[str]]] = []
-        lines = content.splitlines()
-
-        in_services = False
-        current_service: str | None = None
-        current_image = ""
-        current_ports: list[str] = []
-        for line in lines:
-            stripped = line.strip()
-
-            # Find services: top-level key
-            if re.match(r"^services:\s*$", line):
-                in_services = True
-                continue
+        # Every scalar stays a string, so unquoted ports such as 22:22 aren't
+        # read as YAML 1.1 base-60 integers
+        try:
+            data = yaml.load(content, Loader=_ComposeLoader)
+        except yaml.YAMLError:
+            return
+        compose_services = data.get("services") if isinstance(data, dict) else None
+        if not isinstance(compose_services, dict):
+            return
 
-            if not in_services:
+        services: list[dict[str, str | list[str]]] = []
+        for service_name, service in compose_services.items():
+            if service == "":
+                # A bare "name:" entry
+                service = {}
+            elif not isinstance(service, dict):
                 continue
 
-            # Non-indented line = left services section
-            if line and not line[0].isspace():
-                break
+            image = service.get("image")
+            svc_info: dict[str, str | list[str]] = {
+                "name": service_name,
+                "image": image if isinstance(image, str) else "",
+            }
 
-            # Service name at expected indent
-            svc_match = re.match(r"^(\s{2})(\w[\w-]*):\s*$", line)
-            if svc_match:
-                # Save previous service
-                if current_service:
-                    svc_info: dict[str, str | list[str]] = {
-                        "name": current_service,
-                        "image": current_image,
-                    }
-                    if current_ports:
-                        svc_info["ports"] = current_ports
-                    services.append(svc_info)
-                current_service = svc_match.group(2)
-                current_image = ""
-                current_ports = []
-                continue
+            # Short-syntax host:container mappings
+            ports = service.get("ports")
+            if isinstance(ports, list):
+                port_matches = (
+                    _PORT_MAPPING_RE.match(port) for port in ports if isinstance(port, str)
+                )
+                mapped = [m.group(0) for m in port_matches if m]
+                if mapped:
+                    svc_info["ports"] = mapped
 
-            # Image line
-            if current_service and stripped.startswith("image:"):
-                img_match = re.match(r"image:\s*['\"]?([^\s'\"]+)", stripped)
-                if img_match:
-                    current_image = img_match.group(1)
-
-            # Port lines
-            if current_service and stripped.startswith("- ") and ":" in stripped:
-                port_match = re.match(r"-\s*['\"]?(\d+:\d+)", stripped)
-                if port_match:
-                    current_ports.append(port_match.group(1))
-
-        # Save last service
-        if current_service:
-            svc_info = {"name": current_service, "image": current_image}
-            if current_ports:
-                svc_info["ports"] = current_ports
             services.append(svc_info)
 
         if not services:
@@ -226,63 +205,65 @@ class EnvironmentSetupDetector(BaseDetector):
         result: DetectorResult,
     ) -> None:
         """Detect runtime version prerequisites."""
+        # Most repos have none of these files; skip the probes if so
+        if _PREREQUISITE_FILES.isdisjoint(ctx.get_root_listing()):
+            return
+
         tools: list[dict[str, str]] = []
+        tool_names: set[str] = set()
+
+        def add_tool(name: str, version: str, source: str) -> None:
+            tools.append({"name": name, "version": version, "source": source})
+            tool_names.add(name)
 
         # .node-version
-        node_ver = ctx.repo_root / ".node-version"
-        if node_ver.is_file():
-            content = read_file_safe(node_ver)
+        if ctx.root_has_file(".node-version"):
+            content = ctx.read_file(ctx.repo_root / ".node-version")
             if content and content.strip():
-                tools.append({"name": "node", "version": content.strip(), "source": ".node-version"})
+                add_tool("node", content.strip(), ".node-version")
 
         # .nvmrc
-        nvmrc = ctx.repo_root / ".nvmrc"
-        if nvmrc.is_file() and not any(t["name"] == "node" for t in tools):
-            content = read_file_safe(nvmrc)
+        if ctx.root_has_file(".nvmrc") and "node" not in tool_names:
+            content = ctx.read_file(ctx.repo_root / ".nvmrc")
             if content and content.strip():
-                tools.append({"name": "node", "version": content.strip(), "source": ".nvmrc"})
+                add_tool("node", content.strip(), ".nvmrc")
 
         # .python-version
-        py_ver = ctx.repo_root / ".python-version"
-        if py_ver.is_file():
-            content = read_file_safe(py_ver)
+        if ctx.root_has_file(".python-version"):
+            content = ctx.read_file(ctx.repo_root / ".python-version")
             if content and content.strip():
-                tools.append({"name": "python", "version": content.strip().splitlines()[0], "source": ".python-version"})
+                add_tool("python", content.strip().splitlines()[0], ".python-version")
 
         # rust-toolchain.toml or rust-toolchain
         for name in ("rust-toolchain.toml", "rust-toolchain"):
-            rust_tc = ctx.repo_root / name
-            if rust_tc.is_file():
-                content = read_file_safe(rust_tc)
+            if ctx.root_has_file(name):
+                content = ctx.read_file(ctx.repo_root / name)
                 if content:
                     ch_match = re.search(r'channel\s*=\s*["\']?([^\s"\']+)', content)
                     if ch_match:
-                        tools.append({"name": "rust", "version": ch_match.group(1), "source": name})
+                        add_tool("rust", ch_match.group(1), name)
                     elif content.strip() and name == "rust-toolchain":
-                        tools.append({"name": "rust", "version": content.strip(), "source": name})
+                        add_tool("rust", content.strip(), name)
                 break
 
         # .tool-versions (asdf)
-        tool_versions = ctx.repo_root / ".tool-versions"
-        if tool_versions.is_file():
-            content = read_file_safe(tool_versions)
+        if ctx.root_has_file(".tool-versions"):
+            content = ctx.read_file(ctx.repo_root / ".tool-versions")
             if content:
-                existing_names = {t["name"] for t in tools}
                 for line in content.splitlines():
                     line = line.strip()
-                    if not line or line.startswith("#"):
+                    if not line or line[0] == "#":
                         continue
-                    parts = line.split()
-                    if len(parts) >= 2 and parts[0] not in existing_names:
-                        tools.append({"name": parts[0], "version": parts[1], "source": ".tool-versions"})
+                    # Name and first version; a line may list fallbacks after it
+                    parts = line.split(None, 2)
+                    if len(parts) >= 2 and parts[0] not in tool_names:
+                        add_tool(parts[0], parts[1], ".tool-versions")
 
         # .go-version
-        go_ver = ctx.repo_root / ".go-version"
-        if go_ver.is_file():
-            content = read_file_safe(go_ver)
+        if ctx.root_has_file(".go-version") and "go" not in tool_names:
+            content = ctx.read_file(ctx.repo_root / ".go-version")
             if content and content.strip():
-                if not any(t["name"] == "go" for t in tools):
-                    tools.append({"name": "go", "version": content.strip(), "source": ".go-version"})
+                add_tool("go", content.strip(), ".go-version")
 
         if not tools:
             return
@@ -2,13 +2,159 @@
 
 from __future__ import annotations
 
+import os
 import re
 import subprocess
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from functools import partial
+from itertools import islice
+from pathlib import Path
+
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None  # type: ignore
 
-from ...fs import read_file_safe
 from ..base import BaseDetector, DetectorContext, DetectorResult
 from ..registry import DetectorRegistry
 
+# Commit subject styles, matched against the raw UTF-8 bytes of a subject:
+# Conventional Commits "type(scope): description", Gitmoji (an emoji in
+# U+1F300..U+1F9FF, or a :shortcode:) and Jira-style ticket prefixes
+# "ABC-123". The styles can't overlap, so the group that matches names the
+# style.
+_COMMIT_STYLE_RE = re.compile(
+    rb"(?P<conventional>(?i:feat|fix|docs|style|refactor|perf|test|build|ci|chore|revert)"
+    rb"(?:\(.+\))?!?:\s+)"
+    rb"|(?P<gitmoji>\xf0\x9f[\x8c-\xa7][\x80-\xbf]|:[a-z_]+:)"
+    rb"|(?P<ticket>[A-Z]+-\d+)"
+)
+
+# GitFlow branch prefixes: feature/, bugfix/, release/, hotfix/
+_GITFLOW_BRANCH_RE = re.compile(r"(?:feature|bugfix|release|hotfix|develop|main|master)/")
+
+# Pre-commit hook ids and tools by the kind of check they configure; the
+# group that matches names the kind
+_HOOK_KIND_RE = re.compile(
+    r"(?P<whitespace>trailing-whitespace)"
+    r"|(?P<validation>check-yaml|check-json)"
+    r"|(?P<formatting>black|prettier|ruff)"
+    r"|(?P<linting>flake8|eslint|mypy)"
+    r"|(?P<secrets>detect-secrets|gitleaks)"
+)
+_HOOK_KIND_LABELS = {
+    "whitespace": "whitespace",
+    "validation": "file validation",
+    "formatting": "formatting",
+    "linting": "linting",
+    "secrets": "secrets detection",
+}
+
+# Pull request template locations, in order of preference
+_PR_TEMPLATE_PATHS = (
+    ".github/pull_request_template.md",
+    ".github/PULL_REQUEST_TEMPLATE.md",
+    "PULL_REQUEST_TEMPLATE.md",
+    "pull_request_template.md",
+    "docs/pull_request_template.md",
+)
+
+# Seconds a git command may run before it is killed
+_GIT_TIMEOUT = 5
+
+# Bytes read from git's stdout at a time
+_GIT_CHUNK_SIZE = 64 * 1024
+
+# Recent commits whose subjects are classified
+_COMMIT_SAMPLE_SIZE = 50
+
+# Failures reading history, in-process or through the git CLI
+_GIT_ERRORS: tuple[type[Exception], ...] = (OSError, subprocess.SubprocessError)
+if pygit2 is not None:
+    _GIT_ERRORS += (pygit2.GitError,)
+
+
+def _git_records(repo_root: Path, *args: str, sep: bytes = b"\n") -> Iterator[bytes]:
+    """Run a git command and yield its sep-separated output records as they arrive.
+
+    Records are raw bytes, without the separator; callers decode only what
+    they report. Raises CalledProcessError once the output is exhausted if
+    git failed or was killed for running past _GIT_TIMEOUT, and OSError if
+    it can't start.
+    """
+    proc = subprocess.Popen(
+        ["git", *args],
+        cwd=repo_root,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    timer = threading.Timer(_GIT_TIMEOUT, proc.kill)
+    timer.start()
+    try:
+        with proc:
+            if proc.stdout is not None:
+                pending = b""
+                for chunk in iter(partial(proc.stdout.read, _GIT_CHUNK_SIZE), b""):
+                    records = (pending + chunk).split(sep)
+                    pending = records.pop()
+                    yield from records
+                if pending:
+                    yield pending
+    finally:
+        timer.cancel()
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+
+def _subject(message: bytes) -> bytes:
+    """Get a commit message's subject as git log's %s prints it.
+
+    The subject is the first paragraph, its lines joined with spaces.
+    """
+    lines: list[bytes] = []
+    for line in message.split(b"\n"):
+        line = line.rstrip()
+        if line:
+            lines.append(line)
+        elif lines:
+            break
+    return b" ".join(lines)
+
+
+def _commit_subjects(repo_root: Path) -> Iterator[bytes]:
+    """Yield the raw subjects of the most recent commits on HEAD, newest first.
+
+    With pygit2 installed the history is walked in-process; otherwise the
+    subjects come from git log. Raises one of _GIT_ERRORS if the history
+    can't be read.
+    """
+    if pygit2 is not None:
+        repo = pygit2.Repository(str(repo_root))
+        walker = repo.walk(repo.head.target)
+        for commit in islice(walker, _COMMIT_SAMPLE_SIZE):
+            yield _subject(commit.raw_message)
+        return
+
+    yield from _git_records(
+        repo_root, "log", "-z", f"-{_COMMIT_SAMPLE_SIZE}", "--format=%s", sep=b"\0"
+    )
+
+
+def _remote_branches(repo_root: Path) -> Iterator[str]:
+    """Yield the names of remote-tracking branches, e.g. "origin/main".
+
+    Uses pygit2 when installed and git branch -r otherwise. Raises one of
+    _GIT_ERRORS if the branches can't be listed.
+    """
+    if pygit2 is not None:
+        yield from pygit2.Repository(str(repo_root)).branches.remote
+        return
+
+    for record in _git_records(repo_root, "branch", "-r"):
+        yield record.decode("utf-8", errors="replace").strip()
+
 
 @DetectorRegistry.register
 class GitConventionsDetector(BaseDetector):
@@ -21,11 +167,14 @@ class GitConventionsDetector(BaseDetector):
         """Detect Git conventions."""
         result = DetectorResult()
 
-        # Detect commit message conventions
-        self._detect_commit_conventions(ctx, result)
+        # History and branches need git; don't spawn it outside a checkout.
+        # .git may be a directory or, in worktrees and submodules, a file.
+        if ".git" in ctx.get_root_listing():
+            # Detect commit message conventions
+            self._detect_commit_conventions(ctx, result)
 
-        # Detect branch naming conventions
-        self._detect_branch_conventions(ctx, result)
+            # Detect branch naming conventions
+            self._detect_branch_conventions(ctx, result)
 
         # Detect Git hooks
         self._detect_git_hooks(ctx, result)
@@ -41,38 +190,24 @@ class GitConventionsDetector(BaseDetector):
         result: DetectorResult,
     ) -> None:
         """Detect commit message conventions."""
-        # Try to read recent commit messages
+        total = 0
+        styles: Counter[str | None] = Counter()
         try:
-            git_result = subprocess.run(
-                ["git", "log", "--oneline", "-50", "--format=%s"],
-                cwd=ctx.repo_root,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if git_result.returncode != 0:
-                return
-
-            commits = git_result.stdout.strip().split("\n")
-            if len(commits) < 10:
-                return
-
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+            for subject in _commit_subjects(ctx.repo_root):
+                total += 1
+                match = _COMMIT_STYLE_RE.match(subject)
+                if match:
+                    styles[match.lastgroup] += 1
+        except _GIT_ERRORS:
             return
 
-        # Conventional Commits pattern: type(scope): description
-        conventional_pattern = r"^(feat|fix|docs|style|refactor|perf|test|build|ci|chore|revert)(\(.+\))?!?:\s+"
-        conventional_count = sum(1 for c in commits if re.match(conventional_pattern, c, re.IGNORECASE))
-
-        # Gitmoji pattern: emoji at start
-        gitmoji_pattern = r"^[\U0001F300-\U0001F9FF]|^:[a-z_]+:"
-        gitmoji_count = sum(1 for c in commits if re.match(gitmoji_pattern, c))
+        if total < 10:
+            return
 
-        # Jira/ticket pattern: ABC-123
-        ticket_pattern = r"^[A-Z]+-\d+"
-        ticket_count = sum(1 for c in commits if re.match(ticket_pattern, c))
+        conventional_count = styles["conventional"]
+        gitmoji_count = styles["gitmoji"]
+        ticket_count = styles["ticket"]
 
-        total = len(commits)
         conventional_ratio = conventional_count / total
         gitmoji_ratio = gitmoji_count / total
         ticket_ratio = ticket_count / total
@@ -131,31 +266,18 @@ class GitConventionsDetector(BaseDetector):
         result: DetectorResult,
     ) -> None:
         """Detect branch naming conventions."""
+        branches: list[str] = []
         try:
-            git_result = subprocess.run(
-                ["git", "branch", "-r"],
-                cwd=ctx.repo_root,
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if git_result.returncode != 0:
-                return
-
-            branches = [
-                b.strip().replace("origin/", "")
-                for b in git_result.stdout.strip().split("\n")
-                if b.strip() and "HEAD" not in b
-            ]
-            if len(branches) < 3:
-                return
-
-        except (subprocess.TimeoutExpired, FileNotFoundError, Exception):
+            for branch in _remote_branches(ctx.repo_root):
+                if branch and "HEAD" not in branch:
+                    branches.append(branch.replace("origin/", ""))
+        except _GIT_ERRORS:
             return
 
-        # GitFlow pattern: feature/, bugfix/, release/, hotfix/
-        gitflow_pattern = r"^(feature|bugfix|release|hotfix|develop|main|master)/"
-        gitflow_count = sum(1 for b in branches if re.match(gitflow_pattern, b))
+        if len(branches) < 3:
+            return
+
+        gitflow_count = sum(1 for b in branches if _GITFLOW_BRANCH_RE.match(b))
 
         # GitHub Flow: main + feature branches
         has_main = any(b in ("main", "master") for b in branches)
@@ -201,16 +323,13 @@ class GitConventionsDetector(BaseDetector):
     ) -> None:
         """Detect Git hooks configuration."""
         # Check for pre-commit config
-        pre_commit_config = ctx.repo_root / ".pre-commit-config.yaml"
-        has_pre_commit = pre_commit_config.is_file()
+        has_pre_commit = ctx.root_has_file(".pre-commit-config.yaml")
 
         # Check for husky (Node.js)
-        husky_dir = ctx.repo_root / ".husky"
-        has_husky = husky_dir.is_dir()
+        has_husky = ctx.root_has_dir(".husky")
 
         # Check for lefthook
-        lefthook_config = ctx.repo_root / "lefthook.yml"
-        has_lefthook = lefthook_config.is_file()
+        has_lefthook = ctx.root_has_file("lefthook.yml")
 
         hooks_tools = []
         if has_pre_commit:
@@ -226,18 +345,12 @@ class GitConventionsDetector(BaseDetector):
         # Analyze pre-commit config for hooks
         hooks_configured = []
         if has_pre_commit:
-            content = read_file_safe(pre_commit_config)
+            content = ctx.read_file(ctx.repo_root / ".pre-commit-config.yaml")
             if content:
-                if "trailing-whitespace" in content:
-                    hooks_configured.append("whitespace")
-                if "check-yaml" in content or "check-json" in content:
-                    hooks_configured.append("file validation")
-                if "black" in content or "prettier" in content or "ruff" in content:
-                    hooks_configured.append("formatting")
-                if "flake8" in content or "eslint" in content or "mypy" in content:
-                    hooks_configured.append("linting")
-                if "detect-secrets" in content or "gitleaks" in content:
-                    hooks_configured.append("secrets detection")
+                kinds = {m.lastgroup for m in _HOOK_KIND_RE.finditer(content)}
+                hooks_configured = [
+                    label for kind, label in _HOOK_KIND_LABELS.items() if kind in kinds
+                ]
 
         title = f"Git hooks: {', '.join(hooks_tools)}"
         description = f"Uses {', '.join(hooks_tools)} for Git hooks."
@@ -278,24 +391,24 @@ class GitConventionsDetector(BaseDetector):
         result: DetectorResult,
     ) -> None:
         """Detect pull request templates."""
-        search_paths = [
-            ".github/pull_request_template.md",
-            ".github/PULL_REQUEST_TEMPLATE.md",
-            "PULL_REQUEST_TEMPLATE.md",
-            "pull_request_template.md",
-            "docs/pull_request_template.md",
-        ]
-
+        # Root templates come from the shared root listing; nested ones are
+        # only probed if their top-level directory exists
         template_path = None
-        for path in search_paths:
-            candidate = ctx.repo_root / path
-            if candidate.is_file():
+        for path in _PR_TEMPLATE_PATHS:
+            top, nested, _ = path.partition("/")
+            if nested:
+                found = ctx.root_has_dir(top) and os.path.isfile(
+                    os.path.join(ctx.repo_root, path)
+                )
+            else:
+                found = ctx.root_has_file(path)
+            if found:
                 template_path = path
                 break
 
         # Check for multiple templates directory
         multi_dir = ctx.repo_root / ".github" / "PULL_REQUEST_TEMPLATE"
-        has_multiple = multi_dir.is_dir()
+        has_multiple = ctx.root_has_dir(".github") and multi_dir.is_dir()
         template_count = 0
         if has_multiple:
             template_count = sum(
@@ -309,7 +422,7 @@ class GitConventionsDetector(BaseDetector):
         # Parse sections from template
         sections: list[str] = []
         if template_path:
-            content = read_file_safe(ctx.repo_root / template_path)
+            content = ctx.read_file(ctx.repo_root / template_path)
             if content:
                 for line in content.splitlines():
                     line = line.strip()
@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 from ..base import BaseDetector, DetectorContext, DetectorResult
 from ..registry import DetectorRegistry
 
@@ -17,6 +23,60 @@ _SKIP_DIRS = {
     ".parcel-cache", ".webpack", ".rollup", "out", ".output",
 }
 
+# Manifest fields, read with regexes since there's no toml parser dependency.
+# Table headers are matched along with descriptions so that only a
+# description in one of _DESCRIPTION_TABLES is taken
+_TOML_DESCRIPTION_RE = re.compile(
+    r'^\[(?P<table>[^\]\n]*)\]|^description\s*=\s*"(?P<description>[^"]+)"', re.MULTILINE
+)
+_DESCRIPTION_TABLES = frozenset({"project", "tool.poetry", "package", "workspace.package"})
+_TOML_NAME_RE = re.compile(r'(?:^|\n)name\s*=\s*"([^"]+)"')
+_CARGO_MEMBERS_RE = re.compile(r'members\s*=\s*\[(.*?)\]', re.DOTALL)
+_QUOTED_RE = re.compile(r'"([^"]+)"')
+
+# Known top-level directory purposes
+_COMMON_DIRS = {
+    "src": "source code",
+    "lib": "library code",
+    "tests": "tests",
+    "test": "tests",
+    "docs": "documentation",
+    "doc": "documentation",
+    "scripts": "scripts",
+    "bin": "binaries/scripts",
+    "config": "configuration",
+    "configs": "configuration",
+    "examples": "examples",
+    "tools": "tooling",
+    ".github": "GitHub configuration",
+    ".circleci": "CircleCI configuration",
+    ".gitlab": "GitLab configuration",
+}
+
+# Standard root files and what they are for
+_CONFIG_FILES = {
+    "README.md": "documentation",
+    "README.rst": "documentation",
+    "LICENSE": "license",
+    "LICENSE.md": "license",
+    "LICENSE.txt": "license",
+    "LICENSE.rst": "license",
+    "CHANGES.rst": "changelog",
+    "CHANGES.md": "changelog",
+    "HISTORY.md": "changelog",
+    "HISTORY.rst": "changelog",
+    "CONTRIBUTING.md": "contributing guidelines",
+    "CHANGELOG.md": "changelog",
+    "CODE_OF_CONDUCT.md": "code of conduct",
+    ".gitignore": "git configuration",
+    ".editorconfig": "editor configuration",
+    "Makefile": "build automation",
+    "docker-compose.yml": "Docker Compose",
+    "docker-compose.yaml": "Docker Compose",
+    "Dockerfile": "Docker",
+    ".pre-commit-config.yaml": "pre-commit hooks",
+}
+
 
 @DetectorRegistry.register
 class GenericRepoLayoutDetector(BaseDetector):
@@ -29,60 +89,39 @@ class GenericRepoLayoutDetector(BaseDetector):
         """Detect common repository layout patterns."""
         result = DetectorResult()
 
-        # Known top-level directory purposes
-        common_dirs = {
-            "src": "source code",
-            "lib": "library code",
-            "tests": "tests",
-            "test": "tests",
-            "docs": "documentation",
-            "doc": "documentation",
-            "scripts": "scripts",
-            "bin": "binaries/scripts",
-            "config": "configuration",
-            "configs": "configuration",
-            "examples": "examples",
-            "tools": "tooling",
-            ".github": "GitHub configuration",
-            ".circleci": "CircleCI configuration",
-            ".gitlab": "GitLab configuration",
-        }
-
         # Get workspace descriptions for annotation
         ws_descriptions = self._get_workspace_descriptions(ctx)
 
         # Detect source directories from manifests and code markers
         source_dirs = self._detect_source_dirs(ctx)
 
-        # Build directory tree by scanning repo root children recursively
+        # Build directory tree by scanning repo root children recursively;
+        # the root comes from the shared listing, whose entries already know
+        # their type
         found_dirs = []
         tree: dict[str, dict] = {}
-        try:
-            children = sorted(ctx.repo_root.iterdir())
-        except OSError:
-            children = []
-
-        for child in children:
-            if not child.is_dir():
+        for name, entry in sorted(ctx.get_root_listing().items()):
+            if not entry.is_dir():
                 continue
-            name = child.name
             if name in _SKIP_DIRS:
                 continue
             # Include known common dirs, workspace dirs, or detected source dirs
-            if name not in common_dirs and name not in ws_descriptions and name not in source_dirs:
+            if name not in _COMMON_DIRS and name not in ws_descriptions and name not in source_dirs:
                 continue
 
             found_dirs.append(name)
             purpose = (
                 ws_descriptions.get(name)
-                or common_dirs.get(name, "")
+                or _COMMON_DIRS.get(name, "")
                 or source_dirs.get(name, "")
             )
-            subtree = self._scan_tree(child, ctx.repo_root, ws_descriptions, max_depth=3, current_depth=1)
+            subtree = self._scan_tree(
+                entry.path, name, ws_descriptions, max_depth=3, current_depth=1
+            )
             tree[name] = {"purpose": purpose, "children": subtree}
 
         if found_dirs:
-            dir_list = [f"{d} ({common_dirs.get(d, 'workspace')})" for d in found_dirs[:5]]
+            dir_list = [f"{d} ({_COMMON_DIRS.get(d, 'workspace')})" for d in found_dirs[:5]]
             description = f"Repository has standard directories: {', '.join(dir_list)}"
             if len(found_dirs) > 5:
                 description += f" and {len(found_dirs) - 5} more"
@@ -107,39 +146,13 @@ class GenericRepoLayoutDetector(BaseDetector):
                 stats=stats,
             ))
 
-        # Check for common config files
-        config_files = {
-            "README.md": "documentation",
-            "README.rst": "documentation",
-            "LICENSE": "license",
-            "LICENSE.md": "license",
-            "LICENSE.txt": "license",
-            "LICENSE.rst": "license",
-            "CHANGES.rst": "changelog",
-            "CHANGES.md": "changelog",
-            "HISTORY.md": "changelog",
-            "HISTORY.rst": "changelog",
-            "CONTRIBUTING.md": "contributing guidelines",
-            "CHANGELOG.md": "changelog",
-            "CODE_OF_CONDUCT.md": "code of conduct",
-            ".gitignore": "git configuration",
-            ".editorconfig": "editor configuration",
-            "Makefile": "build automation",
-            "docker-compose.yml": "Docker Compose",
-            "docker-compose.yaml": "Docker Compose",
-            "Dockerfile": "Docker",
-            ".pre-commit-config.yaml": "pre-commit hooks",
-        }
-
-        found_files = []
-        for file_name, purpose in config_files.items():
-            file_path = ctx.repo_root / file_name
-            if file_path.is_file():
-                found_files.append((file_name, purpose))
+        # Check for common config files. Each check is a lookup in the shared
+        # root listing, so all are made: every found file is reported, even
+        # though confidence stops growing at 9 of them
+        found_files = [name for name in _CONFIG_FILES if ctx.root_has_file(name)]
 
         if len(found_files) >= 3:
-            file_list = [f[0] for f in found_files[:5]]
-            description = f"Repository has standard files: {', '.join(file_list)}"
+            description = f"Repository has standard files: {', '.join(found_files[:5])}"
             if len(found_files) > 5:
                 description += f" and {len(found_files) - 5} more"
 
@@ -152,83 +165,82 @@ class GenericRepoLayoutDetector(BaseDetector):
                 language="generic",
                 evidence=[],
                 stats={
-                    "found_files": [f[0] for f in found_files],
+                    "found_files": found_files,
                 },
             ))
 
         return result
 
-    @classmethod
+    @staticmethod
     def _scan_tree(
-        cls,
-        directory: Path,
-        repo_root: Path,
+        directory: str,
+        rel_dir: str,
         ws_descriptions: dict[str, str],
         max_depth: int = 3,
         current_depth: int = 0,
     ) -> dict:
-        """Recursively scan directory tree, returning nested dict.
+        """Scan directory tree, returning nested dict.
+
+        rel_dir is directory's path relative to the repo root. Entries come
+        from scandir, whose DirEntry caches the file type, so only symlinks
+        need a stat to tell directories apart. The tree is walked with an
+        explicit stack; each directory's children are added in name order
+        when it is scanned, so the walk order doesn't affect the result.
 
         Returns: {child_name: {"purpose": str, "children": {nested...}}}
         """
-        if current_depth >= max_depth:
-            return {}
-
-        result: dict = {}
-        try:
-            children = sorted(directory.iterdir())
-        except OSError:
-            return {}
-
-        for child in children:
-            if not child.is_dir():
+        tree: dict = {}
+        stack = [(directory, rel_dir, current_depth, tree)]
+        while stack:
+            path, rel, depth, children = stack.pop()
+            if depth >= max_depth:
                 continue
-            name = child.name
-            if name in _SKIP_DIRS or (name.startswith(".") and current_depth > 0):
+
+            try:
+                with os.scandir(path) as it:
+                    subdirs = sorted(
+                        (entry.name, entry.path)
+                        for entry in it
+                        if entry.name not in _SKIP_DIRS
+                        and not (depth > 0 and entry.name.startswith("."))
+                        and entry.is_dir()
+                    )
+            except OSError:
                 continue
 
-            rel = str(child.relative_to(repo_root))
-            purpose = ws_descriptions.get(rel, "")
-            subtree = cls._scan_tree(child, repo_root, ws_descriptions, max_depth, current_depth + 1)
-            result[name] = {"purpose": purpose, "children": subtree}
+            for name, child_path in subdirs:
+                child_rel = f"{rel}/{name}"
+                node: dict = {"purpose": ws_descriptions.get(child_rel, ""), "children": {}}
+                children[name] = node
+                stack.append((child_path, child_rel, depth + 1, node["children"]))
 
-        return result
+        return tree
 
     @staticmethod
     def _extract_project_description(ctx: DetectorContext) -> str:
         """Extract a project description from manifest files."""
+        desc: str | None
+
         # Try package.json
-        pkg_json = ctx.repo_root / "package.json"
-        if pkg_json.is_file():
-            try:
-                data = json.loads(pkg_json.read_text())
-                desc = str(data.get("description", "")).strip('"')
-                if desc and len(desc) > 5:
-                    return desc.strip()
-            except (json.JSONDecodeError, OSError):
-                pass
+        data = ctx.get_package_json()
+        if data:
+            desc = str(data.get("description", "")).strip('"')
+            if desc and len(desc) > 5:
+                return desc.strip()
 
         # Try pyproject.toml (regex — no toml parser dependency)
-        pyproject = ctx.repo_root / "pyproject.toml"
-        if pyproject.is_file():
-            try:
-                content = pyproject.read_text()
-                m = re.search(r'(?:^|\n)description\s*=\s*"([^"]+)"', content)
-                if m and len(m.group(1)) > 5:
-                    return m.group(1).strip()
-            except OSError:
-                pass
+        content = _read_root_manifest(ctx, "pyproject.toml")
+        if content:
+            desc = _toml_description(content)
+            if desc and len(desc) > 5:
+                return desc.strip()
 
         # Try Cargo.toml
-        cargo = ctx.repo_root / "Cargo.toml"
-        if cargo.is_file():
-            try:
-                content = cargo.read_text()
-                m = re.search(r'(?:^|\n)description\s*=\s*"([^"]+)"', content)
-                if m and len(m.group(1)) > 5:
-                    return m.group(1).strip()
-            except OSError:
-                pass
+        content = _read_root_manifest(ctx, "Cargo.toml")
+        if content:
+            desc = _toml_description(content)
+            if desc and len(desc) > 5:
+                return desc.strip()
 
         return ""
 
@@ -237,54 +249,42 @@ class GenericRepoLayoutDetector(BaseDetector):
         """Detect source directories from manifest files and code markers.
 
         Finds directories that are actual source packages but don't appear in
-        the hardcoded common_dirs list (e.g. fastapi/, django/, requests/).
+        _COMMON_DIRS (e.g. fastapi/, django/, requests/).
         """
         source_dirs: dict[str, str] = {}
 
         # 1. Python: project name from pyproject.toml → matching directory
-        pyproject = ctx.repo_root / "pyproject.toml"
-        if pyproject.is_file():
-            try:
-                content = pyproject.read_text()
-                m = re.search(r'(?:^|\n)name\s*=\s*"([^"]+)"', content)
-                if m:
-                    proj_name = m.group(1)
-                    # Check both hyphenated and underscored variants
-                    for variant in {proj_name, proj_name.replace("-", "_")}:
-                        proj_dir = ctx.repo_root / variant
-                        if proj_dir.is_dir():
-                            source_dirs[variant] = "source code"
-            except OSError:
-                pass
+        content = _read_root_manifest(ctx, "pyproject.toml")
+        if content:
+            m = _TOML_NAME_RE.search(content)
+            if m:
+                proj_name = m.group(1)
+                # Check both hyphenated and underscored variants
+                for variant in {proj_name, proj_name.replace("-", "_")}:
+                    if ctx.root_has_dir(variant):
+                        source_dirs[variant] = "source code"
 
         # 2. Rust: workspace members from Cargo.toml
-        cargo = ctx.repo_root / "Cargo.toml"
-        if cargo.is_file():
-            try:
-                content = cargo.read_text()
-                m = re.search(r'members\s*=\s*\[(.*?)\]', content, re.DOTALL)
-                if m:
-                    for member in re.findall(r'"([^"]+)"', m.group(1)):
-                        member_path = member.rstrip("/*")
-                        member_dir = ctx.repo_root / member_path
-                        if member_dir.is_dir():
-                            source_dirs[member_path] = "workspace member"
-            except OSError:
-                pass
+        content = _read_root_manifest(ctx, "Cargo.toml")
+        if content:
+            m = _CARGO_MEMBERS_RE.search(content)
+            if m:
+                for member in _QUOTED_RE.findall(m.group(1)):
+                    member_path = member.rstrip("/*")
+                    member_dir = ctx.repo_root / member_path
+                    if member_dir.is_dir():
+                        source_dirs[member_path] = "workspace member"
 
         # 3. Any top-level directory containing __init__.py (Python package)
-        try:
-            for child in ctx.repo_root.iterdir():
-                if (
-                    child.is_dir()
-                    and not child.name.startswith(".")
-                    and child.name not in _SKIP_DIRS
-                    and child.name not in source_dirs
-                    and (child / "__init__.py").exists()
-                ):
-                    source_dirs[child.name] = "source code"
-        except OSError:
-            pass
+        for name, entry in ctx.get_root_listing().items():
+            if (
+                entry.is_dir()
+                and not name.startswith(".")
+                and name not in _SKIP_DIRS
+                and name not in source_dirs
+                and os.path.exists(os.path.join(entry.path, "__init__.py"))
+            ):
+                source_dirs[name] = "source code"
 
         return source_dirs
 
@@ -292,47 +292,61 @@ class GenericRepoLayoutDetector(BaseDetector):
     def _get_workspace_descriptions(ctx: DetectorContext) -> dict[str, str]:
         """Build a map of directory relative paths to descriptions from workspace configs."""
         descriptions: dict[str, str] = {}
-        pkg_json = ctx.repo_root / "package.json"
-        if pkg_json.is_file():
-            try:
-                data = json.loads(pkg_json.read_text())
-                workspaces = data.get("workspaces", [])
-                if isinstance(workspaces, dict):
-                    workspaces = workspaces.get("packages", [])
-                for pattern in workspaces:
-                    if pattern.endswith("/*"):
-                        # Glob pattern — resolve to actual child directories
-                        parent = ctx.repo_root / pattern[:-2]
-                        if parent.is_dir():
-                            try:
-                                for child in sorted(parent.iterdir()):
-                                    if child.is_dir() and not child.name.startswith("."):
-                                        rel = str(child.relative_to(ctx.repo_root))
-                                        desc = _read_pkg_description(child)
-                                        descriptions[rel] = desc
-                                        # Also register the parent as a workspace root
-                                        parent_rel = pattern[:-2]
-                                        if parent_rel not in descriptions:
-                                            descriptions[parent_rel] = ""
-                            except OSError:
-                                pass
-                    else:
-                        ws_dir = ctx.repo_root / pattern
-                        if ws_dir.is_dir():
-                            desc = _read_pkg_description(ws_dir)
-                            descriptions[pattern] = desc
-            except (json.JSONDecodeError, OSError):
-                pass
+        data = ctx.get_package_json()
+        if data:
+            workspaces = data.get("workspaces", [])
+            if isinstance(workspaces, dict):
+                workspaces = workspaces.get("packages", [])
+            for pattern in workspaces:
+                if pattern.endswith("/*"):
+                    # Glob pattern — resolve to actual child directories
+                    parent = ctx.repo_root / pattern[:-2]
+                    if parent.is_dir():
+                        try:
+                            for child in sorted(parent.iterdir()):
+                                if child.is_dir() and not child.name.startswith("."):
+                                    rel = str(child.relative_to(ctx.repo_root))
+                                    desc = _read_pkg_description(child)
+                                    descriptions[rel] = desc
+                                    # Also register the parent as a workspace root
+                                    parent_rel = pattern[:-2]
+                                    if parent_rel not in descriptions:
+                                        descriptions[parent_rel] = ""
+                        except OSError:
+                            pass
+                else:
+                    ws_dir = ctx.repo_root / pattern
+                    if ws_dir.is_dir():
+                        desc = _read_pkg_description(ws_dir)
+                        descriptions[pattern] = desc
         return descriptions
 
 
+def _toml_description(content: str) -> str | None:
+    """Get the description from a manifest's project or package table."""
+    table = ""
+    for m in _TOML_DESCRIPTION_RE.finditer(content):
+        if m.lastgroup == "table":
+            table = m.group("table").strip()
+        elif table in _DESCRIPTION_TABLES:
+            return m.group("description")
+    return None
+
+
+def _read_root_manifest(ctx: DetectorContext, name: str) -> str | None:
+    """Read a manifest in the repo root, if the root listing has it."""
+    if not ctx.root_has_file(name):
+        return None
+    return ctx.read_file(ctx.repo_root / name)
+
+
 def _read_pkg_description(directory: Path) -> str:
     """Read description from a package.json in the given directory."""
-    pkg = directory / "package.json"
-    if pkg.is_file():
-        try:
-            data = json.loads(pkg.read_text())
-            return (data.get("description", "") or "").strip('"')
-        except (json.JSONDecodeError, OSError):
-            pass
-    return ""
+    try:
+        raw = (directory / "package.json").read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (ValueError, OSError):
+        return ""
+    if not isinstance(data, dict):
+        return ""
+    return (data.get("description", "") or "").strip('"')
@@ -5,13 +5,46 @@ Detects and parses Makefile, package.json scripts, Taskfile, and justfile.
 
 from __future__ import annotations
 
-import json
+import io
 import re
+from itertools import islice
 
-from ...fs import read_file_safe
 from ..base import BaseDetector, DetectorContext, DetectorResult
 from ..registry import DetectorRegistry
 
+# Runners by preference for the primary one: Makefile > Taskfile >
+# justfile > package.json scripts
+_RUNNER_PRIORITY = ("makefile", "taskfile", "justfile", "package_json")
+
+_RUNNER_LABELS = {
+    "makefile": "Makefile",
+    "package_json": "package.json scripts",
+    "taskfile": "Taskfile",
+    "justfile": "justfile",
+}
+
+# Makefile lines scanned for targets
+_MAKEFILE_MAX_LINES = 500
+
+# Makefile target line: "name: [dependencies]". Internal targets starting
+# with "_", special ones like .PHONY and "NAME := value" assignments don't
+# match
+_MAKE_TARGET_RE = re.compile(r"^([a-zA-Z][\w-]*)\s*:(?!=)")
+
+# Indent of task names under the top-level Taskfile tasks: key
+_TASK_INDENT = 2
+
+# justfile recipe line: "[@]name [args]:". Assignments such as
+# "name := value", "export NAME := value" and "set shell := [...]" don't
+# match, as their first colon starts ":="
+_JUST_RECIPE_RE = re.compile(r"^@?(\w[\w-]*)\s*(?:[^:]*)?:(?!=)")
+
+
+def _is_task_name(name: str) -> bool:
+    """Check a Taskfile task name is a word character followed by words or "-"."""
+    # str.isalnum() is true exactly for regex \w characters other than "_"
+    return name[:1] not in ("", "-") and name.replace("-", "0").replace("_", "0").isalnum()
+
 
 @DetectorRegistry.register
 class TaskRunnerDetector(BaseDetector):
@@ -35,23 +68,12 @@ class TaskRunnerDetector(BaseDetector):
             return result
 
         total = sum(len(v) for v in targets.values())
-        runners = sorted(targets.keys())
-
-        # Primary runner: prefer Makefile > Taskfile > justfile > package_json
-        priority = ["makefile", "taskfile", "justfile", "package_json"]
-        primary = runners[0]
-        for p in priority:
-            if p in runners:
-                primary = p
-                break
+        runners = sorted(targets)
 
-        runner_labels = {
-            "makefile": "Makefile",
-            "package_json": "package.json scripts",
-            "taskfile": "Taskfile",
-            "justfile": "justfile",
-        }
-        runner_strs = [runner_labels.get(r, r) for r in runners]
+        # Every runner has a priority, so the first one found is the primary
+        primary = next(runner for runner in _RUNNER_PRIORITY if runner in targets)
+
+        runner_strs = [_RUNNER_LABELS[r] for r in runners]
 
         description = (
             f"Task runners detected: {', '.join(runner_strs)}. "
@@ -84,39 +106,32 @@ class TaskRunnerDetector(BaseDetector):
         targets: dict[str, list[dict[str, str]]],
     ) -> None:
         """Parse Makefile targets."""
-        makefile = ctx.repo_root / "Makefile"
-        if not makefile.is_file():
+        if not ctx.root_has_file("Makefile"):
             return
 
-        content = read_file_safe(makefile)
+        content = ctx.read_file(ctx.repo_root / "Makefile")
         if not content:
             return
 
-        lines = content.splitlines()
         found: list[dict[str, str]] = []
 
-        for i, line in enumerate(lines[:500]):
+        # Lines are read lazily, keeping the previous one for its comment
+        prev = ""
+        for line in islice(io.StringIO(content), _MAKEFILE_MAX_LINES):
             # Match target lines: target_name: [dependencies]
-            match = re.match(r"^([a-zA-Z_][\w-]*)\s*:", line)
-            if not match:
-                continue
+            match = _MAKE_TARGET_RE.match(line)
+            if match:
+                # Look for comment description on preceding line
+                desc = ""
+                comment = prev.strip()
+                if comment.startswith("## "):
+                    desc = comment[3:].strip()
+                elif comment.startswith("# "):
+                    desc = comment[2:].strip()
 
-            name = match.group(1)
+                found.append({"name": match.group(1), "description": desc})
 
-            # Skip internal/special targets
-            if name.startswith("_") or name.startswith("."):
-                continue
-
-            # Look for comment description on preceding line
-            desc = ""
-            if i > 0:
-                prev = lines[i - 1].strip()
-                if prev.startswith("## "):
-                    desc = prev[3:].strip()
-                elif prev.startswith("# "):
-                    desc = prev[2:].strip()
-
-            found.append({"name": name, "description": desc})
+            prev = line
 
         if found:
             targets["makefile"] = found
@@ -127,17 +142,8 @@ class TaskRunnerDetector(BaseDetector):
         targets: dict[str, list[dict[str, str]]],
     ) -> None:
         """Parse package.json scripts."""
-        pkg_json = ctx.repo_root / "package.json"
-        if not pkg_json.is_file():
-            return
-
-        content = read_file_safe(pkg_json)
-        if not content:
-            return
-
-        try:
-            data = json.loads(content)
-        except (json.JSONDecodeError, ValueError):
+        data = ctx.get_package_json()
+        if data is None:
             return
 
         scripts = data.get("scripts", {})
@@ -159,33 +165,30 @@ class TaskRunnerDetector(BaseDetector):
         """Parse Taskfile.yml tasks."""
         taskfile = None
         for name in ("Taskfile.yml", "Taskfile.yaml", "taskfile.yml", "taskfile.yaml"):
-            candidate = ctx.repo_root / name
-            if candidate.is_file():
-                taskfile = candidate
+            if ctx.root_has_file(name):
+                taskfile = name
                 break
 
         if taskfile is None:
             return
 
-        content = read_file_safe(taskfile)
+        content = ctx.read_file(ctx.repo_root / taskfile)
         if not content:
             return
 
-        lines = content.splitlines()
         found: list[dict[str, str]] = []
 
         in_tasks = False
         current_task: str | None = None
         current_desc = ""
-        indent_level = 0
 
-        for line in lines:
+        # Lines keep their newline; the checks below allow for it
+        for line in io.StringIO(content):
             stripped = line.strip()
 
             # Detect the tasks: top-level key
-            if re.match(r"^tasks:\s*$", line):
+            if stripped == "tasks:" and line.startswith("tasks:"):
                 in_tasks = True
-                indent_level = len(line) - len(line.lstrip()) + 2
                 continue
 
             if not in_tasks:
@@ -195,23 +198,26 @@ class TaskRunnerDetector(BaseDetector):
             if line and not line[0].isspace() and not line.startswith(" "):
                 break
 
-            # Task name at the expected indent level
-            task_match = re.match(r"^(\s+)(\w[\w-]*):\s*$", line)
-            if task_match:
-                leading = len(task_match.group(1))
-                if leading == indent_level:
+            # Task name: an indented "name:" line; only names at the tasks
+            # indent level start a new task
+            if stripped.endswith(":") and _is_task_name(stripped[:-1]):
+                if len(line) - len(line.lstrip()) == _TASK_INDENT:
                     # Save previous task
                     if current_task:
                         found.append({"name": current_task, "description": current_desc})
-                    current_task = task_match.group(2)
+                    current_task = stripped[:-1]
                     current_desc = ""
                 continue
 
-            # Description line under current task
+            # Description line under current task, minus one pair of quotes
             if current_task and stripped.startswith("desc:"):
-                desc_match = re.match(r"desc:\s*['\"]?(.+?)['\"]?\s*$", stripped)
-                if desc_match:
-                    current_desc = desc_match.group(1)
+                desc = stripped[5:].lstrip()
+                if len(desc) > 1 and desc[0] in "'\"":
+                    desc = desc[1:]
+                if len(desc) > 1 and desc[-1] in "'\"":
+                    desc = desc[:-1]
+                if desc:
+                    current_desc = desc
 
         # Save last task
         if current_task:
@@ -228,41 +234,34 @@ class TaskRunnerDetector(BaseDetector):
         """Parse justfile recipes."""
         justfile = None
         for name in ("justfile", "Justfile", ".justfile"):
-            candidate = ctx.repo_root / name
-            if candidate.is_file():
-                justfile = candidate
+            if ctx.root_has_file(name):
+                justfile = name
                 break
 
         if justfile is None:
             return
 
-        content = read_file_safe(justfile)
+        content = ctx.read_file(ctx.repo_root / justfile)
         if not content:
             return
 
-        lines = content.splitlines()
         found: list[dict[str, str]] = []
 
-        for i, line in enumerate(lines):
+        # Lines are read lazily, keeping the previous one for its comment
+        prev = ""
+        for line in io.StringIO(content):
             # Recipe line: name [args]:
-            match = re.match(r"^@?(\w[\w-]*)\s*(?:[^:]*)?:", line)
-            if not match:
-                continue
-
-            name = match.group(1)
-
-            # Skip if it looks like a variable assignment (name := value)
-            if ":=" in line.split(":")[0]:
-                continue
+            match = _JUST_RECIPE_RE.match(line)
+            if match:
+                # Look for comment description on preceding line
+                desc = ""
+                comment = prev.strip()
+                if comment.startswith("# "):
+                    desc = comment[2:].strip()
 
-            # Look for comment description on preceding line
-            desc = ""
-            if i > 0:
-                prev = lines[i - 1].strip()
-                if prev.startswith("# "):
-                    desc = prev[2:].strip()
+                found.append({"name": match.group(1), "description": desc})
 
-            found.append({"name": name, "description": desc})
+            prev = line
 
         if found:
             targets["justfile"] = found
@@ -1,26 +1,55 @@
 """Go convention detectors package."""
 
-from .api import GoAPIDetector
-from .architecture import GoArchitectureDetector
-from .base import GoDetector
-from .cli import GoCLIDetector
-from .codegen import GoCodegenDetector
-from .concurrency import GoConcurrencyDetector
+from __future__ import annotations
 
-# Import all detector classes to ensure they register
-from .conventions import GoConventionsDetector
-from .data_flow import GoDataFlowDetector
-from .di import GoDIDetector
-from .documentation import GoDocumentationDetector
-from .errors import GoErrorHandlingDetector
-from .grpc import GoGRPCDetector
-from .index import GoIndex, make_evidence
-from .logging import GoLoggingDetector
-from .migrations import GoMigrationsDetector
-from .modules import GoModulesDetector
-from .patterns import GoPatternsDetector
-from .security import GoSecurityDetector
-from .testing import GoTestingDetector
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import GoAPIDetector
+    from .architecture import GoArchitectureDetector
+    from .base import GoDetector
+    from .cli import GoCLIDetector
+    from .codegen import GoCodegenDetector
+    from .concurrency import GoConcurrencyDetector
+    from .conventions import GoConventionsDetector
+    from .data_flow import GoDataFlowDetector
+    from .di import GoDIDetector
+    from .documentation import GoDocumentationDetector
+    from .errors import GoErrorHandlingDetector
+    from .grpc import GoGRPCDetector
+    from .index import GoIndex, make_evidence
+    from .logging import GoLoggingDetector
+    from .migrations import GoMigrationsDetector
+    from .modules import GoModulesDetector
+    from .patterns import GoPatternsDetector
+    from .security import GoSecurityDetector
+    from .testing import GoTestingDetector
+
+# Detector modules are imported on first access (PEP 562) so that loading
+# one detector does not import the rest of the package.
+_LAZY_IMPORTS = {
+    "GoAPIDetector": ".api",
+    "GoArchitectureDetector": ".architecture",
+    "GoDetector": ".base",
+    "GoCLIDetector": ".cli",
+    "GoCodegenDetector": ".codegen",
+    "GoConcurrencyDetector": ".concurrency",
+    "GoConventionsDetector": ".conventions",
+    "GoDataFlowDetector": ".data_flow",
+    "GoDIDetector": ".di",
+    "GoDocumentationDetector": ".documentation",
+    "GoErrorHandlingDetector": ".errors",
+    "GoGRPCDetector": ".grpc",
+    "GoIndex": ".index",
+    "make_evidence": ".index",
+    "GoLoggingDetector": ".logging",
+    "GoMigrationsDetector": ".migrations",
+    "GoModulesDetector": ".modules",
+    "GoPatternsDetector": ".patterns",
+    "GoSecurityDetector": ".security",
+    "GoTestingDetector": ".testing",
+}
 
 __all__ = [
     "GoIndex",
@@ -44,3 +73,10 @@ __all__ = [
     "GoCodegenDetector",
     "GoDataFlowDetector",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
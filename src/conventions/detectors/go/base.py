@@ -13,9 +13,9 @@ class GoDetector(BaseDetector):
 
     def get_index(self, ctx: DetectorContext) -> GoIndex:
         """Get or create Go index."""
-        if "go_index" not in ctx.cache or ctx.cache["go_index"] is None:
+        def build() -> GoIndex:
             index = GoIndex(ctx.repo_root, max_files=ctx.max_files)
             index.build()
-            ctx.cache["go_index"] = index
-        result: GoIndex = ctx.cache["go_index"]
-        return result
+            return index
+
+        return ctx.get_cached("go_index", build)
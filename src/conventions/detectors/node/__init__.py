@@ -1,32 +1,67 @@
 """Node.js convention detectors package."""
 
-from .api import NodeAPIDetector
-from .architecture import NodeArchitectureDetector
-from .async_patterns import NodeAsyncPatternsDetector
-from .auth import NodeAuthDetector
-from .base import NodeDetector
-from .build_tools import NodeBuildToolsDetector
-from .codegen import NodeCodeGenDetector
+from __future__ import annotations
 
-# Import all detector classes to ensure they register
-from .conventions import NodeConventionsDetector
-from .data_flow import NodeDataFlowDetector
-from .documentation import NodeDocumentationDetector
-from .errors import NodeErrorHandlingDetector
-from .formatting import NodeFormattingDetector
-from .frontend import NodeFrontendDetector
-from .index import NodeIndex, make_evidence
-from .linting import NodeLintingDetector
-from .logging import NodeLoggingDetector
-from .migrations import NodeMigrationsDetector
-from .monorepo import NodeMonorepoDetector
-from .naming import NodeNamingDetector
-from .package_manager import NodePackageManagerDetector
-from .patterns import NodePatternsDetector
-from .security import NodeSecurityDetector
-from .state_management import NodeStateManagementDetector
-from .testing import NodeTestingDetector
-from .typescript import NodeTypeScriptDetector
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api import NodeAPIDetector
+    from .architecture import NodeArchitectureDetector
+    from .async_patterns import NodeAsyncPatternsDetector
+    from .auth import NodeAuthDetector
+    from .base import NodeDetector
+    from .build_tools import NodeBuildToolsDetector
+    from .codegen import NodeCodeGenDetector
+    from .conventions import NodeConventionsDetector
+    from .data_flow import NodeDataFlowDetector
+    from .documentation import NodeDocumentationDetector
+    from .errors import NodeErrorHandlingDetector
+    from .formatting import NodeFormattingDetector
+    from .frontend import NodeFrontendDetector
+    from .index import NodeIndex, make_evidence
+    from .linting import NodeLintingDetector
+    from .logging import NodeLoggingDetector
+    from .migrations import NodeMigrationsDetector
+    from .monorepo import NodeMonorepoDetector
+    from .naming import NodeNamingDetector
+    from .package_manager import NodePackageManagerDetector
+    from .patterns import NodePatternsDetector
+    from .security import NodeSecurityDetector
+    from .state_management import NodeStateManagementDetector
+    from .testing import NodeTestingDetector
+    from .typescript import NodeTypeScriptDetector
+
+# Detector modules are imported on first access (PEP 562) so that loading
+# one detector does not import the rest of the package.
+_LAZY_IMPORTS = {
+    "NodeAPIDetector": ".api",
+    "NodeArchitectureDetector": ".architecture",
+    "NodeAsyncPatternsDetector": ".async_patterns",
+    "NodeAuthDetector": ".auth",
+    "NodeDetector": ".base",
+    "NodeBuildToolsDetector": ".build_tools",
+    "NodeCodeGenDetector": ".codegen",
+    "NodeConventionsDetector": ".conventions",
+    "NodeDataFlowDetector": ".data_flow",
+    "NodeDocumentationDetector": ".documentation",
+    "NodeErrorHandlingDetector": ".errors",
+    "NodeFormattingDetector": ".formatting",
+    "NodeFrontendDetector": ".frontend",
+    "NodeIndex": ".index",
+    "make_evidence": ".index",
+    "NodeLintingDetector": ".linting",
+    "NodeLoggingDetector": ".logging",
+    "NodeMigrationsDetector": ".migrations",
+    "NodeMonorepoDetector": ".monorepo",
+    "NodeNamingDetector": ".naming",
+    "NodePackageManagerDetector": ".package_manager",
+    "NodePatternsDetector": ".patterns",
+    "NodeSecurityDetector": ".security",
+    "NodeStateManagementDetector": ".state_management",
+    "NodeTestingDetector": ".testing",
+    "NodeTypeScriptDetector": ".typescript",
+}
 
 __all__ = [
     "NodeIndex",
@@ -56,3 +91,10 @@ __all__ = [
     "NodeDataFlowDetector",
     "NodeMigrationsDetector",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
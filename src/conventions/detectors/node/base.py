@@ -13,10 +13,10 @@ class NodeDetector(BaseDetector):
 
     def get_index(self, ctx: DetectorContext) -> NodeIndex:
         """Get or create Node.js index."""
-        # Cache on context
-        if "node_index" not in ctx.cache or ctx.cache["node_index"] is None:
+        def build() -> NodeIndex:
             index = NodeIndex(ctx.repo_root, max_files=ctx.max_files)
             index.build()
-            ctx.cache["node_index"] = index
-        result: NodeIndex = ctx.cache["node_index"]
-        return result
+            return index
+
+        # Cache on context
+        return ctx.get_cached("node_index", build)
@@ -24,65 +24,59 @@ class NodeMonorepoDetector(NodeDetector):
         tools: dict[str, dict] = {}
 
         # Check for Turborepo
-        if (ctx.repo_root / "turbo.json").exists():
+        if ctx.root_has_file("turbo.json"):
             tools["turborepo"] = {
                 "name": "Turborepo",
                 "config_file": "turbo.json",
             }
 
         # Check for Lerna
-        if (ctx.repo_root / "lerna.json").exists():
+        if ctx.root_has_file("lerna.json"):
             tools["lerna"] = {
                 "name": "Lerna",
                 "config_file": "lerna.json",
             }
 
         # Check for Nx
-        if (ctx.repo_root / "nx.json").exists():
+        if ctx.root_has_file("nx.json"):
             tools["nx"] = {
                 "name": "Nx",
                 "config_file": "nx.json",
             }
-        elif (ctx.repo_root / "workspace.json").exists():
+        elif ctx.root_has_file("workspace.json"):
             tools["nx"] = {
                 "name": "Nx",
                 "config_file": "workspace.json",
             }
 
         # Check for Rush
-        if (ctx.repo_root / "rush.json").exists():
+        if ctx.root_has_file("rush.json"):
             tools["rush"] = {
                 "name": "Rush",
                 "config_file": "rush.json",
             }
 
         # Check package.json for workspaces
-        pkg_json_path = ctx.repo_root / "package.json"
         workspace_patterns = []
 
-        if pkg_json_path.exists():
-            try:
-                pkg_data = json.loads(pkg_json_path.read_text())
-
-                # npm/yarn workspaces
-                workspaces = pkg_data.get("workspaces")
-                if workspaces:
-                    if isinstance(workspaces, list):
-                        workspace_patterns = workspaces
-                    elif isinstance(workspaces, dict):
-                        workspace_patterns = workspaces.get("packages", [])
-
-                    if not tools:
-                        tools["npm_workspaces"] = {
-                            "name": "npm/Yarn workspaces",
-                            "patterns": workspace_patterns,
-                        }
-            except (json.JSONDecodeError, OSError):
-                pass
+        pkg_data = ctx.get_package_json()
+        if pkg_data:
+            # npm/yarn workspaces
+            workspaces = pkg_data.get("workspaces")
+            if workspaces:
+                if isinstance(workspaces, list):
+                    workspace_patterns = workspaces
+                elif isinstance(workspaces, dict):
+                    workspace_patterns = workspaces.get("packages", [])
+
+                if not tools:
+                    tools["npm_workspaces"] = {
+                        "name": "npm/Yarn workspaces",
+                        "patterns": workspace_patterns,
+                    }
 
         # Check for pnpm workspaces
-        pnpm_workspace = ctx.repo_root / "pnpm-workspace.yaml"
-        if pnpm_workspace.exists():
+        if ctx.root_has_file("pnpm-workspace.yaml"):
             tools["pnpm_workspaces"] = {
                 "name": "pnpm workspaces",
                 "config_file": "pnpm-workspace.yaml",
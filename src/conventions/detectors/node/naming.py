@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import heapq
 import re
 from collections import Counter
+from operator import itemgetter
 from pathlib import Path
 
 from ..base import DetectorContext, DetectorResult
@@ -135,7 +137,8 @@ class NodeNamingDetector(NodeDetector):
                 confidence = 0.7
         else:
             title = "Inconsistent file naming"
-            breakdown = ", ".join(f"{k}: {v}" for k, v in sorted(countable.items(), key=lambda x: -x[1])[:3])
+            top = heapq.nlargest(3, countable.items(), key=itemgetter(1))
+            breakdown = ", ".join(f"{k}: {v}" for k, v in top)
             description = f"No dominant file naming convention. {breakdown}."
             confidence = 0.65
 
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import os
+import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Callable, Optional
 
 from ..schemas import ConventionRule, ConventionsOutput, DetectorWarning, RepoMetadata
-from .base import DetectorContext
-from .registry import DetectorRegistry, register_all_detectors
+from .base import BaseDetector, DetectorContext, DetectorResult
+from .registry import DETECTOR_MANIFEST, DetectorRegistry, load_detector, select_detectors
+
+# Detectors that may run at once; they mostly wait on file reads and git
+_DETECTOR_WORKERS = min(32, os.cpu_count() or 1)
 
 
 def detect_languages(repo_root: Path, exclude_patterns: Optional[list[str]] = None) -> set[str]:
@@ -74,9 +81,6 @@ def run_detectors(
     disabled_detectors = disabled_detectors or set()
     disabled_rules = disabled_rules or set()
 
-    # Register all detectors
-    register_all_detectors()
-
     # Load plugins if specified
     if plugin_paths:
         try:
@@ -105,8 +109,25 @@ def run_detectors(
     all_warnings: list[DetectorWarning] = []
     total_files_scanned = 0
 
-    # Run each detector
-    for detector_class in DetectorRegistry.get_all():
+    # Import only the built-in detectors that can run, then any plugins
+    if progress_callback:
+        for name in DETECTOR_MANIFEST:
+            if name in disabled_detectors:
+                progress_callback(f"Skipping disabled detector: {name}")
+    detector_classes = [
+        load_detector(name) for name in select_detectors(languages, disabled_detectors)
+    ]
+    builtin = {
+        (f"{__package__}{module_name}", class_name)
+        for module_name, class_name, _ in DETECTOR_MANIFEST.values()
+    }
+    detector_classes.extend(
+        cls for cls in DetectorRegistry.get_all()
+        if (cls.__module__, cls.__name__) not in builtin
+    )
+
+    detectors: list[BaseDetector] = []
+    for detector_class in detector_classes:
         detector = detector_class()
 
         # Skip disabled detectors
@@ -115,38 +136,56 @@ def run_detectors(
                 progress_callback(f"Skipping disabled detector: {detector.name}")
             continue
 
-        if not detector.should_run(ctx):
-            continue
+        if detector.should_run(ctx):
+            detectors.append(detector)
+
+    # Progress is reported from the worker threads as each detector starts
+    # and finishes, so messages are serialized through a lock
+    progress_lock = threading.Lock()
 
+    def report(message: str) -> None:
         if progress_callback:
-            progress_callback(f"Running detector: {detector.name}")
+            with progress_lock:
+                progress_callback(message)
 
+    def run(detector: BaseDetector) -> tuple[Optional[DetectorResult], Optional[Exception], str]:
+        report(f"Running detector: {detector.name}")
+        start = time.perf_counter()
         try:
             result = detector.detect(ctx)
-
-            # Filter out disabled rules
-            for rule in result.rules:
-                if rule.id not in disabled_rules:
-                    all_rules.append(rule)
-                elif progress_callback:
-                    progress_callback(f"Skipping disabled rule: {rule.id}")
-
-            # Convert string warnings to DetectorWarning objects
-            for warning_msg in result.warnings:
-                all_warnings.append(DetectorWarning(
-                    detector=detector.name,
-                    message=warning_msg,
-                ))
-
         except Exception as e:
+            report(f"Warning: {detector.name} failed - {e}")
+            return None, e, traceback.format_exc()
+        report(f"Finished detector: {detector.name} ({time.perf_counter() - start:.2f}s)")
+        return result, None, ""
+
+    # Detectors are independent, so they run concurrently and share the
+    # context's caches; results are merged in run order
+    with ThreadPoolExecutor(max_workers=_DETECTOR_WORKERS) as executor:
+        outcomes = list(executor.map(run, detectors))
+
+    for detector, (result, error, tb) in zip(detectors, outcomes):
+        if result is None:
             # Capture exception as warning and continue
-            tb = traceback.format_exc()
             all_warnings.append(DetectorWarning(
                 detector=detector.name,
-                message=f"Detector failed with exception: {e}\n{tb}",
+                message=f"Detector failed with exception: {error}\n{tb}",
+            ))
+            continue
+
+        # Filter out disabled rules
+        for rule in result.rules:
+            if rule.id not in disabled_rules:
+                all_rules.append(rule)
+            elif progress_callback:
+                progress_callback(f"Skipping disabled rule: {rule.id}")
+
+        # Convert string warnings to DetectorWarning objects
+        for warning_msg in result.warnings:
+            all_warnings.append(DetectorWarning(
+                detector=detector.name,
+                message=warning_msg,
             ))
-            if progress_callback:
-                progress_callback(f"Warning: {detector.name} failed - {e}")
 
     # Get file count from Python index if available
     if ctx._python_index is not None:
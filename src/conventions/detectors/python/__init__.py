@@ -1,41 +1,85 @@
 """Python convention detectors package."""
 
-from .api_response_patterns import PythonAPIResponsePatternsDetector
-from .api_schema import PythonAPISchemaConventionsDetector
-from .architecture import PythonLayeringConventionsDetector
-from .async_concurrency import PythonAsyncConventionsDetector
-from .background_tasks import PythonBackgroundTaskDetector
-from .caching import PythonCachingDetector
-from .class_patterns import PythonClassPatternsDetector
-from .cli_patterns import PythonCLIPatternDetector
-from .code_style import PythonCodeStyleDetector
-from .constants_enums import PythonConstantsEnumsDetector
-from .data_flow import PythonDataFlowDetector
-from .db import PythonDBConventionsDetector
-from .decorator_patterns import PythonDecoratorPatternsDetector
-from .dependency_management import PythonDependencyManagementDetector
-from .di_patterns import PythonDIConventionsDetector
-from .docs_conventions import PythonDocsConventionsDetector
-from .documentation import PythonDocstringNamingConventionsDetector
-from .errors import PythonErrorConventionsDetector
-from .feature_flags import PythonFeatureFlagsDetector
-from .graphql import PythonGraphQLDetector
-from .index import PythonIndex, make_evidence
-from .logging import PythonLoggingConventionsDetector
-from .messaging import PythonMessagingDetector
-from .observability import PythonObservabilityConventionsDetector
-from .resilience import PythonResilienceConventionsDetector
-from .resource_management import PythonResourceManagementDetector
-from .return_patterns import PythonReturnPatternsDetector
-from .security import PythonSecurityConventionsDetector
-from .serialization import PythonSerializationDetector
-from .test_conventions import PythonTestConventionsDetector
-from .test_organization import PythonTestOrganizationDetector
-from .tooling import PythonToolingDetector
+from __future__ import annotations
 
-# Import all detector classes to ensure they register
-from .typing import PythonTypingConventionsDetector
-from .validation_patterns import PythonValidationPatternsDetector
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api_response_patterns import PythonAPIResponsePatternsDetector
+    from .api_schema import PythonAPISchemaConventionsDetector
+    from .architecture import PythonLayeringConventionsDetector
+    from .async_concurrency import PythonAsyncConventionsDetector
+    from .background_tasks import PythonBackgroundTaskDetector
+    from .caching import PythonCachingDetector
+    from .class_patterns import PythonClassPatternsDetector
+    from .cli_patterns import PythonCLIPatternDetector
+    from .code_style import PythonCodeStyleDetector
+    from .constants_enums import PythonConstantsEnumsDetector
+    from .data_flow import PythonDataFlowDetector
+    from .db import PythonDBConventionsDetector
+    from .decorator_patterns import PythonDecoratorPatternsDetector
+    from .dependency_management import PythonDependencyManagementDetector
+    from .di_patterns import PythonDIConventionsDetector
+    from .docs_conventions import PythonDocsConventionsDetector
+    from .documentation import PythonDocstringNamingConventionsDetector
+    from .errors import PythonErrorConventionsDetector
+    from .feature_flags import PythonFeatureFlagsDetector
+    from .graphql import PythonGraphQLDetector
+    from .index import PythonIndex, make_evidence
+    from .logging import PythonLoggingConventionsDetector
+    from .messaging import PythonMessagingDetector
+    from .observability import PythonObservabilityConventionsDetector
+    from .resilience import PythonResilienceConventionsDetector
+    from .resource_management import PythonResourceManagementDetector
+    from .return_patterns import PythonReturnPatternsDetector
+    from .security import PythonSecurityConventionsDetector
+    from .serialization import PythonSerializationDetector
+    from .test_conventions import PythonTestConventionsDetector
+    from .test_organization import PythonTestOrganizationDetector
+    from .tooling import PythonToolingDetector
+    from .typing import PythonTypingConventionsDetector
+    from .validation_patterns import PythonValidationPatternsDetector
+
+# Detector modules are imported on first access (PEP 562) so that loading
+# one detector does not import the rest of the package.
+_LAZY_IMPORTS = {
+    "PythonAPIResponsePatternsDetector": ".api_response_patterns",
+    "PythonAPISchemaConventionsDetector": ".api_schema",
+    "PythonLayeringConventionsDetector": ".architecture",
+    "PythonAsyncConventionsDetector": ".async_concurrency",
+    "PythonBackgroundTaskDetector": ".background_tasks",
+    "PythonCachingDetector": ".caching",
+    "PythonClassPatternsDetector": ".class_patterns",
+    "PythonCLIPatternDetector": ".cli_patterns",
+    "PythonCodeStyleDetector": ".code_style",
+    "PythonConstantsEnumsDetector": ".constants_enums",
+    "PythonDataFlowDetector": ".data_flow",
+    "PythonDBConventionsDetector": ".db",
+    "PythonDecoratorPatternsDetector": ".decorator_patterns",
+    "PythonDependencyManagementDetector": ".dependency_management",
+    "PythonDIConventionsDetector": ".di_patterns",
+    "PythonDocsConventionsDetector": ".docs_conventions",
+    "PythonDocstringNamingConventionsDetector": ".documentation",
+    "PythonErrorConventionsDetector": ".errors",
+    "PythonFeatureFlagsDetector": ".feature_flags",
+    "PythonGraphQLDetector": ".graphql",
+    "PythonIndex": ".index",
+    "make_evidence": ".index",
+    "PythonLoggingConventionsDetector": ".logging",
+    "PythonMessagingDetector": ".messaging",
+    "PythonObservabilityConventionsDetector": ".observability",
+    "PythonResilienceConventionsDetector": ".resilience",
+    "PythonResourceManagementDetector": ".resource_management",
+    "PythonReturnPatternsDetector": ".return_patterns",
+    "PythonSecurityConventionsDetector": ".security",
+    "PythonSerializationDetector": ".serialization",
+    "PythonTestConventionsDetector": ".test_conventions",
+    "PythonTestOrganizationDetector": ".test_organization",
+    "PythonToolingDetector": ".tooling",
+    "PythonTypingConventionsDetector": ".typing",
+    "PythonValidationPatternsDetector": ".validation_patterns",
+}
 
 __all__ = [
     "PythonIndex",
@@ -74,3 +118,10 @@ __all__ = [
     "PythonValidationPatternsDetector",
     "PythonDataFlowDetector",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -6,7 +6,6 @@ from collections import Counter, defaultdict
 
 import yaml
 
-from ...fs import read_file_safe
 from ..base import DetectorContext, DetectorResult, PythonDetector
 from ..registry import DetectorRegistry
 from .index import make_evidence
@@ -277,7 +276,7 @@ class PythonLayeringConventionsDetector(PythonDetector):
             if compose_path.is_file():
                 has_compose = True
                 compose_file = compose_path.name
-                content = read_file_safe(compose_path)
+                content = ctx.read_file(compose_path)
                 if content:
                     try:
                         compose_config = yaml.safe_load(content)
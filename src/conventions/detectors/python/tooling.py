@@ -705,7 +705,7 @@ class PythonToolingDetector(PythonDetector):
         if not pre_commit_config.is_file():
             return
 
-        content = read_file_safe(pre_commit_config)
+        content = ctx.read_file(pre_commit_config)
         if not content:
             return
 
@@ -2,11 +2,167 @@
 
 from __future__ import annotations
 
+import importlib
+from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from .base import BaseDetector
 
+_ANY_LANGUAGE: frozenset[str] = frozenset()
+_GO = frozenset({"go"})
+_NODE = frozenset({"node"})
+_PYTHON = frozenset({"python"})
+
+# Built-in detectors by name: (module relative to this package, class name,
+# languages). The languages mirror each class's ``languages`` attribute, so
+# the orchestrator can drop disabled or irrelevant detectors before importing
+# them. An empty set means the detector runs for every language. Entries are
+# listed in run order, which is the order rules appear in the output: Go,
+# Node, generic, Python, then Rust.
+DETECTOR_MANIFEST: dict[str, tuple[str, str, frozenset[str]]] = {
+    "go_api": (".go.api", "GoAPIDetector", _GO),
+    "go_architecture": (".go.architecture", "GoArchitectureDetector", _GO),
+    "go_cli": (".go.cli", "GoCLIDetector", _GO),
+    "go_codegen": (".go.codegen", "GoCodegenDetector", _GO),
+    "go_concurrency": (".go.concurrency", "GoConcurrencyDetector", _GO),
+    "go_conventions": (".go.conventions", "GoConventionsDetector", _GO),
+    "go_data_flow": (".go.data_flow", "GoDataFlowDetector", _GO),
+    "go_di": (".go.di", "GoDIDetector", _GO),
+    "go_documentation": (".go.documentation", "GoDocumentationDetector", _GO),
+    "go_errors": (".go.errors", "GoErrorHandlingDetector", _GO),
+    "go_grpc": (".go.grpc", "GoGRPCDetector", _GO),
+    "go_logging": (".go.logging", "GoLoggingDetector", _GO),
+    "go_migrations": (".go.migrations", "GoMigrationsDetector", _GO),
+    "go_modules": (".go.modules", "GoModulesDetector", _GO),
+    "go_patterns": (".go.patterns", "GoPatternsDetector", _GO),
+    "go_security": (".go.security", "GoSecurityDetector", _GO),
+    "go_testing": (".go.testing", "GoTestingDetector", _GO),
+    "node_api": (".node.api", "NodeAPIDetector", _NODE),
+    "node_architecture": (".node.architecture", "NodeArchitectureDetector", _NODE),
+    "node_async_patterns": (".node.async_patterns", "NodeAsyncPatternsDetector", _NODE),
+    "node_auth": (".node.auth", "NodeAuthDetector", _NODE),
+    "node_build_tools": (".node.build_tools", "NodeBuildToolsDetector", _NODE),
+    "node_codegen": (".node.codegen", "NodeCodeGenDetector", _NODE),
+    "node_conventions": (".node.conventions", "NodeConventionsDetector", _NODE),
+    "node_data_flow": (".node.data_flow", "NodeDataFlowDetector", _NODE),
+    "node_documentation": (".node.documentation", "NodeDocumentationDetector", _NODE),
+    "node_errors": (".node.errors", "NodeErrorHandlingDetector", _NODE),
+    "node_formatting": (".node.formatting", "NodeFormattingDetector", _NODE),
+    "node_frontend": (".node.frontend", "NodeFrontendDetector", _NODE),
+    "node_linting": (".node.linting", "NodeLintingDetector", _NODE),
+    "node_logging": (".node.logging", "NodeLoggingDetector", _NODE),
+    "node_migrations": (".node.migrations", "NodeMigrationsDetector", _NODE),
+    "node_monorepo": (".node.monorepo", "NodeMonorepoDetector", _NODE),
+    "node_naming": (".node.naming", "NodeNamingDetector", _NODE),
+    "node_package_manager": (".node.package_manager", "NodePackageManagerDetector", _NODE),
+    "node_patterns": (".node.patterns", "NodePatternsDetector", _NODE),
+    "node_security": (".node.security", "NodeSecurityDetector", _NODE),
+    "node_state_management": (".node.state_management", "NodeStateManagementDetector", _NODE),
+    "node_testing": (".node.testing", "NodeTestingDetector", _NODE),
+    "node_typescript": (".node.typescript", "NodeTypeScriptDetector", _NODE),
+    "generic_api_docs": (".generic.api_docs", "APIDocumentationDetector", _ANY_LANGUAGE),
+    "generic_ci_cd": (".generic.ci_cd", "CICDDetector", _ANY_LANGUAGE),
+    "generic_code_ownership": (".generic.code_ownership", "CodeOwnershipDetector", _ANY_LANGUAGE),
+    "generic_config_patterns": (
+        ".generic.config_patterns", "ConfigPatternsDetector", _ANY_LANGUAGE
+    ),
+    "generic_containerization": (
+        ".generic.containerization", "ContainerizationDetector", _ANY_LANGUAGE
+    ),
+    "generic_dependency_updates": (
+        ".generic.dependency_updates", "DependencyUpdatesDetector", _ANY_LANGUAGE
+    ),
+    "generic_editor_config": (".generic.editor_config", "EditorConfigDetector", _ANY_LANGUAGE),
+    "generic_environment_setup": (
+        ".generic.environment_setup", "EnvironmentSetupDetector", _ANY_LANGUAGE
+    ),
+    "generic_generated_code": (".generic.generated_code", "GeneratedCodeDetector", _ANY_LANGUAGE),
+    "generic_git_conventions": (
+        ".generic.git_conventions", "GitConventionsDetector", _ANY_LANGUAGE
+    ),
+    "generic_repo_layout": (".generic.repo_layout", "GenericRepoLayoutDetector", _ANY_LANGUAGE),
+    "generic_task_runners": (".generic.task_runners", "TaskRunnerDetector", _ANY_LANGUAGE),
+    "python_api_response_patterns": (
+        ".python.api_response_patterns", "PythonAPIResponsePatternsDetector", _PYTHON
+    ),
+    "python_api_schema_conventions": (
+        ".python.api_schema", "PythonAPISchemaConventionsDetector", _PYTHON
+    ),
+    "python_layering_conventions": (
+        ".python.architecture", "PythonLayeringConventionsDetector", _PYTHON
+    ),
+    "python_async_conventions": (
+        ".python.async_concurrency", "PythonAsyncConventionsDetector", _PYTHON
+    ),
+    "python_background_tasks": (
+        ".python.background_tasks", "PythonBackgroundTaskDetector", _PYTHON
+    ),
+    "python_caching": (".python.caching", "PythonCachingDetector", _PYTHON),
+    "python_class_patterns": (".python.class_patterns", "PythonClassPatternsDetector", _PYTHON),
+    "python_cli_patterns": (".python.cli_patterns", "PythonCLIPatternDetector", _PYTHON),
+    "python_code_style": (".python.code_style", "PythonCodeStyleDetector", _PYTHON),
+    "python_constants_enums": (".python.constants_enums", "PythonConstantsEnumsDetector", _PYTHON),
+    "python_data_flow": (".python.data_flow", "PythonDataFlowDetector", _PYTHON),
+    "python_db_conventions": (".python.db", "PythonDBConventionsDetector", _PYTHON),
+    "python_decorator_patterns": (
+        ".python.decorator_patterns", "PythonDecoratorPatternsDetector", _PYTHON
+    ),
+    "python_dependency_management": (
+        ".python.dependency_management", "PythonDependencyManagementDetector", _PYTHON
+    ),
+    "python_di_conventions": (".python.di_patterns", "PythonDIConventionsDetector", _PYTHON),
+    "python_docs_conventions": (
+        ".python.docs_conventions", "PythonDocsConventionsDetector", _PYTHON
+    ),
+    "python_docstring_naming_conventions": (
+        ".python.documentation", "PythonDocstringNamingConventionsDetector", _PYTHON
+    ),
+    "python_error_conventions": (".python.errors", "PythonErrorConventionsDetector", _PYTHON),
+    "python_feature_flags": (".python.feature_flags", "PythonFeatureFlagsDetector", _PYTHON),
+    "python_graphql": (".python.graphql", "PythonGraphQLDetector", _PYTHON),
+    "python_logging_conventions": (".python.logging", "PythonLoggingConventionsDetector", _PYTHON),
+    "python_messaging": (".python.messaging", "PythonMessagingDetector", _PYTHON),
+    "python_observability_conventions": (
+        ".python.observability", "PythonObservabilityConventionsDetector", _PYTHON
+    ),
+    "python_resilience_conventions": (
+        ".python.resilience", "PythonResilienceConventionsDetector", _PYTHON
+    ),
+    "python_resource_management": (
+        ".python.resource_management", "PythonResourceManagementDetector", _PYTHON
+    ),
+    "python_return_patterns": (".python.return_patterns", "PythonReturnPatternsDetector", _PYTHON),
+    "python_security_conventions": (
+        ".python.security", "PythonSecurityConventionsDetector", _PYTHON
+    ),
+    "python_serialization": (".python.serialization", "PythonSerializationDetector", _PYTHON),
+    "python_test_conventions": (
+        ".python.test_conventions", "PythonTestConventionsDetector", _PYTHON
+    ),
+    "python_test_organization": (
+        ".python.test_organization", "PythonTestOrganizationDetector", _PYTHON
+    ),
+    "python_tooling": (".python.tooling", "PythonToolingDetector", _PYTHON),
+    "python_typing_conventions": (".python.typing", "PythonTypingConventionsDetector", _PYTHON),
+    "python_validation_patterns": (
+        ".python.validation_patterns", "PythonValidationPatternsDetector", _PYTHON
+    ),
+    "rust_async": (".rust.async_runtime", "RustAsyncDetector", _ANY_LANGUAGE),
+    "rust_cargo": (".rust.cargo", "RustCargoDetector", _ANY_LANGUAGE),
+    "rust_cli": (".rust.cli", "RustCLIDetector", _ANY_LANGUAGE),
+    "rust_data_flow": (".rust.data_flow", "RustDataFlowDetector", _ANY_LANGUAGE),
+    "rust_database": (".rust.database", "RustDatabaseDetector", _ANY_LANGUAGE),
+    "rust_documentation": (".rust.documentation", "RustDocumentationDetector", _ANY_LANGUAGE),
+    "rust_errors": (".rust.errors", "RustErrorHandlingDetector", _ANY_LANGUAGE),
+    "rust_logging": (".rust.logging", "RustLoggingDetector", _ANY_LANGUAGE),
+    "rust_macros": (".rust.macros", "RustMacrosDetector", _ANY_LANGUAGE),
+    "rust_serialization": (".rust.serialization", "RustSerializationDetector", _ANY_LANGUAGE),
+    "rust_testing": (".rust.testing", "RustTestingDetector", _ANY_LANGUAGE),
+    "rust_unsafe": (".rust.unsafe_code", "RustUnsafeDetector", _ANY_LANGUAGE),
+    "rust_web": (".rust.web", "RustWebDetector", _ANY_LANGUAGE),
+}
+
 
 class DetectorRegistry:
     """Registry of all available detectors."""
@@ -31,21 +187,41 @@ class DetectorRegistry:
         cls._detectors = []
 
 
+def load_detector(name: str) -> type["BaseDetector"]:
+    """Import a built-in detector class by its manifest name."""
+    module_name, class_name, _ = DETECTOR_MANIFEST[name]
+    detector_class: type[BaseDetector] = getattr(
+        importlib.import_module(module_name, __package__), class_name
+    )
+    return detector_class
+
+
+def select_detectors(
+    languages: Iterable[str],
+    disabled_detectors: Iterable[str] = (),
+) -> list[str]:
+    """
+    Get the names of built-in detectors to run, in run order.
+
+    Detectors that are disabled or only apply to languages outside
+    ``languages`` are left out, so their modules are never imported.
+    """
+    languages = frozenset(languages)
+    disabled = frozenset(disabled_detectors)
+    return [
+        name
+        for name, (_, _, detector_languages) in DETECTOR_MANIFEST.items()
+        if name not in disabled
+        and (not detector_languages or not detector_languages.isdisjoint(languages))
+    ]
+
+
 def register_all_detectors() -> None:
     """
-    Import all detector modules to trigger registration.
+    Import every built-in detector so it is registered.
 
-    This must be called before using the registry.
+    ``run_detectors`` only imports the detectors it needs; this is for
+    callers that want the full registry.
     """
-    # Generic detectors (language-agnostic)
-    # Python detectors
-    # Go detectors
-    # Node.js detectors
-    # Rust detectors
-    from . import (
-        generic,  # noqa: F401
-        go,  # noqa: F401
-        node,  # noqa: F401
-        python,  # noqa: F401
-        rust,  # noqa: F401
-    )
+    for name in DETECTOR_MANIFEST:
+        load_detector(name)
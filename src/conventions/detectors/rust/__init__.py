@@ -1,22 +1,47 @@
 """Rust convention detectors package."""
 
-from .async_runtime import RustAsyncDetector
-from .base import RustDetector
+from __future__ import annotations
 
-# Import all detector classes to ensure they register
-from .cargo import RustCargoDetector
-from .cli import RustCLIDetector
-from .data_flow import RustDataFlowDetector
-from .database import RustDatabaseDetector
-from .documentation import RustDocumentationDetector
-from .errors import RustErrorHandlingDetector
-from .index import RustIndex, make_evidence
-from .logging import RustLoggingDetector
-from .macros import RustMacrosDetector
-from .serialization import RustSerializationDetector
-from .testing import RustTestingDetector
-from .unsafe_code import RustUnsafeDetector
-from .web import RustWebDetector
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .async_runtime import RustAsyncDetector
+    from .base import RustDetector
+    from .cargo import RustCargoDetector
+    from .cli import RustCLIDetector
+    from .data_flow import RustDataFlowDetector
+    from .database import RustDatabaseDetector
+    from .documentation import RustDocumentationDetector
+    from .errors import RustErrorHandlingDetector
+    from .index import RustIndex, make_evidence
+    from .logging import RustLoggingDetector
+    from .macros import RustMacrosDetector
+    from .serialization import RustSerializationDetector
+    from .testing import RustTestingDetector
+    from .unsafe_code import RustUnsafeDetector
+    from .web import RustWebDetector
+
+# Detector modules are imported on first access (PEP 562) so that loading
+# one detector does not import the rest of the package.
+_LAZY_IMPORTS = {
+    "RustAsyncDetector": ".async_runtime",
+    "RustDetector": ".base",
+    "RustCargoDetector": ".cargo",
+    "RustCLIDetector": ".cli",
+    "RustDataFlowDetector": ".data_flow",
+    "RustDatabaseDetector": ".database",
+    "RustDocumentationDetector": ".documentation",
+    "RustErrorHandlingDetector": ".errors",
+    "RustIndex": ".index",
+    "make_evidence": ".index",
+    "RustLoggingDetector": ".logging",
+    "RustMacrosDetector": ".macros",
+    "RustSerializationDetector": ".serialization",
+    "RustTestingDetector": ".testing",
+    "RustUnsafeDetector": ".unsafe_code",
+    "RustWebDetector": ".web",
+}
 
 __all__ = [
     "RustIndex",
@@ -36,3 +61,10 @@ __all__ = [
     "RustDatabaseDetector",
     "RustDataFlowDetector",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -19,10 +19,9 @@ class RustDetector(BaseDetector):
         """Get or create the Rust index from context."""
         from .index import RustIndex
 
-        cache_key = "rust_index"
-        if cache_key not in ctx.cache:
+        def build() -> RustIndex:
             index = RustIndex(ctx.repo_root)
             index.build()
-            ctx.cache[cache_key] = index
-        result: RustIndex = ctx.cache[cache_key]
-        return result
+            return index
+
+        return ctx.get_cached("rust_index", build)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import heapq
+from operator import itemgetter
+
 from ..base import DetectorContext, DetectorResult
 from ..registry import DetectorRegistry
 from .base import RustDetector
@@ -90,7 +93,7 @@ class RustMacrosDetector(RustDetector):
         examples: list[tuple[str, int]] = []
 
         # Get top derives
-        top_derives = sorted(derive_traits.items(), key=lambda x: -x[1])[:5]
+        top_derives = heapq.nlargest(5, derive_traits.items(), key=itemgetter(1))
         top_derive_names = [t[0] for t in top_derives]
 
         if is_proc_macro:
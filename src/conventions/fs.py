@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Callable, Iterator, Optional, TypeVar
 
 try:
     import pathspec
@@ -56,9 +57,27 @@ HARD_EXCLUDES = {
     "demos",
 }
 
+# VCS metadata and installed dependencies. Lookups for files that usually
+# live in docs or example directories skip only these, not HARD_EXCLUDES
+VCS_AND_DEPENDENCY_DIRS = frozenset({
+    ".git",
+    ".svn",
+    ".hg",
+    "node_modules",
+    "vendor",
+    ".venv",
+    "venv",
+    "site-packages",
+})
+
+T = TypeVar("T")
+
 # File size limit (skip very large files)
 MAX_FILE_SIZE_BYTES = 1024 * 1024  # 1MB
 
+# Characters read from the top of a file when only its head is scanned
+HEAD_SCAN_CHARS = 256 * 1024
+
 # Default file caps per language
 DEFAULT_MAX_FILES = 2000
 
@@ -125,6 +144,91 @@ def create_exclude_spec(patterns: list[str]) -> Optional["pathspec.PathSpec"]:
         return None
 
 
+def _is_hard_excluded(name: str) -> bool:
+    """Check a single path component against HARD_EXCLUDES."""
+    if name in HARD_EXCLUDES:
+        return True
+    return any(
+        pattern.startswith("*") and name.endswith(pattern[1:])
+        for pattern in HARD_EXCLUDES
+    )
+
+
+def _walk_tree(
+    repo_root: Path,
+    respect_gitignore: bool,
+    exclude_patterns: Optional[list[str]],
+    accept_name: Optional[Callable[[str], bool]] = None,
+    is_excluded: Callable[[str], bool] = _is_hard_excluded,
+    top_dirs: tuple[str, ...] = ("",),
+) -> Iterator[os.DirEntry[str]]:
+    """
+    Yield the directory entries of non-excluded files under repo_root.
+
+    Walks with os.scandir in the same top-down order as os.walk. Exclusions
+    match should_exclude, but names are checked against HARD_EXCLUDES once
+    per entry and gitignore patterns get the relative path directly, so no
+    Path objects are built while walking. Files whose names fail
+    accept_name are skipped before the (slower) gitignore check.
+
+    is_excluded replaces the HARD_EXCLUDES check, and top_dirs limits the
+    walk to directories relative to repo_root (gitignore patterns still
+    match paths relative to repo_root).
+    """
+    # should_exclude also checks the components of repo_root itself
+    if any(is_excluded(part) for part in repo_root.parts):
+        return
+
+    specs = [
+        spec
+        for spec in (
+            load_gitignore(repo_root) if respect_gitignore else None,
+            create_exclude_spec(exclude_patterns or []),
+        )
+        if spec is not None
+    ]
+
+    # Stack of (directory, path relative to repo_root with trailing "/")
+    stack: list[tuple[str, str]] = [
+        (os.path.join(str(repo_root), top), f"{top}/" if top else "")
+        for top in reversed(top_dirs)
+    ]
+    while stack:
+        directory, rel_dir = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs: list[tuple[str, str]] = []
+        for entry in entries:
+            name = entry.name
+            if is_excluded(name):
+                continue
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+
+            if not is_dir and accept_name is not None and not accept_name(name):
+                continue
+
+            rel_path = rel_dir + name
+            if any(spec.match_file(rel_path) for spec in specs):
+                continue
+
+            if is_dir:
+                # Like os.walk, don't descend into symlinked directories
+                if not entry.is_symlink():
+                    subdirs.append((entry.path, rel_path + "/"))
+            else:
+                yield entry
+
+        # Pushed in reverse so subdirectories are visited in listing order
+        stack.extend(reversed(subdirs))
+
+
 def walk_files(
     repo_root: Path,
     extensions: set[str],
@@ -145,44 +249,111 @@ def walk_files(
     Yields:
         Path objects for matching files
     """
-    repo_root = Path(repo_root).resolve()
-    gitignore_spec = load_gitignore(repo_root) if respect_gitignore else None
-    custom_excludes = create_exclude_spec(exclude_patterns or [])
+    if max_files <= 0:
+        return
 
+    repo_root = Path(repo_root).resolve()
+    suffixes = tuple(extensions)
     file_count = 0
 
-    for root, dirs, files in os.walk(repo_root):
-        root_path = Path(root)
+    for entry in _walk_tree(
+        repo_root,
+        respect_gitignore,
+        exclude_patterns,
+        accept_name=lambda name: name.endswith(suffixes),
+    ):
+        # Check file size
+        try:
+            if entry.stat().st_size > MAX_FILE_SIZE_BYTES:
+                continue
+        except OSError:
+            continue
 
-        # Filter directories in-place to skip excluded ones
-        dirs[:] = [
-            d for d in dirs
-            if not should_exclude(root_path / d, repo_root, gitignore_spec, custom_excludes)
-        ]
+        file_count += 1
+        yield Path(entry.path)
+        if file_count >= max_files:
+            return
 
-        for filename in files:
-            if file_count >= max_files:
-                return
 
-            file_path = root_path / filename
+def index_files(
+    repo_root: Path,
+    respect_gitignore: bool = True,
+    exclude_patterns: Optional[list[str]] = None,
+) -> dict[str, list[Path]]:
+    """
+    Walk repository once and group all files by extension.
 
-            # Check extension
-            if not any(filename.endswith(ext) for ext in extensions):
-                continue
+    Applies the same exclusions as walk_files but has no file cap or size
+    limit, so detectors can look up files by name without re-walking the tree.
 
-            # Check exclusions
-            if should_exclude(file_path, repo_root, gitignore_spec, custom_excludes):
-                continue
+    Args:
+        repo_root: Root directory to scan
+        respect_gitignore: Whether to respect .gitignore patterns
+        exclude_patterns: Additional glob patterns to exclude
 
-            # Check file size
-            try:
-                if file_path.stat().st_size > MAX_FILE_SIZE_BYTES:
-                    continue
-            except OSError:
-                continue
+    Returns:
+        Mapping of lowercase extension (e.g. ".json", or "" for none) to
+        sorted file paths
+    """
+    repo_root = Path(repo_root).resolve()
+
+    index: dict[str, list[Path]] = {}
+    for entry in _walk_tree(repo_root, respect_gitignore, exclude_patterns):
+        ext = os.path.splitext(entry.name)[1].lower()
+        index.setdefault(ext, []).append(Path(entry.path))
+
+    for paths in index.values():
+        paths.sort()
+
+    return index
+
+
+def find_files(
+    repo_root: Path,
+    accept_name: Callable[[str], bool],
+    top_dirs: tuple[str, ...] = ("",),
+    skip_dirs: frozenset[str] = VCS_AND_DEPENDENCY_DIRS,
+) -> list[Path]:
+    """
+    Find files by name, skipping only skip_dirs and .gitignore matches.
+
+    Unlike walk_files, directories in HARD_EXCLUDES such as docs/, examples/
+    and build/ are searched, for files that commonly live there.
 
-            file_count += 1
-            yield file_path
+    Args:
+        repo_root: Repository root; gitignore patterns match relative to it
+        accept_name: Predicate a file name must pass
+        top_dirs: Directories to search, relative to repo_root
+        skip_dirs: Directory and file names never descended into or returned
+
+    Returns:
+        Sorted paths of matching files
+    """
+    return sorted(
+        Path(entry.path)
+        for entry in _walk_tree(
+            repo_root,
+            True,
+            None,
+            accept_name=accept_name,
+            is_excluded=skip_dirs.__contains__,
+            top_dirs=top_dirs,
+        )
+    )
+
+
+def list_dir_files(directory: Path) -> frozenset[str]:
+    """
+    List names of files directly inside a directory with one scandir call.
+
+    Returns an empty set if the directory is missing or unreadable, so
+    callers can test many candidate names without a stat call per name.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
 
 
 def read_file_safe(path: Path, max_bytes: int = MAX_FILE_SIZE_BYTES) -> Optional[str]:
@@ -200,6 +371,64 @@ def read_file_safe(path: Path, max_bytes: int = MAX_FILE_SIZE_BYTES) -> Optional
         return None
 
 
+def read_file_head(path: Path, max_chars: int = HEAD_SCAN_CHARS) -> Optional[str]:
+    """
+    Read at most max_chars characters from the start of a file.
+
+    For token scans where matches sit near the top of a file (imports,
+    env access, Dockerfile instructions): large files are truncated
+    rather than read in full or skipped. Returns None if the file
+    cannot be read.
+    """
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read(max_chars)
+    except (OSError, IOError):
+        return None
+
+
+def read_bytes_safe(path: Path, max_bytes: int = MAX_FILE_SIZE_BYTES) -> Optional[bytes]:
+    """
+    Read raw file bytes safely with size limit.
+
+    Like read_file_safe but skips text decoding, for callers that only
+    search for ASCII tokens.
+    """
+    try:
+        if path.stat().st_size > max_bytes:
+            return None
+        with open(path, "rb") as f:
+            return f.read()
+    except (OSError, IOError):
+        return None
+
+
+def read_files_parallel(
+    paths: list[Path],
+    reader: Callable[[Path], T] = read_file_safe,  # type: ignore[assignment]
+    max_workers: int = 8,
+) -> list[T]:
+    """
+    Read several files concurrently.
+
+    File reads release the GIL, so a small thread pool overlaps the I/O.
+
+    Args:
+        paths: Files to read
+        reader: Function reading one file (read_file_safe, read_bytes_safe,
+            or one that also scans the contents so work runs in the pool)
+        max_workers: Maximum number of reader threads
+
+    Returns:
+        Reader results in the same order as paths
+    """
+    if len(paths) <= 1:
+        return [reader(path) for path in paths]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(reader, paths))
+
+
 def get_relative_path(file_path: Path, repo_root: Path) -> str:
     """Get relative path string from repo root."""
     try:
@@ -0,0 +1,115 @@
+"""Tests for generic API documentation detector."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from conventions.detectors.base import DetectorContext
+from conventions.detectors.generic.api_docs import APIDocumentationDetector
+
+
+def _detect(repo: Path):
+    ctx = DetectorContext(
+        repo_root=repo,
+        selected_languages=set(),
+        max_files=100,
+    )
+    result = APIDocumentationDetector().detect(ctx)
+    for rule in result.rules:
+        if rule.id == "generic.conventions.api_documentation":
+            return rule
+    return None
+
+
+class TestAPIDocumentationDetector:
+    """Tests for APIDocumentationDetector."""
+
+    def test_no_docs(self, tmp_path: Path):
+        """Test no rule is produced without API docs."""
+        (tmp_path / "README.md").write_text("# Project\n")
+        assert _detect(tmp_path) is None
+
+    def test_openapi_yaml_version(self, tmp_path: Path):
+        """Test OpenAPI spec with version extraction."""
+        (tmp_path / "openapi.yaml").write_text("openapi: 3.1.0\ninfo:\n  title: API\n")
+
+        rule = _detect(tmp_path)
+        assert rule is not None
+        details = rule.stats["doc_details"]["openapi"]
+        assert details["file"] == "openapi.yaml"
+        assert details["version"] == "3.1"
+
+    def test_openapi_json_in_docs_dir(self, tmp_path: Path):
+        """Test OpenAPI JSON spec in a docs directory."""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "openapi.json").write_text('{"openapi": "3.0.2"}')
+
+        rule = _detect(tmp_path)
+        assert rule is not None
+        details = rule.stats["doc_details"]["openapi"]
+        assert details["file"] == "docs/openapi.json"
+        assert details["version"] == "3.0"
+
+    def test_prefers_openapi_file_name(self, tmp_path: Path):
+        """Test openapi.* is preferred over api.* in the same directory."""
+        (tmp_path / "api.json").write_text('{"openapi": "3.0.0"}')
+        (tmp_path / "openapi.yml").write_text("openapi: 3.1.0\n")
+
+        rule = _detect(tmp_path)
+        assert rule is not None
+        assert rule.stats["doc_details"]["openapi"]["file"] == "openapi.yml"
+
+    def test_non_spec_file_falls_through(self, tmp_path: Path):
+        """Test a candidate without a spec marker does not stop the search."""
+        (tmp_path / "api.json").write_text('{"name": "config"}')
+        (tmp_path / "specs").mkdir()
+        (tmp_path / "specs" / "openapi.json").write_text('{"openapi": "3.0.1"}')
+
+        rule = _detect(tmp_path)
+        assert rule is not None
+        assert rule.stats["doc_details"]["openapi"]["file"] == "specs/openapi.json"
+
+    def test_swagger(self, tmp_path: Path):
+        """Test Swagger 2.0 spec."""
+        (tmp_path / "api").mkdir()
+        (tmp_path / "api" / "swagger.yml").write_text('swagger: "2.0"\n')
+
+        rule = _detect(tmp_path)
+        assert rule is not None
+        assert rule.stats["doc_details"]["swagger"]["file"] == "api/swagger.yml"
+
+    def test_asyncapi_and_graphql(self, tmp_path: Path):
+        """Test AsyncAPI and GraphQL schema detection."""
+        (tmp_path / "asyncapi.yaml").write_text("asyncapi: 2.6.0\n")
+        (tmp_path / "specs").mkdir()
+        (tmp_path / "specs" / "schema.graphql").write_text("type Query { a: Int }\n")
+
+        rule = _detect(tmp_path)
+        assert rule is not None
+        assert set(rule.stats["doc_types"]) == {"asyncapi", "graphql"}
+        assert rule.stats["doc_details"]["graphql"]["file"] == "specs/schema.graphql"
+
+    def test_postman_collections(self, tmp_path: Path):
+        """Test Postman collection detection anywhere in the tree."""
+        (tmp_path / "tools" / "postman").mkdir(parents=True)
+        (tmp_path / "tools" / "postman" / "postman_env.json").write_text("{}")
+        (tmp_path / "tools" / "api.postman_collection.json").write_text("{}")
+
+        rule = _detect(tmp_path)
+        assert rule is not None
+        assert rule.stats["doc_details"]["postman"]["count"] == 2
+
+    def test_postman_under_docs(self, tmp_path: Path):
+        """Test a Postman collection under docs/ is detected."""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "postman_collection.json").write_text("{}")
+
+        rule = _detect(tmp_path)
+        assert rule is not None
+        assert rule.stats["doc_details"]["postman"]["file"] == "docs/postman_collection.json"
+
+    def test_postman_in_excluded_dirs_ignored(self, tmp_path: Path):
+        """Test Postman collections under dependency dirs are not counted."""
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "postman.json").write_text("{}")
+
+        assert _detect(tmp_path) is None
@@ -209,6 +209,33 @@ class TestGenericCIDetector:
             # GitHub Actions workflow has testing and linting
             assert "testing" in features or "linting" in features
 
+    def test_detect_ci_quality_stats(self, tmp_path: Path):
+        """Test CI quality indicators across several workflows."""
+        from conventions.detectors.generic.ci_cd import CICDDetector
+
+        workflows = tmp_path / ".github" / "workflows"
+        workflows.mkdir(parents=True)
+        (workflows / "checks.yml").write_text(
+            "jobs:\n  build:\n    strategy:\n      matrix:\n        py: [3.11]\n"
+            "    steps:\n      - run: PyTest -q\n"
+        )
+        (workflows / "release.yaml").write_text(
+            "jobs:\n  publish:\n    steps:\n      - uses: actions/cache@v4\n"
+        )
+
+        ctx = DetectorContext(repo_root=tmp_path, selected_languages=set())
+        result = CICDDetector().detect(ctx)
+
+        quality_rule = next(r for r in result.rules if r.id == "generic.conventions.ci_quality")
+        assert quality_rule.stats["has_test_workflow"] is True
+        assert quality_rule.stats["has_lint_workflow"] is False
+        assert quality_rule.stats["has_deploy_workflow"] is True
+        assert quality_rule.stats["has_caching"] is True
+        assert quality_rule.stats["has_matrix"] is True
+        assert quality_rule.stats["features"] == [
+            "testing", "deployment", "caching", "matrix builds",
+        ]
+
 
 class TestGenericCIDetectorShouldRun:
     """Tests for detector should_run logic."""
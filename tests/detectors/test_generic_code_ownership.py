@@ -84,6 +84,27 @@ class TestCodeOwnershipDetector:
         assert "@org/platform-team" in rule.stats["owners"]
         assert "@alice" in rule.stats["owners"]
 
+    def test_codeowners_parsing(self, tmp_path: Path):
+        """Comments, blank lines and owner-less patterns are skipped."""
+        (tmp_path / "CODEOWNERS").write_text(
+            "# Global owners\r\n"
+            "*   @org/core\t@bob  \r\n"
+            "\r\n"
+            "  /docs/ @carol\r\n"
+            "/orphaned/   \r\n"
+            "   # indented comment @dave\r\n",
+            newline="",
+        )
+        ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
+        result = CodeOwnershipDetector().detect(ctx)
+
+        rule = next(r for r in result.rules if r.id == "generic.conventions.code_owners")
+        assert rule.stats["rules"] == [
+            {"pattern": "*", "owners": ["@org/core", "@bob"]},
+            {"pattern": "/docs/", "owners": ["@carol"]},
+        ]
+        assert rule.stats["owners"] == ["@bob", "@carol", "@org/core"]
+
     def test_detects_file_hotspots(self, git_repo: Path):
         """Detects frequently changed files."""
         ctx = DetectorContext(repo_root=git_repo, selected_languages=set(), max_files=100)
@@ -103,3 +124,34 @@ class TestCodeOwnershipDetector:
         # May have no rules, or only hotspots if tmp_path happens to be inside a git repo
         code_owner_rules = [r for r in result.rules if r.id == "generic.conventions.code_owners"]
         assert len(code_owner_rules) == 0
+
+    def test_hotspots_across_read_chunks(self, git_repo: Path, monkeypatch):
+        """Names split across read chunks are still counted whole."""
+        import conventions.detectors.generic.code_ownership as code_ownership
+
+        monkeypatch.setattr(code_ownership, "_GIT_LOG_CHUNK_SIZE", 3)
+        ctx = DetectorContext(repo_root=git_repo, selected_languages=set(), max_files=100)
+        result = CodeOwnershipDetector().detect(ctx)
+
+        rule = next(r for r in result.rules if r.id == "generic.conventions.file_hotspots")
+        assert rule.stats["hotspots"] == [
+            {"file": "src/app.py", "changes": 6},
+            {"file": "src/utils.py", "changes": 1},
+        ]
+
+    def test_hotspot_names_are_not_quoted(self, git_repo: Path):
+        """Names with spaces or non-ASCII characters are reported verbatim."""
+        import subprocess
+
+        path = git_repo / "src" / "café report.py"
+        for i in range(3):
+            path.write_text(f"v{i}")
+            subprocess.run(["git", "add", "."], cwd=git_repo, capture_output=True)
+            subprocess.run(["git", "commit", "-m", f"r{i}"], cwd=git_repo, capture_output=True)
+
+        ctx = DetectorContext(repo_root=git_repo, selected_languages=set(), max_files=100)
+        result = CodeOwnershipDetector().detect(ctx)
+
+        rule = next(r for r in result.rules if r.id == "generic.conventions.file_hotspots")
+        files = {h["file"]: h["changes"] for h in rule.stats["hotspots"]}
+        assert files["src/café report.py"] == 3
@@ -133,3 +133,83 @@ class TestConfigPatternsDetector:
         ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
         result = ConfigPatternsDetector().detect(ctx)
         assert len(result.rules) == 0
+
+    def test_counts_each_match_once(self, tmp_path: Path):
+        """Counts sum across files and overlapping names count for each manager."""
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "a.py").write_text('import os\nos.environ["A"]\nos.getenv("B")\n')
+        (src / "b.py").write_text(
+            "import os\n"
+            'os.environ["C"]\n'
+            "client = KeyVaultClient(url)\n"
+        )
+        ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
+        result = ConfigPatternsDetector().detect(ctx)
+
+        rule = next(r for r in result.rules if r.id == "generic.conventions.config_access")
+        assert rule.stats["env_access_counts"] == {"python_os_environ": 3}
+        assert rule.stats["secrets_managers"] == {"hashicorp_vault": 1, "azure_keyvault": 1}
+
+    def test_counts_providers_on_one_line(self, tmp_path: Path):
+        """Counts every secrets manager named on the same line."""
+        (tmp_path / "app.py").write_text(
+            'import os\nos.environ["A"]\nos.getenv("B")\nx = "azure hvac keyvault"\n'
+        )
+        ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
+        result = ConfigPatternsDetector().detect(ctx)
+
+        rule = next(r for r in result.rules if r.id == "generic.conventions.config_access")
+        assert rule.stats["secrets_managers"] == {"hashicorp_vault": 1, "azure_keyvault": 1}
+
+    def test_scans_without_re2(self, node_env_repo: Path, monkeypatch):
+        """Falls back to the re module when google-re2 is not installed."""
+        import re
+
+        import conventions.detectors.generic.config_patterns as config_patterns
+
+        monkeypatch.setattr(config_patterns, "re2", None)
+        for attr, patterns in (
+            ("_ENV_ACCESS_RE", config_patterns._ENV_ACCESS_PATTERNS),
+            ("_CONFIG_LIBRARY_RE", config_patterns._CONFIG_LIBRARY_PATTERNS),
+        ):
+            combined = config_patterns._combine(patterns)
+            assert isinstance(combined, re.Pattern)
+            monkeypatch.setattr(config_patterns, attr, combined)
+
+        ctx = DetectorContext(repo_root=node_env_repo, selected_languages=set(), max_files=100)
+        result = ConfigPatternsDetector().detect(ctx)
+
+        rule = next(r for r in result.rules if r.id == "generic.conventions.config_access")
+        assert rule.stats["env_access_counts"]["node_process_env"] == 4
+        assert "node_dotenv" in rule.stats["libraries"]
+
+    def test_scans_only_head_of_large_files(self, tmp_path: Path):
+        """Matches past the scan cap in large files are not counted."""
+        from conventions.fs import HEAD_SCAN_CHARS
+
+        src = tmp_path / "src"
+        src.mkdir()
+        (src / "bundle.js").write_text(
+            "process.env.A;\nprocess.env.B;\n"
+            + "x" * HEAD_SCAN_CHARS
+            + "\nprocess.env.C;\n"
+        )
+        ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
+        result = ConfigPatternsDetector().detect(ctx)
+
+        rule = next(r for r in result.rules if r.id == "generic.conventions.config_access")
+        assert rule.stats["env_access_counts"] == {"node_process_env": 2}
+
+    def test_skips_scan_without_source_files(self, config_files_repo: Path, monkeypatch):
+        """Repos without source files are not scanned for config access."""
+        import conventions.detectors.generic.config_patterns as config_patterns
+
+        def fail(*args, **kwargs):
+            raise AssertionError("no source files should be scanned")
+
+        monkeypatch.setattr(config_patterns, "read_files_parallel", fail)
+        ctx = DetectorContext(repo_root=config_files_repo, selected_languages=set(), max_files=100)
+        result = ConfigPatternsDetector().detect(ctx)
+
+        assert [r.id for r in result.rules] == ["generic.conventions.config_files"]
@@ -0,0 +1,139 @@
+"""Tests for containerization detector."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from conventions.detectors.base import DetectorContext
+from conventions.detectors.generic.containerization import ContainerizationDetector
+
+
+def _detect(repo: Path) -> dict:
+    ctx = DetectorContext(repo_root=repo, selected_languages=set(), max_files=100)
+    result = ContainerizationDetector().detect(ctx)
+    return {rule.id: rule for rule in result.rules}
+
+
+class TestContainerizationDetector:
+    """Tests for ContainerizationDetector."""
+
+    def test_no_containers(self, tmp_path: Path):
+        """Test no rules are produced without container config."""
+        (tmp_path / "README.md").write_text("# Project\n")
+        assert _detect(tmp_path) == {}
+
+    def test_suffixed_dockerfile(self, tmp_path: Path):
+        """Test a Dockerfile variant in the root is picked up."""
+        (tmp_path / "Dockerfile.prod").write_text(
+            "FROM python:3.12 AS build\nFROM python:3.12-slim\nUSER app\n"
+        )
+
+        rule = _detect(tmp_path)["generic.conventions.dockerfile"]
+        assert rule.stats["from_count"] == 2
+        assert rule.stats["practices"]["multi_stage"]
+
+    def test_dockerfile_practices(self, tmp_path: Path):
+        """Test instruction checks only match at the start of a line."""
+        (tmp_path / "Dockerfile").write_text(
+            "FROM golang:1.22 AS build\n"
+            "# FROM scratch is mentioned here\n"
+            "COPY go.mod go.sum ./\n"
+            "RUN go mod download\n"
+            "FROM\tgcr.io/distroless/base:latest\n"
+            "USER root\n"
+        )
+
+        stats = _detect(tmp_path)["generic.conventions.dockerfile"].stats
+        practices = stats["practices"]
+        assert stats["from_count"] == 2
+        assert practices["multi_stage"]
+        assert practices["layer_optimization"]
+        assert not practices["pinned_version"]
+        assert not practices["non_root_user"]
+        assert not practices["healthcheck"]
+
+    def test_root_user_with_extra_spacing(self, tmp_path: Path):
+        """Test USER root is not taken for a non-root user however it is spaced."""
+        (tmp_path / "Dockerfile").write_text(
+            "FROM node:20\nCOPY package.json ./\nRUN npm ci\nUSER   root\n"
+        )
+
+        practices = _detect(tmp_path)["generic.conventions.dockerfile"].stats["practices"]
+        assert not practices["non_root_user"]
+        assert practices["pinned_version"]
+        assert practices["layer_optimization"]
+
+    def test_compose_overrides(self, tmp_path: Path):
+        """Test override files are counted but the base compose file is not."""
+        (tmp_path / "docker-compose.yml").write_text(
+            "services:\n  web:\n    image: app\n  db:\n    image: postgres\n"
+        )
+        (tmp_path / "docker-compose.dev.yml").write_text("services: {}\n")
+        (tmp_path / "docker-compose.test.yaml").write_text("services: {}\n")
+
+        rule = _detect(tmp_path)["generic.conventions.docker_compose"]
+        assert rule.stats["has_overrides"]
+        assert rule.stats["override_count"] == 2
+
+    def test_compose_features(self, tmp_path: Path):
+        """Test compose features are reported in a fixed order."""
+        (tmp_path / "compose.yaml").write_text(
+            "services:\n"
+            "  web:\n"
+            "    profiles: [dev]\n"
+            "    depends_on: [db]\n"
+            "    env_file: .env\n"
+            "  db:\n"
+            "    volumes:\n"
+            "      - data:/var/lib/postgresql/data\n"
+        )
+
+        rule = _detect(tmp_path)["generic.conventions.docker_compose"]
+        assert rule.stats["features"] == [
+            "volumes", "environment config", "dependencies", "profiles",
+        ]
+        assert rule.stats["service_count"] == 2
+
+    def test_kubernetes_manifests(self, tmp_path: Path):
+        """Test manifests under k8s directories are counted recursively."""
+        (tmp_path / "k8s" / "base").mkdir(parents=True)
+        (tmp_path / "k8s" / "base" / "deployment.yaml").write_text("kind: Deployment\n")
+        (tmp_path / "k8s" / "service.yml").write_text("kind: Service\n")
+        (tmp_path / "k8s" / "kustomization.yaml").write_text("resources: []\n")
+        (tmp_path / "config.yaml").write_text("app: {}\n")
+
+        rule = _detect(tmp_path)["generic.conventions.kubernetes"]
+        assert rule.stats["manifest_count"] == 3
+        assert rule.stats["has_kustomize"]
+        assert not rule.stats["has_helm"]
+
+    def test_kubernetes_manifests_in_hard_excluded_subdirs(self, tmp_path: Path):
+        """Test manifests under env/ or build/ subdirectories are still counted."""
+        (tmp_path / "k8s" / "env").mkdir(parents=True)
+        (tmp_path / "k8s" / "deployment.yaml").write_text("kind: Deployment\n")
+        (tmp_path / "k8s" / "env" / "prod.yaml").write_text("kind: ConfigMap\n")
+        (tmp_path / "deploy" / "build").mkdir(parents=True)
+        (tmp_path / "deploy" / "build" / "svc.yaml").write_text("kind: Service\n")
+
+        rule = _detect(tmp_path)["generic.conventions.kubernetes"]
+        assert rule.stats["manifest_count"] == 3
+
+    def test_kubernetes_manifests_respect_gitignore(self, tmp_path: Path):
+        """Test gitignored manifests are not counted."""
+        (tmp_path / "k8s" / "rendered").mkdir(parents=True)
+        (tmp_path / "k8s" / "deployment.yaml").write_text("kind: Deployment\n")
+        (tmp_path / "k8s" / "rendered" / "all.yaml").write_text("kind: List\n")
+        (tmp_path / ".gitignore").write_text("k8s/rendered/\n")
+
+        rule = _detect(tmp_path)["generic.conventions.kubernetes"]
+        assert rule.stats["manifest_count"] == 1
+
+    def test_nested_dockerfile_and_helm_chart(self, tmp_path: Path):
+        """Test docker/Dockerfile and a Helm chart below the root are found."""
+        (tmp_path / "docker").mkdir()
+        (tmp_path / "docker" / "Dockerfile").write_text("FROM alpine:3.20\n")
+        (tmp_path / "charts").mkdir()
+        (tmp_path / "charts" / "Chart.yaml").write_text("apiVersion: v2\n")
+
+        rules = _detect(tmp_path)
+        assert rules["generic.conventions.dockerfile"].stats["from_count"] == 1
+        assert rules["generic.conventions.kubernetes"].stats["tools"] == ["Helm"]
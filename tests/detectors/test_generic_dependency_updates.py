@@ -0,0 +1,48 @@
+"""Tests for dependency update automation detector."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from conventions.detectors.base import DetectorContext
+from conventions.detectors.generic.dependency_updates import DependencyUpdatesDetector
+
+
+def _detect(repo: Path):
+    ctx = DetectorContext(repo_root=repo, selected_languages=set(), max_files=100)
+    result = DependencyUpdatesDetector().detect(ctx)
+    return result.rules[0] if result.rules else None
+
+
+class TestDependencyUpdatesDetector:
+    """Tests for DependencyUpdatesDetector."""
+
+    def test_no_tools(self, tmp_path: Path):
+        """Test no rule is produced without update automation."""
+        assert _detect(tmp_path) is None
+
+    def test_dependabot_ecosystems(self, tmp_path: Path):
+        """Test ecosystems are reported in a fixed order as whole words."""
+        (tmp_path / ".github").mkdir()
+        (tmp_path / ".github" / "dependabot.yml").write_text(
+            "version: 2\n"
+            "updates:\n"
+            "  - package-ecosystem: github-actions  # keeps the pipeline current\n"
+            "  - package-ecosystem: npm\n"
+            "  - package-ecosystem: docker\n"
+        )
+
+        rule = _detect(tmp_path)
+        assert rule is not None
+        assert rule.stats["tool_details"]["dependabot"]["ecosystems"] == [
+            "npm", "docker", "github-actions",
+        ]
+
+    def test_renovate_extends(self, tmp_path: Path):
+        """Test Renovate presets and settings are found."""
+        (tmp_path / "renovate.json").write_text(
+            '{"extends": ["config:recommended"], "automerge": true}\n'
+        )
+
+        rule = _detect(tmp_path)
+        assert rule is not None
+        assert rule.stats["tool_details"]["renovate"]["extends"] == ["recommended", "automerge"]
@@ -97,6 +97,19 @@ class TestEnvironmentSetupDetector:
         jwt = next(v for v in vars if v["name"] == "JWT_SECRET")
         assert jwt["has_default"] is False
 
+    def test_env_example_line_forms(self, tmp_path: Path):
+        """Handles CRLF endings, indentation and commented-out assignments."""
+        (tmp_path / ".env.sample").write_text(
+            "# PORT=8080\r\n  DEBUG=true \r\nNOT A VAR\r\nLOG_LEVEL=\r\n", newline=""
+        )
+        ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
+        result = EnvironmentSetupDetector().detect(ctx)
+
+        vars = result.rules[0].stats["env_vars"]
+        assert [v["name"] for v in vars] == ["DEBUG", "LOG_LEVEL"]
+        assert vars[0]["default"] == "true"
+        assert vars[1]["has_default"] is False
+
     def test_detects_docker_compose_services(self, docker_compose_repo: Path):
         """Detects services from docker-compose.yml."""
         ctx = DetectorContext(repo_root=docker_compose_repo, selected_languages=set(), max_files=100)
@@ -115,6 +128,29 @@ class TestEnvironmentSetupDetector:
         pg = next(s for s in services if s["name"] == "postgres")
         assert pg["image"] == "postgres:15"
 
+    def test_compose_services_parsed_as_yaml(self, tmp_path: Path):
+        """Reads flow-style services and keeps unquoted ports as text."""
+        (tmp_path / "compose.yaml").write_text(
+            "services:\n"
+            "    db: {image: mysql:8, ports: [22:22, 3306:3306]}\n"
+            "    worker:\n"
+        )
+        ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
+        result = EnvironmentSetupDetector().detect(ctx)
+
+        services = result.rules[0].stats["services"]
+        assert services == [
+            {"name": "db", "image": "mysql:8", "ports": ["22:22", "3306:3306"]},
+            {"name": "worker", "image": ""},
+        ]
+
+    def test_invalid_compose_file(self, tmp_path: Path):
+        """Emits no services rule for a compose file that isn't valid YAML."""
+        (tmp_path / "docker-compose.yml").write_text("services:\n  web: [unclosed\n")
+        ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
+        result = EnvironmentSetupDetector().detect(ctx)
+        assert result.rules == []
+
     def test_detects_prerequisites(self, prerequisites_repo: Path):
         """Detects runtime version prerequisites."""
         ctx = DetectorContext(repo_root=prerequisites_repo, selected_languages=set(), max_files=100)
@@ -145,8 +181,39 @@ class TestEnvironmentSetupDetector:
         assert len(rules) == 1
         assert len(rules[0].stats["tools"]) == 3
 
+    def test_tool_versions_with_fallbacks(self, tmp_path: Path):
+        """Takes the first version when .tool-versions lists fallbacks."""
+        (tmp_path / ".tool-versions").write_text(
+            "# pinned runtimes\npython 3.12.1 3.11.7 system\n\nnodejs 20.10.0\n"
+        )
+        ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
+        result = EnvironmentSetupDetector().detect(ctx)
+
+        tools = result.rules[0].stats["tools"]
+        assert [(t["name"], t["version"]) for t in tools] == [
+            ("python", "3.12.1"), ("nodejs", "20.10.0"),
+        ]
+
     def test_no_rules_on_empty_repo(self, tmp_path: Path):
         """No rules emitted when no env setup files found."""
         ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
         result = EnvironmentSetupDetector().detect(ctx)
         assert len(result.rules) == 0
+
+
+@pytest.mark.parametrize(
+    ("name", "category"),
+    [
+        ("POSTGRES_PASSWORD", "database"),
+        ("SESSION_SECRET", "auth"),
+        ("AWS_SECRET_ACCESS_KEY", "service"),
+        ("HOSTNAME", "app"),
+        ("FEATURE_FLAGS", "other"),
+    ],
+)
+def test_categorize_var(tmp_path: Path, name: str, category: str):
+    """Test variables are categorized by the first matching prefix."""
+    (tmp_path / ".env.example").write_text(f"{name}=\n")
+    ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
+    rule = EnvironmentSetupDetector().detect(ctx).rules[0]
+    assert rule.stats["env_vars"][0]["category"] == category
@@ -0,0 +1,168 @@
+"""Tests for git conventions detector."""
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import conventions.detectors.generic.git_conventions as git_conventions
+from conventions.detectors.base import DetectorContext
+from conventions.detectors.generic.git_conventions import (
+    GitConventionsDetector,
+    _git_records,
+    _subject,
+)
+
+_SUBJECTS = [
+    "feat(api): add pagination",
+    "fix: handle empty input",
+    "docs: update readme",
+    "Chore!: drop python 3.9",
+    "refactor(core): split module",
+    "test: cover edge cases",
+    "ci: cache dependencies",
+    "\N{PARTY POPPER} new landing page",
+    ":bug: fix crash on start",
+    "ABC-123 wire up billing",
+    "PROJ-7 tidy config",
+    "feat:missing space",
+]
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+
+@pytest.fixture
+def git_repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    for subject in _SUBJECTS:
+        _git(tmp_path, "commit", "--allow-empty", "-m", subject)
+    return tmp_path
+
+
+@pytest.fixture(params=["pygit2", "cli"])
+def git_backend(request, monkeypatch) -> str:
+    """Run a test with history read in-process and through the git CLI."""
+    if request.param == "cli":
+        monkeypatch.setattr(git_conventions, "pygit2", None)
+    elif git_conventions.pygit2 is None:
+        pytest.skip("pygit2 is not installed")
+    return request.param
+
+
+def _rule(repo: Path, rule_id: str):
+    ctx = DetectorContext(repo_root=repo, selected_languages=set(), max_files=100)
+    result = GitConventionsDetector().detect(ctx)
+    return next((r for r in result.rules if r.id == rule_id), None)
+
+
+class TestCommitConventions:
+    """Tests for commit message convention detection."""
+
+    def test_counts_each_style(self, git_repo: Path, git_backend: str):
+        """Counts Conventional Commits, Gitmoji and ticket subjects."""
+        rule = _rule(git_repo, "generic.conventions.commit_messages")
+        assert rule is not None
+        assert rule.stats["total_commits_analyzed"] == len(_SUBJECTS)
+        assert rule.stats["conventional_count"] == 7
+        assert rule.stats["gitmoji_count"] == 2
+        assert rule.stats["ticket_count"] == 2
+        assert rule.stats["convention"] == "conventional"
+
+    def test_too_few_commits(self, tmp_path: Path):
+        """Emits no rule for a short history."""
+        _git(tmp_path, "init")
+        _git(tmp_path, "config", "user.email", "test@example.com")
+        _git(tmp_path, "config", "user.name", "Test")
+        _git(tmp_path, "commit", "--allow-empty", "-m", "feat: first")
+        assert _rule(tmp_path, "generic.conventions.commit_messages") is None
+
+    def test_unborn_head(self, tmp_path: Path, git_backend: str):
+        """Emits no rule for a repository without commits."""
+        _git(tmp_path, "init")
+        assert _rule(tmp_path, "generic.conventions.commit_messages") is None
+
+    def test_not_a_git_repo(self, tmp_path: Path, monkeypatch):
+        """Emits no rule and doesn't run git outside a git repository."""
+        def fail(*args, **kwargs):
+            raise AssertionError("git should not run")
+
+        monkeypatch.setattr(subprocess, "Popen", fail)
+        assert _rule(tmp_path, "generic.conventions.commit_messages") is None
+
+
+class TestBranchConventions:
+    """Tests for branch naming convention detection."""
+
+    def test_gitflow_branches(self, git_repo: Path, git_backend: str):
+        """Counts remote branches with GitFlow prefixes."""
+        for branch in ("main", "feature/login", "hotfix/crash", "release/1.2", "spike-cache"):
+            _git(git_repo, "update-ref", f"refs/remotes/origin/{branch}", "HEAD")
+
+        rule = _rule(git_repo, "generic.conventions.branch_naming")
+        assert rule is not None
+        assert rule.stats["strategy"] == "gitflow"
+        assert rule.stats["total_branches"] == 5
+        assert rule.stats["gitflow_branches"] == 3
+
+
+class TestGitHooks:
+    """Tests for Git hooks detection."""
+
+    def test_pre_commit_hook_kinds(self, tmp_path: Path):
+        """Reports the kinds of hooks configured in a fixed order."""
+        (tmp_path / ".pre-commit-config.yaml").write_text(
+            "repos:\n"
+            "  - repo: https://github.com/gitleaks/gitleaks\n"
+            "    hooks: [{id: gitleaks}]\n"
+            "  - repo: https://github.com/astral-sh/ruff-pre-commit\n"
+            "    hooks: [{id: ruff}, {id: ruff-format}]\n"
+            "  - repo: https://github.com/pre-commit/pre-commit-hooks\n"
+            "    hooks: [{id: trailing-whitespace}, {id: check-json}]\n"
+        )
+
+        rule = _rule(tmp_path, "generic.conventions.git_hooks")
+        assert rule is not None
+        assert rule.stats["hooks_configured"] == [
+            "whitespace", "file validation", "formatting", "secrets detection",
+        ]
+
+
+@pytest.mark.parametrize(
+    ("message", "subject"),
+    [
+        (b"feat: add login\n\nLonger body.\n", b"feat: add login"),
+        (b"\n\nwrapped  \nsubject\r\n \nbody", b"wrapped subject"),
+        (b"no newline", b"no newline"),
+        (b"", b""),
+    ],
+)
+def test_subject(message: bytes, subject: bytes):
+    """Test the subject is the first paragraph joined like git log's %s."""
+    assert _subject(message) == subject
+
+
+class TestGitRecords:
+    """Tests for _git_records."""
+
+    def test_yields_records(self, git_repo: Path):
+        """Yields one record per commit, without separators."""
+        records = list(_git_records(git_repo, "log", "-z", "-3", "--format=%s", sep=b"\0"))
+        assert records == [subject.encode() for subject in reversed(_SUBJECTS[-3:])]
+
+    def test_records_span_chunks(self, git_repo: Path, monkeypatch):
+        """Joins records split across reads."""
+        import conventions.detectors.generic.git_conventions as git_conventions
+
+        monkeypatch.setattr(git_conventions, "_GIT_CHUNK_SIZE", 3)
+        records = list(_git_records(git_repo, "log", "--format=%s"))
+        assert records == [subject.encode() for subject in reversed(_SUBJECTS)]
+
+    def test_failure_raises(self, tmp_path: Path):
+        """Raises CalledProcessError when git fails."""
+        with pytest.raises(subprocess.CalledProcessError):
+            list(_git_records(tmp_path, "log"))
@@ -157,6 +157,21 @@ class TestTaskRunnerDetector:
         assert "test" in names
         assert "lint" in names
 
+    def test_skips_assignments_and_internal_targets(self, tmp_path: Path):
+        """Skips variable assignments, settings and internal targets."""
+        (tmp_path / "Makefile").write_text(
+            "CC := gcc\n_internal:\n\ttrue\n.PHONY: build\nbuild:\n\t$(CC) main.c\n"
+        )
+        (tmp_path / "justfile").write_text(
+            'set shell := ["bash", "-c"]\nversion := "1.0"\nexport FOO := "x"\n'
+            "\n# Run tests\ntest *args:\n  cargo test {{args}}\n"
+        )
+
+        ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
+        targets = TaskRunnerDetector().detect(ctx).rules[0].stats["targets"]
+        assert [t["name"] for t in targets["makefile"]] == ["build"]
+        assert targets["justfile"] == [{"name": "test", "description": "Run tests"}]
+
     def test_detects_multiple_runners(self, tmp_path: Path):
         """Detects multiple task runners in same repo."""
         (tmp_path / "Makefile").write_text("build:\n\tmake\n")
@@ -170,6 +185,17 @@ class TestTaskRunnerDetector:
         assert len(rules[0].stats["runners_found"]) == 2
         assert rules[0].stats["total_targets"] == 2
 
+    def test_primary_runner_priority(self, tmp_path: Path):
+        """Picks the primary runner by priority, not by name."""
+        (tmp_path / "justfile").write_text("test:\n    pytest\n")
+        (tmp_path / "package.json").write_text('{"scripts": {"dev": "vite"}}')
+
+        ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
+        rule = TaskRunnerDetector().detect(ctx).rules[0]
+        assert rule.stats["runners_found"] == ["justfile", "package_json"]
+        assert rule.stats["primary_runner"] == "justfile"
+        assert rule.description.startswith("Task runners detected: justfile, package.json scripts.")
+
     def test_no_rules_on_empty_repo(self, tmp_path: Path):
         """No rules emitted when no task runners found."""
         ctx = DetectorContext(repo_root=tmp_path, selected_languages=set(), max_files=100)
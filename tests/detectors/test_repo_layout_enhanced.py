@@ -167,6 +167,24 @@ class TestEnhancedRepoLayout:
         assert len(rules) == 1
         assert rules[0].stats["project_description"] == "A library for data processing"
 
+    def test_project_description_from_package_table(self, tmp_path: Path):
+        """Takes the description from Cargo's [package] table, not other tables."""
+        (tmp_path / "Cargo.toml").write_text(
+            '[[bin]]\nname = "cli"\ndescription = "Command line entry point"\n\n'
+            '[package]\nname = "engine"\ndescription = "Fast query engine"\n'
+        )
+        (tmp_path / "src").mkdir()
+
+        ctx = DetectorContext(
+            repo_root=tmp_path,
+            selected_languages=set(),
+            max_files=100,
+        )
+        result = GenericRepoLayoutDetector().detect(ctx)
+
+        rules = [r for r in result.rules if r.id == "generic.conventions.repo_layout"]
+        assert rules[0].stats["project_description"] == "Fast query engine"
+
     def test_depth_limit(self, tmp_path: Path):
         """Recursion stops at max_depth (3 levels from root)."""
         (tmp_path / "src").mkdir()
@@ -187,3 +205,21 @@ class TestEnhancedRepoLayout:
         assert "b" in tree["src"]["children"]["a"]["children"]
         # b -> c (depth 4) should be empty
         assert tree["src"]["children"]["a"]["children"]["b"]["children"] == {}
+
+    def test_children_sorted_without_files_or_hidden_dirs(self, tmp_path: Path):
+        """Lists subdirectories by name, leaving out files and hidden directories."""
+        src = tmp_path / "src"
+        for name in ("zeta", "Beta", "alpha", ".cache-dir"):
+            (src / name).mkdir(parents=True)
+        (src / "main.py").write_text("")
+
+        ctx = DetectorContext(
+            repo_root=tmp_path,
+            selected_languages=set(),
+            max_files=100,
+        )
+        result = GenericRepoLayoutDetector().detect(ctx)
+
+        rules = [r for r in result.rules if r.id == "generic.conventions.repo_layout"]
+        tree = rules[0].stats["directory_tree"]
+        assert list(tree["src"]["children"]) == ["Beta", "alpha", "zeta"]
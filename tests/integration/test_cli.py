@@ -275,6 +275,19 @@ class TestShowCommand:
         assert result.exit_code == 1
         assert "No conventions file found" in result.output
 
+    def test_show_invalid_file(self, python_repo: Path):
+        """Test show command with a corrupt conventions file."""
+        conventions_dir = python_repo / ".conventions"
+        conventions_dir.mkdir(exist_ok=True)
+        (conventions_dir / "conventions.raw.json").write_text("{not json")
+
+        result = runner.invoke(app, [
+            "show",
+            "--repo", str(python_repo),
+        ])
+        assert result.exit_code == 1
+        assert "Error reading conventions file" in result.output
+
 
 class TestOutputFormats:
     """Tests for output format options."""
@@ -0,0 +1,334 @@
+"""Tests for the incremental scanning cache."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from conventions.cache import CacheManager
+from conventions.schemas import ConventionRule, ConventionsOutput, EvidenceSnippet, RepoMetadata
+
+CONFIG_HASHES = {"scan": "scan-hash", "detectors": "detectors-hash", "output": "output-hash"}
+
+
+def _make_rule(rule_id: str, *files: str) -> ConventionRule:
+    return ConventionRule(
+        id=rule_id,
+        category="test",
+        title=rule_id,
+        description="Test rule",
+        confidence=0.9,
+        evidence=[
+            EvidenceSnippet(file_path=f, line_start=1, line_end=1, excerpt="x = 1")
+            for f in files
+        ],
+    )
+
+
+def _make_output(repo: Path, rules: list[ConventionRule] | None = None) -> ConventionsOutput:
+    return ConventionsOutput(
+        metadata=RepoMetadata(path=str(repo), detected_languages=["python"]),
+        rules=rules or [],
+    )
+
+
+class TestGetChangedFiles:
+    """Tests for CacheManager.get_changed_files."""
+
+    def test_no_cache_reports_all_changed(self, tmp_path: Path):
+        """Without a cache every file is considered changed."""
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        manager = CacheManager(tmp_path)
+
+        changed, unchanged = manager.get_changed_files([f], CONFIG_HASHES)
+        assert changed == [f]
+        assert unchanged == []
+
+    def test_unchanged_file(self, tmp_path: Path):
+        """Files with matching stat are reported unchanged."""
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        manager = CacheManager(tmp_path)
+        manager.update_cache(_make_output(tmp_path), [f], CONFIG_HASHES)
+
+        changed, unchanged = manager.get_changed_files([f], CONFIG_HASHES)
+        assert changed == []
+        assert unchanged == ["a.py"]
+
+    def test_stat_match_skips_hashing(self, tmp_path: Path, monkeypatch):
+        """The content hash is not computed when size and mtime match."""
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        manager = CacheManager(tmp_path)
+        manager.update_cache(_make_output(tmp_path), [f], CONFIG_HASHES)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file should not be hashed")
+
+        monkeypatch.setattr(manager, "compute_file_hash", fail)
+        changed, unchanged = manager.get_changed_files([f], CONFIG_HASHES)
+        assert unchanged == ["a.py"]
+
+    def test_touched_file_with_same_content(self, tmp_path: Path):
+        """A new mtime with identical content falls back to the hash."""
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        manager = CacheManager(tmp_path)
+        manager.update_cache(_make_output(tmp_path), [f], CONFIG_HASHES)
+
+        st = f.stat()
+        os.utime(f, (st.st_atime, st.st_mtime + 10))
+
+        changed, unchanged = manager.get_changed_files([f], CONFIG_HASHES)
+        assert changed == []
+        assert unchanged == ["a.py"]
+
+    def test_modified_file(self, tmp_path: Path):
+        """Files with different content are reported changed."""
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        manager = CacheManager(tmp_path)
+        manager.update_cache(_make_output(tmp_path), [f], CONFIG_HASHES)
+
+        f.write_text("x = 22\n")
+
+        changed, unchanged = manager.get_changed_files([f], CONFIG_HASHES)
+        assert changed == [f]
+        assert unchanged == []
+
+    def test_new_file(self, tmp_path: Path):
+        """Files missing from the cache are reported changed, in input order."""
+        a = tmp_path / "a.py"
+        a.write_text("x = 1\n")
+        manager = CacheManager(tmp_path)
+        manager.update_cache(_make_output(tmp_path), [a], CONFIG_HASHES)
+
+        c = tmp_path / "c.py"
+        c.write_text("z = 1\n")
+        b = tmp_path / "b.py"
+        b.write_text("y = 1\n")
+
+        changed, unchanged = manager.get_changed_files([c, a, b], CONFIG_HASHES)
+        assert changed == [c, b]
+        assert unchanged == ["a.py"]
+
+    def test_file_outside_repo_is_changed(self, tmp_path: Path):
+        """Files outside the repo root cannot be cached and are rescanned."""
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        inside = repo / "a.py"
+        inside.write_text("x = 1\n")
+        outside = tmp_path / "repo_other.py"
+        outside.write_text("y = 1\n")
+        manager = CacheManager(repo)
+        manager.update_cache(_make_output(repo), [inside], CONFIG_HASHES)
+
+        changed, unchanged = manager.get_changed_files([inside, outside], CONFIG_HASHES)
+        assert changed == [outside]
+        assert unchanged == ["a.py"]
+
+    def test_config_change_reports_all_changed(self, tmp_path: Path):
+        """A different config hash invalidates the cache."""
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        manager = CacheManager(tmp_path)
+        manager.update_cache(_make_output(tmp_path), [f], CONFIG_HASHES)
+
+        changed, unchanged = manager.get_changed_files(
+            [f], {**CONFIG_HASHES, "detectors": "other"}
+        )
+        assert changed == [f]
+        assert unchanged == []
+
+    def test_output_config_change_keeps_cache(self, tmp_path: Path):
+        """Changing output-only settings does not invalidate the cache."""
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        manager = CacheManager(tmp_path)
+        manager.update_cache(_make_output(tmp_path), [f], CONFIG_HASHES)
+
+        changed, unchanged = manager.get_changed_files(
+            [f], {**CONFIG_HASHES, "output": "other"}
+        )
+        assert changed == []
+        assert unchanged == ["a.py"]
+
+
+class TestComputeFileHash:
+    """Tests for CacheManager.compute_file_hash."""
+
+    def test_matches_digest_of_content(self, tmp_path: Path):
+        """Chunked hashing produces the same digest as hashing the whole file."""
+        import hashlib
+
+        content = b"abc" * 100_000
+        f = tmp_path / "big.bin"
+        f.write_bytes(content)
+
+        file_hash = CacheManager(tmp_path).compute_file_hash(f)
+        assert file_hash is not None
+        assert file_hash.path == "big.bin"
+        assert file_hash.size == len(content)
+        assert file_hash.content_hash == hashlib.blake2b(content, digest_size=32).hexdigest()
+
+    def test_large_file_matches_digest(self, tmp_path: Path):
+        """Memory-mapped hashing of large files gives the same digest."""
+        import hashlib
+
+        from conventions.cache import MMAP_THRESHOLD
+
+        content = b"0123456789abcdef" * (MMAP_THRESHOLD // 8)
+        f = tmp_path / "large.bin"
+        f.write_bytes(content)
+
+        file_hash = CacheManager(tmp_path).compute_file_hash(f)
+        assert file_hash is not None
+        assert file_hash.content_hash == hashlib.blake2b(content, digest_size=32).hexdigest()
+
+    def test_missing_file(self, tmp_path: Path):
+        """Unreadable files return None."""
+        assert CacheManager(tmp_path).compute_file_hash(tmp_path / "nope.py") is None
+
+
+class TestUpdateCache:
+    """Tests for CacheManager.update_cache."""
+
+    def test_hashes_all_files(self, tmp_path: Path):
+        """Every readable file is recorded in the cache."""
+        files = []
+        for i in range(10):
+            f = tmp_path / f"mod_{i}.py"
+            f.write_text(f"x = {i}\n")
+            files.append(f)
+        manager = CacheManager(tmp_path)
+        manager.update_cache(_make_output(tmp_path), files + [tmp_path / "gone.py"], CONFIG_HASHES)
+
+        cache = manager.load_cache()
+        assert cache is not None
+        assert set(cache.file_hashes) == {f"mod_{i}.py" for i in range(10)}
+        assert cache.file_hashes["mod_3.py"].size == len("x = 3\n")
+
+
+class TestGetCachedRules:
+    """Tests for CacheManager.get_cached_rules_for_files."""
+
+    def test_rules_stored_once(self, tmp_path: Path):
+        """Rules are stored once and referenced by ID from each file."""
+        rules = [
+            _make_rule("test.shared", "a.py", "b.py", "a.py"),
+            _make_rule("test.only_b", "b.py"),
+            _make_rule("test.global"),
+        ]
+        manager = CacheManager(tmp_path)
+        manager.update_cache(_make_output(tmp_path, rules), [], CONFIG_HASHES)
+
+        cache = manager.load_cache()
+        assert set(cache.rules) == {"test.shared", "test.only_b", "test.global"}
+        assert cache.rules_by_file == {
+            "a.py": ["test.shared"],
+            "b.py": ["test.shared", "test.only_b"],
+        }
+        assert cache.global_rules == ["test.global"]
+
+    def test_rules_for_unchanged_files(self, tmp_path: Path):
+        """Cached rules are returned once per rule for the given files."""
+        rules = [
+            _make_rule("test.shared", "a.py", "b.py"),
+            _make_rule("test.only_b", "b.py"),
+            _make_rule("test.only_c", "c.py"),
+        ]
+        manager = CacheManager(tmp_path)
+        manager.update_cache(_make_output(tmp_path, rules), [], CONFIG_HASHES)
+
+        cached = CacheManager(tmp_path).get_cached_rules_for_files(["a.py", "b.py"])
+        assert [r.id for r in cached] == ["test.shared", "test.only_b"]
+        assert cached[0] == rules[0]
+
+
+class TestSaveLoadCache:
+    """Tests for cache persistence."""
+
+    def test_round_trip(self, tmp_path: Path):
+        """A saved cache loads back with the same contents."""
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        manager = CacheManager(tmp_path)
+        manager.update_cache(_make_output(tmp_path), [f], CONFIG_HASHES)
+
+        loaded = CacheManager(tmp_path).load_cache()
+        assert loaded is not None
+        assert loaded.config_hashes == CONFIG_HASHES
+        assert loaded.file_hashes == manager.load_cache().file_hashes
+
+    def test_cache_file_is_compact(self, tmp_path: Path):
+        """The cache file is written without pretty-printing."""
+        f = tmp_path / "a.py"
+        f.write_text("x = 1\n")
+        manager = CacheManager(tmp_path)
+        manager.update_cache(_make_output(tmp_path), [f], CONFIG_HASHES)
+
+        text = manager.cache_path.read_text()
+        assert "\n" not in text
+        assert ": " not in text
+
+    def test_save_leaves_no_temp_file(self, tmp_path: Path):
+        """Saving replaces the cache file atomically via a temp sibling."""
+        manager = CacheManager(tmp_path)
+        manager.update_cache(_make_output(tmp_path), [], CONFIG_HASHES)
+        manager.update_cache(_make_output(tmp_path), [], CONFIG_HASHES)
+
+        assert [p.name for p in manager.cache_dir.iterdir()] == [".cache.json"]
+
+    def test_corrupt_cache_is_ignored(self, tmp_path: Path):
+        """An unreadable cache file is treated as missing."""
+        manager = CacheManager(tmp_path)
+        manager.cache_dir.mkdir()
+        manager.cache_path.write_text("{not json")
+        assert manager.load_cache() is None
+
+
+class TestComputeConfigHash:
+    """Tests for CacheManager.compute_config_hash."""
+
+    def test_key_order_independent(self, tmp_path: Path):
+        """Equal configs hash the same regardless of key order."""
+        manager = CacheManager(tmp_path)
+        a = manager.compute_config_hash({"max_files": 10, "languages": ["python"]})
+        b = manager.compute_config_hash({"languages": ["python"], "max_files": 10})
+        assert a == b
+
+    def test_different_configs(self, tmp_path: Path):
+        """Different configs produce different hashes."""
+        manager = CacheManager(tmp_path)
+        assert manager.compute_config_hash({"max_files": 10}) != manager.compute_config_hash(
+            {"max_files": 20}
+        )
+
+    def test_scoped_hashes(self, tmp_path: Path):
+        """Each scope only changes when its own keys change."""
+        manager = CacheManager(tmp_path)
+        base = manager.compute_config_hashes({"max_files": 10, "min_score": 3.0})
+        changed = manager.compute_config_hashes({"max_files": 10, "min_score": 4.0})
+        assert base["scan"] == changed["scan"]
+        assert base["detectors"] == changed["detectors"]
+        assert base["output"] != changed["output"]
+
+    def test_unknown_keys_in_scan_scope(self, tmp_path: Path):
+        """Keys not assigned to a scope count as scan settings."""
+        manager = CacheManager(tmp_path)
+        a = manager.compute_config_hash({"new_setting": 1}, "scan")
+        b = manager.compute_config_hash({"new_setting": 2}, "scan")
+        assert a != b
+
+
+class TestMergeResults:
+    """Tests for CacheManager.merge_results."""
+
+    def test_new_rules_take_precedence(self, tmp_path: Path):
+        """New rules replace cached rules with the same ID."""
+        new = [_make_rule("test.a", "new.py"), _make_rule("test.b")]
+        cached = [_make_rule("test.a", "old.py"), _make_rule("test.c")]
+
+        merged = CacheManager(tmp_path).merge_results(new, cached)
+        assert [r.id for r in merged] == ["test.a", "test.b", "test.c"]
+        assert merged[0].evidence[0].file_path == "new.py"
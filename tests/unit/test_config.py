@@ -63,6 +63,18 @@ class TestConventionsConfig:
         assert config.languages is None
         assert config.max_files == 2000
 
+    def test_from_dict_ignores_unknown_keys(self):
+        """Test keys that are not config fields are ignored."""
+        config = ConventionsConfig.from_dict({"max_files": 10, "unknown": True})
+        assert config.max_files == 10
+
+    def test_default_output_formats_not_shared(self):
+        """Test each config gets its own default output_formats list."""
+        a = ConventionsConfig()
+        b = ConventionsConfig()
+        assert a.output_formats == b.output_formats
+        assert a.output_formats is not b.output_formats
+
     def test_to_dict_minimal(self, default_config: ConventionsConfig):
         """Test converting default config to dict (should be minimal)."""
         data = default_config.to_dict()
@@ -77,6 +89,10 @@ class TestConventionsConfig:
         assert "python_graphql" in data["disabled_detectors"]
         assert data["min_score"] == 3.5
 
+    def test_to_dict_round_trip(self, custom_config: ConventionsConfig):
+        """Test from_dict restores a config from its to_dict output."""
+        assert ConventionsConfig.from_dict(custom_config.to_dict()) == custom_config
+
     def test_merge_configs(self, default_config: ConventionsConfig, custom_config: ConventionsConfig):
         """Test merging two configurations."""
         merged = default_config.merge(custom_config)
@@ -99,6 +115,22 @@ class TestConventionsConfig:
         assert merged.languages == ["python"]
         assert merged.min_score == 3.0
 
+    def test_merge_unions_lists_in_order(self):
+        """Test merged list fields keep first-seen order without duplicates."""
+        base = ConventionsConfig(disabled_rules=["b", "a"], exclude_patterns=["x"])
+        other = ConventionsConfig(disabled_rules=["a", "c"])
+        merged = base.merge(other)
+        assert merged.disabled_rules == ["b", "a", "c"]
+        assert merged.exclude_patterns == ["x"]
+        assert merged.exclude_patterns is not base.exclude_patterns
+
+    def test_config_is_frozen(self, default_config: ConventionsConfig):
+        """Test config fields cannot be reassigned."""
+        import dataclasses
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            default_config.max_files = 10  # type: ignore[misc]
+
 
 class TestFindConfigFile:
     """Tests for finding configuration files."""
@@ -167,6 +199,49 @@ class TestLoadConfig:
         with pytest.raises(ValueError, match="Invalid JSON"):
             load_config(tmp_path, config_path)
 
+    def test_load_reuses_parsed_config(self, tmp_path: Path, monkeypatch):
+        """Test an unchanged config file is not parsed again."""
+        config_path = tmp_path / ".conventionsrc.json"
+        config_path.write_text('{"max_files": 123}')
+        first = load_config(tmp_path, config_path)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("config should not be re-parsed")
+
+        monkeypatch.setattr(ConventionsConfig, "from_dict", fail)
+        second = load_config(tmp_path, config_path)
+        assert second == first
+        assert second is not first
+
+    def test_load_sees_edits(self, tmp_path: Path):
+        """Test editing the config file invalidates the cached parse."""
+        config_path = tmp_path / ".conventionsrc.json"
+        config_path.write_text('{"max_files": 123}')
+        assert load_config(tmp_path, config_path).max_files == 123
+
+        config_path.write_text('{"max_files": 4567}')
+        assert load_config(tmp_path, config_path).max_files == 4567
+
+    def test_cached_config_is_not_shared(self, tmp_path: Path):
+        """Test mutating a loaded config does not affect later loads."""
+        config_path = tmp_path / ".conventionsrc.json"
+        config_path.write_text('{"disabled_rules": ["a"]}')
+        load_config(tmp_path, config_path).disabled_rules.append("b")
+        assert load_config(tmp_path, config_path).disabled_rules == ["a"]
+
+    def test_load_without_orjson(self, tmp_path: Path, monkeypatch):
+        """Test loading falls back to the json module when orjson is missing."""
+        import conventions.config as config_module
+
+        monkeypatch.setattr(config_module, "orjson", None)
+        config_path = tmp_path / ".conventionsrc.json"
+        config_path.write_text('{"max_files": 321}')
+        assert load_config(tmp_path, config_path).max_files == 321
+
+        config_path.write_text("not valid json")
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            load_config(tmp_path, config_path)
+
     def test_load_missing_file(self, tmp_path: Path):
         """Test loading non-existent explicit file raises FileNotFoundError."""
         missing_path = tmp_path / "missing.json"
@@ -196,3 +271,13 @@ class TestSaveConfig:
         content = json.loads(config_path.read_text())
         # Default config should produce empty or minimal dict
         assert content == {}
+
+    def test_save_without_orjson(self, tmp_path: Path, custom_config: ConventionsConfig, monkeypatch):
+        """Test saving falls back to the json module when orjson is missing."""
+        import conventions.config as config_module
+
+        monkeypatch.setattr(config_module, "orjson", None)
+        config_path = tmp_path / "test_config.json"
+        save_config(custom_config, config_path)
+
+        assert json.loads(config_path.read_text()) == custom_config.to_dict()
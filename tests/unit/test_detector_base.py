@@ -0,0 +1,186 @@
+"""Tests for detector base classes."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from conventions.detectors.base import BaseDetector, DetectorContext, DetectorResult
+
+
+class _Detector(BaseDetector):
+    name = "test_detector"
+
+    def detect(self, ctx: DetectorContext) -> DetectorResult:
+        return DetectorResult()
+
+
+@pytest.fixture
+def ctx(tmp_path: Path) -> DetectorContext:
+    return DetectorContext(repo_root=tmp_path, selected_languages=set())
+
+
+@pytest.fixture
+def source_file(tmp_path: Path) -> Path:
+    path = tmp_path / "src" / "module.py"
+    path.parent.mkdir()
+    path.write_text("".join(f"line {i}\n" for i in range(1, 21)))
+    return path
+
+
+class TestMakeEvidence:
+    """Tests for BaseDetector.make_evidence."""
+
+    def test_window_in_middle(self, ctx: DetectorContext, source_file: Path):
+        """Test the excerpt covers radius lines around the target."""
+        evidence = _Detector().make_evidence(ctx, source_file, 10, radius=2)
+        assert evidence is not None
+        assert evidence.file_path == "src/module.py"
+        assert (evidence.line_start, evidence.line_end) == (8, 12)
+        assert evidence.excerpt == "line 8\nline 9\nline 10\nline 11\nline 12"
+
+    def test_window_clamped_to_file(self, ctx: DetectorContext, source_file: Path):
+        """Test the window is clamped at the start and end of the file."""
+        detector = _Detector()
+        first = detector.make_evidence(ctx, source_file, 1, radius=3)
+        last = detector.make_evidence(ctx, source_file, 20, radius=3)
+        assert (first.line_start, first.line_end) == (1, 4)
+        assert (last.line_start, last.line_end) == (17, 20)
+        assert last.excerpt.endswith("line 20")
+
+    def test_line_out_of_range(self, ctx: DetectorContext, source_file: Path):
+        """Test lines outside the file produce no evidence."""
+        detector = _Detector()
+        assert detector.make_evidence(ctx, source_file, 0) is None
+        assert detector.make_evidence(ctx, source_file, 21) is None
+        assert detector.make_evidence(ctx, source_file, 100) is None
+
+    def test_file_without_trailing_newline(self, ctx: DetectorContext, tmp_path: Path):
+        """Test the last line is found when the file lacks a final newline."""
+        path = tmp_path / "short.py"
+        path.write_text("a = 1\r\nb = 2")
+        evidence = _Detector().make_evidence(ctx, path, 2, radius=5)
+        assert evidence is not None
+        assert (evidence.line_start, evidence.line_end) == (1, 2)
+        assert evidence.excerpt == "a = 1\nb = 2"
+
+
+class TestReadFile:
+    """Tests for DetectorContext.read_file."""
+
+    def test_reuses_contents(self, ctx: DetectorContext, source_file: Path, monkeypatch):
+        """Test repeated reads of an unchanged file are served from memory."""
+        import conventions.fs as fs
+
+        first = ctx.read_file(source_file)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file should not be read again")
+
+        monkeypatch.setattr(fs, "read_file_safe", fail)
+        assert ctx.read_file(source_file) == first
+
+    def test_sees_edits(self, ctx: DetectorContext, source_file: Path):
+        """Test a modified file is read again."""
+        import os
+
+        assert ctx.read_file(source_file).startswith("line 1\n")
+        source_file.write_text("changed\n")
+        st = source_file.stat()
+        os.utime(source_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert ctx.read_file(source_file) == "changed\n"
+
+    def test_missing_file(self, ctx: DetectorContext, tmp_path: Path):
+        """Test missing files return None."""
+        assert ctx.read_file(tmp_path / "missing.py") is None
+
+    def test_evicts_least_recently_used(self, ctx: DetectorContext, tmp_path: Path, monkeypatch):
+        """Test the cache stays within its size bound."""
+        import conventions.detectors.base as base
+
+        monkeypatch.setattr(base, "FILE_CACHE_MAX_CHARS", 10)
+        a = tmp_path / "a.txt"
+        a.write_text("aaaaaa")
+        b = tmp_path / "b.txt"
+        b.write_text("bbbbbb")
+
+        ctx.read_file(a)
+        ctx.read_file(b)
+        assert [key[0] for key in ctx._file_contents] == [str(b)]
+        assert ctx._file_contents_chars == 6
+
+
+class TestRootListing:
+    """Tests for DetectorContext root listing helpers."""
+
+    def test_root_entries(self, ctx: DetectorContext, tmp_path: Path):
+        """Test files and directories in the repo root are found."""
+        (tmp_path / "Makefile").write_text("all:\n")
+        (tmp_path / ".github").mkdir()
+
+        assert ctx.root_has_file("Makefile")
+        assert not ctx.root_has_dir("Makefile")
+        assert ctx.root_has_dir(".github")
+        assert not ctx.root_has_file(".github")
+        assert not ctx.root_has_file("missing.txt")
+
+    def test_listing_is_cached(self, ctx: DetectorContext, tmp_path: Path):
+        """Test the root is only listed once per context."""
+        assert ctx.get_root_listing() is ctx.get_root_listing()
+
+    def test_missing_root(self, tmp_path: Path):
+        """Test a missing repo root lists as empty."""
+        ctx = DetectorContext(repo_root=tmp_path / "missing", selected_languages=set())
+        assert ctx.get_root_listing() == {}
+
+
+class TestGetCached:
+    """Tests for DetectorContext.get_cached."""
+
+    def test_builds_once_across_threads(self, ctx: DetectorContext):
+        """Test concurrent callers share a single build."""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        builds = []
+        lock = threading.Lock()
+
+        def build() -> object:
+            with lock:
+                builds.append(1)
+            time.sleep(0.05)
+            return object()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            values = list(executor.map(lambda _: ctx.get_cached("index", build), range(8)))
+
+        assert len(builds) == 1
+        assert all(value is values[0] for value in values)
+
+
+class TestGetPackageJson:
+    """Tests for DetectorContext.get_package_json."""
+
+    def test_parsed_once(self, ctx: DetectorContext, tmp_path: Path):
+        """Test the manifest is parsed once and shared."""
+        (tmp_path / "package.json").write_text('{"name": "app", "scripts": {"test": "jest"}}')
+
+        data = ctx.get_package_json()
+        assert data == {"name": "app", "scripts": {"test": "jest"}}
+        assert ctx.get_package_json() is data
+
+    def test_without_orjson(self, ctx: DetectorContext, tmp_path: Path, monkeypatch):
+        """Test the stdlib parser is used when orjson isn't installed."""
+        import conventions.detectors.base as base
+
+        monkeypatch.setattr(base, "orjson", None)
+        (tmp_path / "package.json").write_text('{"workspaces": ["packages/*"]}')
+        assert ctx.get_package_json() == {"workspaces": ["packages/*"]}
+
+    @pytest.mark.parametrize("content", [None, "{not json", "[1, 2]", ""])
+    def test_missing_or_invalid(self, ctx: DetectorContext, tmp_path: Path, content):
+        """Test a missing, invalid or non-object manifest gives None."""
+        if content is not None:
+            (tmp_path / "package.json").write_text(content)
+        assert ctx.get_package_json() is None
@@ -0,0 +1,89 @@
+"""Tests for file system utilities."""
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from conventions.fs import find_files, index_files, walk_files
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "app.py").write_text("x = 1\n")
+    (tmp_path / "README.md").write_text("# Repo\n")
+    (tmp_path / "pkg" / "sub").mkdir(parents=True)
+    (tmp_path / "pkg" / "mod.py").write_text("y = 2\n")
+    (tmp_path / "pkg" / "sub" / "deep.py").write_text("z = 3\n")
+    (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+    (tmp_path / "node_modules" / "lib" / "index.py").write_text("")
+    (tmp_path / "mylib.egg-info").mkdir()
+    (tmp_path / "mylib.egg-info" / "top.py").write_text("")
+    (tmp_path / "generated").mkdir()
+    (tmp_path / "generated" / "out.py").write_text("")
+    (tmp_path / ".gitignore").write_text("generated/\n*.log\n")
+    (tmp_path / "debug.log").write_text("")
+    return tmp_path
+
+
+class TestWalkFiles:
+    """Tests for walk_files."""
+
+    def test_applies_excludes(self, repo: Path):
+        """Test hard excludes, egg-info and gitignore patterns are skipped."""
+        rel = sorted(p.relative_to(repo).as_posix() for p in walk_files(repo, {".py"}))
+        assert rel == ["app.py", "pkg/mod.py", "pkg/sub/deep.py"]
+
+    def test_custom_excludes_and_cap(self, repo: Path):
+        """Test custom exclude patterns and the max_files cap."""
+        files = list(walk_files(repo, {".py"}, exclude_patterns=["pkg/sub/"]))
+        assert repo / "pkg" / "sub" / "deep.py" not in files
+        assert len(list(walk_files(repo, {".py"}, max_files=2))) == 2
+        assert list(walk_files(repo, {".py"}, max_files=0)) == []
+
+    def test_skips_large_files(self, repo: Path, monkeypatch):
+        """Test files over the size limit are skipped."""
+        import conventions.fs as fs
+
+        monkeypatch.setattr(fs, "MAX_FILE_SIZE_BYTES", 5)
+        assert [p.name for p in walk_files(repo, {".py"})] == []
+
+    def test_does_not_follow_directory_symlinks(self, repo: Path):
+        """Test symlinked directories are not descended into."""
+        os.symlink(repo / "pkg", repo / "link")
+        rel = sorted(p.relative_to(repo).as_posix() for p in walk_files(repo, {".py"}))
+        assert not any(path.startswith("link/") for path in rel)
+
+
+class TestIndexFiles:
+    """Tests for index_files."""
+
+    def test_groups_by_extension(self, repo: Path):
+        """Test files are grouped by lowercase extension and sorted."""
+        index = index_files(repo)
+        assert index[".py"] == sorted([
+            repo / "app.py", repo / "pkg" / "mod.py", repo / "pkg" / "sub" / "deep.py",
+        ])
+        assert index[".md"] == [repo / "README.md"]
+        assert ".log" not in index
+
+
+class TestFindFiles:
+    """Tests for find_files."""
+
+    def test_searches_docs_but_skips_dependencies(self, repo: Path):
+        """Test HARD_EXCLUDES dirs are searched except dependency and gitignored dirs."""
+        (repo / "docs").mkdir()
+        (repo / "docs" / "guide.py").write_text("")
+        rel = [p.relative_to(repo).as_posix() for p in find_files(repo, lambda n: n.endswith(".py"))]
+        assert rel == sorted([
+            "app.py", "docs/guide.py", "mylib.egg-info/top.py", "pkg/mod.py", "pkg/sub/deep.py",
+        ])
+
+    def test_top_dirs_match_gitignore_from_root(self, repo: Path):
+        """Test top_dirs limits the walk and gitignore still applies."""
+        (repo / "pkg" / "generated").mkdir()
+        (repo / "pkg" / "generated" / "gen.py").write_text("")
+        found = find_files(repo, lambda n: n.endswith(".py"), top_dirs=("pkg", "generated"))
+        assert found == [repo / "pkg" / "mod.py", repo / "pkg" / "sub" / "deep.py"]
@@ -0,0 +1,74 @@
+"""Tests for the detector registry."""
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from conventions.detectors.registry import DETECTOR_MANIFEST, load_detector, select_detectors
+
+
+class TestDetectorManifest:
+    """Tests for DETECTOR_MANIFEST."""
+
+    @pytest.mark.parametrize("name", list(DETECTOR_MANIFEST))
+    def test_entry_matches_class(self, name: str):
+        """Test each entry names its class and mirrors its languages."""
+        detector_class = load_detector(name)
+        assert detector_class.name == name
+        assert DETECTOR_MANIFEST[name][2] == frozenset(detector_class.languages)
+
+    def test_run_order_by_language(self):
+        """Test detectors run grouped as go, node, generic, python, rust."""
+        groups = []
+        for name in DETECTOR_MANIFEST:
+            group = name.split("_", 1)[0]
+            if not groups or groups[-1] != group:
+                groups.append(group)
+        assert groups == ["go", "node", "generic", "python", "rust"]
+
+
+class TestSelectDetectors:
+    """Tests for select_detectors."""
+
+    def test_filters_by_language(self):
+        """Test detectors for other languages are left out."""
+        names = select_detectors({"python"})
+        assert "python_typing_conventions" in names
+        assert "generic_ci_cd" in names
+        assert not any(name.startswith(("go_", "node_")) for name in names)
+
+    def test_filters_disabled(self):
+        """Test disabled detectors are left out."""
+        names = select_detectors({"go"}, {"generic_ci_cd", "go_api"})
+        assert "generic_ci_cd" not in names
+        assert "go_api" not in names
+        assert "go_testing" in names
+
+    def test_keeps_manifest_order(self):
+        """Test the selection keeps run order."""
+        names = select_detectors({"go", "node", "python"})
+        order = list(DETECTOR_MANIFEST)
+        assert names == sorted(names, key=order.index)
+
+
+def test_run_imports_only_selected_detectors(tmp_path: Path):
+    """Test scanning a Python-only repo does not import other language detectors."""
+    (tmp_path / "app.py").write_text("x = 1\n")
+    code = (
+        "import sys\n"
+        "from pathlib import Path\n"
+        "from conventions.detectors.orchestrator import run_detectors\n"
+        f"run_detectors(Path({str(tmp_path)!r}))\n"
+        "print(sorted({m.split('.')[2] for m in sys.modules\n"
+        "              if m.startswith('conventions.detectors.') and m.count('.') > 2}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    packages = result.stdout.strip()
+    assert "'python'" in packages
+    assert "'go'" not in packages
+    assert "'node'" not in packages